@@ -5,6 +5,11 @@ import os
 import json
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from dependency_scanner_tool.client import DependencyScannerClient
 
 # Load environment variables
@@ -42,7 +47,8 @@ def main():
         job_id, results = client.scan_repository_and_wait(
             git_url=git_url,
             max_wait=600,  # 10 minutes
-            show_progress=True
+            show_progress=True,
+            use_events=True  # Wake on job updates instead of polling
         )
         
         print("\n" + "=" * 50)
@@ -58,12 +64,16 @@ def main():
         
         # Save results to file
         output_file = "scan_results.json"
-        with open(output_file, 'w') as f:
-            json.dump({
-                "job_id": job_id,
-                "git_url": results.git_url,
-                "dependencies": results.dependencies
-            }, f, indent=2)
+        output = {
+            "job_id": job_id,
+            "git_url": results.git_url,
+            "dependencies": results.dependencies
+        }
+        with open(output_file, 'wb') as f:
+            if orjson is not None:
+                f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+            else:
+                f.write(json.dumps(output, indent=2).encode('utf-8'))
         
         print(f"\n💾 Results saved to: {output_file}")
         print("🎉 Example completed successfully!")
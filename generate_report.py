@@ -4,16 +4,26 @@
 import logging
 import sys
 import os
+import itertools
 import json
 from pathlib import Path
 import argparse
 
+try:
+    import ijson
+except ImportError:
+    # Fall back to loading the whole scan file with the json module
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the json module for serialization
+    orjson = None
+
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
 
-from dependency_scanner_tool.reporters.html_reporter import HTMLReporter
-from dependency_scanner_tool.categorization import DependencyCategorizer
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,6 +32,73 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+def iter_scan_dependencies(json_path):
+    """Yield dependency dicts from a scan results file.
+    
+    Uses ijson when available so the dependency list is never materialized.
+    
+    Args:
+        json_path: Path to the JSON scan results file
+        
+    Yields:
+        Dependency dictionaries from the 'dependencies' section
+    """
+    if ijson is not None:
+        with open(json_path, 'rb') as scan_file:
+            yield from ijson.items(scan_file, 'dependencies.item', use_float=True)
+    else:
+        with open(json_path, 'r', encoding='utf-8') as scan_file:
+            yield from json.load(scan_file).get('dependencies', [])
+
+def iter_scan_sections(json_path):
+    """Yield the top-level (key, value) sections of a scan results file.
+    
+    With ijson only one section is held in memory at a time.
+    
+    Args:
+        json_path: Path to the JSON scan results file
+        
+    Yields:
+        Tuples of section name and parsed section value
+    """
+    if ijson is not None:
+        with open(json_path, 'rb') as scan_file:
+            yield from ijson.kvitems(scan_file, '', use_float=True)
+    else:
+        with open(json_path, 'r', encoding='utf-8') as scan_file:
+            yield from json.load(scan_file).items()
+
+def dumps_indented(value):
+    """Serialize a value as JSON indented by two spaces.
+    
+    Args:
+        value: JSON-serializable value
+        
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(value, indent=2)
+
+def write_json_sections(out, sections):
+    """Write (key, value) sections as a single indented JSON object.
+    
+    Produces the same layout as ``json.dump(..., indent=2)`` without first
+    assembling the whole object in memory.
+    
+    Args:
+        out: Writable text file
+        sections: Iterable of (key, value) pairs
+    """
+    out.write('{')
+    first = True
+    for key, value in sections:
+        body = dumps_indented(value).replace('\n', '\n  ')
+        out.write(f'{"" if first else ","}\n  {json.dumps(key)}: {body}')
+        first = False
+    out.write('}' if first else '\n}')
+
 def main():
     """Main entry point for the report generator."""
     parser = argparse.ArgumentParser(description="Generate HTML report from scan results")
@@ -42,7 +119,7 @@ def main():
         logger.debug("Verbose logging enabled")
     
     json_path = Path(args.json_file)
-    if not json_path.exists():
+    if not json_path.is_file():
         logger.error(f"Error: JSON file not found: {json_path}")
         sys.exit(1)
     
@@ -52,7 +129,7 @@ def main():
     category_config = None
     if args.categories:
         category_path = Path(args.categories)
-        if not category_path.exists():
+        if not category_path.is_file():
             logger.error(f"Categories file not found: {category_path}")
             sys.exit(1)
         
@@ -67,31 +144,26 @@ def main():
                 
                 # Debug: Process the dependencies directly with the categorizer
                 if args.debug:
-                    # Load the scan results
-                    with open(json_path, 'r') as scan_file:
-                        scan_data = json.load(scan_file)
+                    from dependency_scanner_tool.categorization import DependencyCategorizer
                     
                     # Create a categorizer
                     categorizer = DependencyCategorizer(categories_data)
                     
-                    # Convert JSON dependencies to Dependency objects
+                    # Convert JSON dependencies to Dependency objects as they are read
                     from dependency_scanner_tool.scanner import Dependency, DependencyType
-                    dependencies = []
-                    for dep_dict in scan_data.get('dependencies', []):
-                        dep_type = DependencyType.ALLOWED
-                        if dep_dict.get('type') == 'restricted':
-                            dep_type = DependencyType.RESTRICTED
-                        elif dep_dict.get('type') == 'cannot_determine':
-                            dep_type = DependencyType.CANNOT_DETERMINE
-                            
-                        dependencies.append(
-                            Dependency(
-                                name=dep_dict.get('name', ''),
-                                version=dep_dict.get('version'),
-                                source_file=dep_dict.get('source_file'),
-                                dependency_type=dep_type
-                            )
+                    dep_types = {
+                        'restricted': DependencyType.RESTRICTED,
+                        'cannot_determine': DependencyType.UNKNOWN,
+                    }
+                    dependencies = (
+                        Dependency(
+                            name=dep_dict.get('name', ''),
+                            version=dep_dict.get('version'),
+                            source_file=dep_dict.get('source_file'),
+                            dependency_type=dep_types.get(dep_dict.get('type'), DependencyType.ALLOWED)
                         )
+                        for dep_dict in iter_scan_dependencies(json_path)
+                    )
                     
                     # Categorize the dependencies
                     categorized = categorizer.categorize_dependencies(dependencies)
@@ -103,7 +175,7 @@ def main():
                     print("=======================================\n")
                     
                     # Create a new JSON file with categorized dependencies
-                    scan_data['categorized_dependencies'] = {
+                    categorized_data = {
                         category: [
                             {
                                 'name': dep.name,
@@ -114,15 +186,25 @@ def main():
                         ] for category, deps in categorized.items()
                     }
                     
-                    # Write the enhanced JSON file
+                    # Write the enhanced JSON file one top-level section at a time
                     debug_json_path = Path('debug-scan-results.json')
-                    with open(debug_json_path, 'w') as f:
-                        json.dump(scan_data, f, indent=2)
+                    sections = itertools.chain(
+                        (
+                            (key, value) for key, value in iter_scan_sections(json_path)
+                            if key != 'categorized_dependencies'
+                        ),
+                        [('categorized_dependencies', categorized_data)],
+                    )
+                    with open(debug_json_path, 'w', encoding='utf-8') as f:
+                        write_json_sections(f, sections)
                     print(f"Debug JSON file written to {debug_json_path}")
                     
         except Exception as e:
             logger.error(f"Error reading categories file: {e}")
     
+    # Imported here so --help and argument errors don't pay for loading the reporter
+    from dependency_scanner_tool.reporters.html_reporter import HTMLReporter
+    
     # Create the HTML reporter with category config if provided
     reporter = HTMLReporter(output_path=output_path, category_config=category_config)
     
@@ -77,7 +77,8 @@ def main():
         language_detector=language_detector,
         package_manager_detector=package_manager_detector,
         ignore_patterns=args.exclude,
-        api_dependency_classifier=api_classifier
+        api_dependency_classifier=api_classifier,
+        parallel=True
     )
     result = scanner.scan_project(args.project_path)
     
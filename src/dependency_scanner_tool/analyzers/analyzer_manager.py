@@ -1,11 +1,18 @@
 """Manager for source code import analyzers."""
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple, Type
 
-from dependency_scanner_tool.analyzers.base import ImportAnalyzer, ImportAnalyzerRegistry
+from dependency_scanner_tool.analyzers.base import (
+    ImportAnalyzer,
+    ImportAnalyzerRegistry,
+    _overrides_can_analyze,
+)
 from dependency_scanner_tool.exceptions import ParsingError
+from dependency_scanner_tool.result_cache import ResultCache
 from dependency_scanner_tool.scanner import Dependency
 
 # Import all analyzers to register them
@@ -15,16 +22,83 @@ import dependency_scanner_tool.analyzers.python_analyzer  # noqa: F401
 import dependency_scanner_tool.analyzers.java_analyzer  # noqa: F401
 import dependency_scanner_tool.analyzers.scala_analyzer  # noqa: F401
 
+# Name of the on-disk result cache used when DEP_SCANNER_CACHE=1
+ANALYZE_CACHE_NAME = "analyze_cache.db"
+
+# Below this many files the cost of spawning worker processes outweighs the gain
+PARALLEL_THRESHOLD = 50
+
+# Analyzers registered by this package, which is all a pool worker is guaranteed to have
+_DEFAULT_ANALYZERS: Dict[str, Type[ImportAnalyzer]] = ImportAnalyzerRegistry.get_all_analyzers()
+
+# Per-process analyzer manager used by pool workers
+_worker_manager: Optional["AnalyzerManager"] = None
+
+
+def _init_worker() -> None:
+    """Create the analyzer manager for a pool worker process."""
+    global _worker_manager
+    # The parent process owns the result cache; workers only analyze
+    _worker_manager = AnalyzerManager(use_cache=False)
+
+
+def _analyze_one(file_path: Path) -> Tuple[List[Dependency], Optional[str]]:
+    """Analyze a single file inside a pool worker.
+    
+    Args:
+        file_path: Path to the file to analyze
+        
+    Returns:
+        Tuple of the dependencies found and an error message (None on success)
+    """
+    try:
+        return _worker_manager.analyze_file(file_path), None
+    except ParsingError as e:
+        return [], str(e)
+
+
 class AnalyzerManager:
     """Manager for source code import analyzers."""
     
-    def __init__(self):
-        """Initialize the analyzer manager."""
+    # Bump when analyzer output changes so stale result cache entries are ignored
+    CACHE_VERSION = 1
+    
+    def __init__(self, use_cache: bool = True):
+        """Initialize the analyzer manager.
+        
+        Args:
+            use_cache: Whether to use the on-disk result cache when it is
+                enabled through the DEP_SCANNER_CACHE environment variable
+        """
         self.analyzers: Dict[str, ImportAnalyzer] = {}
+        self.cache: Optional[ResultCache] = (
+            ResultCache.from_environment(ANALYZE_CACHE_NAME, str(self.CACHE_VERSION))
+            if use_cache else None
+        )
         
         # Initialize all registered analyzers
         for name, analyzer_class in ImportAnalyzerRegistry.get_all_analyzers().items():
             self.analyzers[name] = analyzer_class()
+        
+        self._class_to_name: Dict[type, str] = {
+            type(analyzer): name for name, analyzer in self.analyzers.items()
+        }
+        
+        # Precompute extension lookups so per-file dispatch is a single dict access.
+        # The first registered analyzer for an extension wins, matching the
+        # registry's iteration order. An analyzer that overrides can_analyze
+        # has to be asked about each file, so it and later analyzers are left
+        # to the registry.
+        self._ext_to_analyzer: Dict[str, ImportAnalyzer] = {}
+        for analyzer in self.analyzers.values():
+            if _overrides_can_analyze(type(analyzer)):
+                break
+            for ext in analyzer.supported_extensions:
+                self._ext_to_analyzer.setdefault(ext.lower(), analyzer)
+        
+        self._supported_extensions: FrozenSet[str] = frozenset(
+            ext for analyzer in self.analyzers.values() for ext in analyzer.supported_extensions
+        )
     
     def get_analyzer_for_file(self, file_path: Path) -> Optional[ImportAnalyzer]:
         """Get an analyzer that can handle the given file.
@@ -35,15 +109,26 @@ class AnalyzerManager:
         Returns:
             Analyzer instance or None if no analyzer can handle the file
         """
+        analyzer = self._ext_to_analyzer.get(file_path.suffix.lower())
+        if analyzer is not None:
+            return analyzer
+        
+        # Fall back to the registry for analyzers that override can_analyze
+        # or were registered after this manager was created
         analyzer_class = ImportAnalyzerRegistry.find_analyzer_for_file(file_path)
-        if analyzer_class:
+        if analyzer_class is None:
+            return None
+        
+        analyzer_name = self._class_to_name.get(analyzer_class)
+        if analyzer_name is None:
             analyzer_name = next(
-                name for name, cls in ImportAnalyzerRegistry.get_all_analyzers().items() 
+                name for name, cls in ImportAnalyzerRegistry.get_all_analyzers().items()
                 if cls == analyzer_class
             )
-            return self.analyzers[analyzer_name]
+            self.analyzers[analyzer_name] = analyzer_class()
+            self._class_to_name[analyzer_class] = analyzer_name
         
-        return None
+        return self.analyzers[analyzer_name]
     
     def analyze_file(self, file_path: Path) -> List[Dependency]:
         """Analyze imports from a file.
@@ -61,42 +146,178 @@ class AnalyzerManager:
         if not analyzer:
             raise ParsingError(file_path, f"No analyzer found for file: {file_path}")
         
-        return analyzer.analyze(file_path)
+        if self.cache is None:
+            return analyzer.analyze(file_path)
+        
+        cache_key = self.cache.key_for(file_path)
+        dependencies = self.cache.get(cache_key)
+        if dependencies is None:
+            dependencies = analyzer.analyze(file_path)
+            self.cache.put(cache_key, dependencies)
+        
+        return dependencies
     
-    def analyze_files(self, file_paths: List[Path]) -> Dict[Path, List[Dependency]]:
+    def analyze_files(
+        self, file_paths: List[Path], parallel: bool = False
+    ) -> Dict[Path, List[Dependency]]:
         """Analyze imports from multiple files.
         
+        With ``parallel=True``, large batches are spread across a process pool
+        when the manager only uses the default analyzers; otherwise files are
+        analyzed sequentially in this process.
+        
         Args:
             file_paths: List of paths to files to analyze
+            parallel: Whether to use a process pool for large batches
             
         Returns:
             Dictionary mapping file paths to lists of dependencies
         """
-        results: Dict[Path, List[Dependency]] = {}
-        errors: List[str] = []
+        return dict(self.iter_analyze_files(file_paths, parallel=parallel))
+    
+    def iter_analyze_files(
+        self,
+        file_paths: List[Path],
+        parallel: bool = False,
+        errors: Optional[List[str]] = None
+    ) -> Iterator[Tuple[Path, List[Dependency]]]:
+        """Analyze imports from multiple files, yielding each result as it is ready.
+        
+        Results are yielded in the order of ``file_paths`` so callers can
+        process and discard them one file at a time. Files that fail to
+        analyze are yielded with an empty dependency list.
+        
+        Args:
+            file_paths: List of paths to files to analyze
+            parallel: Whether to use a process pool for large batches
+            errors: Optional list that receives a message for each file that
+                    could not be analyzed
+            
+        Yields:
+            Tuples of file path and the dependencies found in it
+        """
+        try:
+            done = 0
+            if parallel and len(file_paths) >= PARALLEL_THRESHOLD and self._uses_default_analyzers():
+                try:
+                    for result in self._iter_analyze_files_parallel(file_paths, errors):
+                        done += 1
+                        yield result
+                except (OSError, NotImplementedError) as e:
+                    # Process pools are unavailable on some restricted platforms
+                    logging.warning(
+                        f"Parallel analysis unavailable, falling back to sequential: {e}"
+                    )
+                else:
+                    return
+            
+            yield from self._iter_analyze_files_sequential(file_paths[done:], errors)
+        finally:
+            if self.cache is not None:
+                self.cache.flush()
+    
+    def _uses_default_analyzers(self) -> bool:
+        """Check whether pool workers would analyze files exactly like this manager.
+        
+        Workers build their own default manager, so subclasses and managers
+        with other or late-registered analyzers are kept in this process.
+        
+        Returns:
+            True if files can be sent to a process pool
+        """
+        return (
+            type(self) is AnalyzerManager
+            and ImportAnalyzerRegistry.get_all_analyzers() == _DEFAULT_ANALYZERS
+            and {name: type(analyzer) for name, analyzer in self.analyzers.items()} == _DEFAULT_ANALYZERS
+        )
+    
+    def _iter_analyze_files_sequential(
+        self, file_paths: List[Path], errors: Optional[List[str]] = None
+    ) -> Iterator[Tuple[Path, List[Dependency]]]:
+        """Analyze imports from multiple files in this process.
+        
+        Args:
+            file_paths: List of paths to files to analyze
+            errors: Optional list that receives a message for each failed file
+            
+        Yields:
+            Tuples of file path and the dependencies found in it
+        """
+        error_count = 0
         
         for file_path in file_paths:
             try:
                 dependencies = self.analyze_file(file_path)
-                results[file_path] = dependencies
             except ParsingError as e:
-                logging.warning(f"Error analyzing file {file_path}: {e}")
-                errors.append(str(e))
-                results[file_path] = []
+                # Lazy formatting: nothing is rendered when warnings are filtered out
+                logging.warning("Error analyzing file %s: %s", file_path, e)
+                error_count += 1
+                if errors is not None:
+                    errors.append(f"Error analyzing imports in {file_path}: {e}")
+                dependencies = []
+            yield file_path, dependencies
         
-        if errors:
-            logging.warning(f"Encountered {len(errors)} errors while analyzing files")
+        if error_count:
+            logging.warning("Encountered %d errors while analyzing files", error_count)
+    
+    def _iter_analyze_files_parallel(
+        self, file_paths: List[Path], errors: Optional[List[str]] = None
+    ) -> Iterator[Tuple[Path, List[Dependency]]]:
+        """Analyze imports from multiple files using a process pool.
         
-        return results
+        Args:
+            file_paths: List of paths to files to analyze
+            errors: Optional list that receives a message for each failed file
+            
+        Yields:
+            Tuples of file path and the dependencies found in it
+        """
+        error_count = 0
+        
+        # Serve unchanged files from the cache and only send misses to the pool
+        cached: Dict[Path, List[Dependency]] = {}
+        cache_keys: Dict[Path, Optional[Tuple[str, str]]] = {}
+        pending = file_paths
+        if self.cache is not None:
+            pending = []
+            for file_path in file_paths:
+                cache_key = self.cache.key_for(file_path)
+                dependencies = self.cache.get(cache_key)
+                if dependencies is None:
+                    cache_keys[file_path] = cache_key
+                    pending.append(file_path)
+                else:
+                    cached[file_path] = dependencies
+        
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(pending) // (workers * 4))
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            # executor.map yields in submission order, so cache hits can be
+            # interleaved to keep the caller's ordering
+            outcomes = executor.map(_analyze_one, pending, chunksize=chunksize)
+            for file_path in file_paths:
+                if file_path in cached:
+                    yield file_path, cached[file_path]
+                    continue
+                
+                dependencies, error = next(outcomes)
+                if error is not None:
+                    logging.warning("Error analyzing file %s: %s", file_path, error)
+                    error_count += 1
+                    if errors is not None:
+                        errors.append(f"Error analyzing imports in {file_path}: {error}")
+                elif self.cache is not None:
+                    self.cache.put(cache_keys[file_path], dependencies)
+                yield file_path, dependencies
+        
+        if error_count:
+            logging.warning("Encountered %d errors while analyzing files", error_count)
     
-    def get_supported_extensions(self) -> Set[str]:
+    def get_supported_extensions(self) -> FrozenSet[str]:
         """Get all file extensions supported by registered analyzers.
         
         Returns:
             Set of supported file extensions
         """
-        extensions = set()
-        for analyzer in self.analyzers.values():
-            extensions.update(analyzer.supported_extensions)
-        
-        return extensions
+        return self._supported_extensions
@@ -1,9 +1,10 @@
 """Base analyzer interface for source code import analysis."""
 
+import functools
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Type
+from typing import Dict, List, Optional, Set, Tuple, Type
 
 from dependency_scanner_tool.scanner import Dependency
 
@@ -22,6 +23,7 @@ class ImportAnalyzerRegistry:
             analyzer_class: Analyzer class
         """
         cls._analyzers[analyzer_name] = analyzer_class
+        _find_analyzer_by_suffix.cache_clear()
         logging.debug(f"Registered import analyzer: {analyzer_name}")
     
     @classmethod
@@ -55,11 +57,54 @@ class ImportAnalyzerRegistry:
         Returns:
             Analyzer class or None if no analyzer can handle the file
         """
-        for analyzer_class in cls._analyzers.values():
-            if analyzer_class.can_analyze(file_path):
-                return analyzer_class
+        analyzer_class, custom_analyzers = _find_analyzer_by_suffix(file_path.suffix.lower())
         
-        return None
+        # Analyzers with their own can_analyze win if they were registered first
+        for custom_class in custom_analyzers:
+            if custom_class.can_analyze(file_path):
+                return custom_class
+        
+        return analyzer_class
+
+
+def _overrides_can_analyze(analyzer_class: Type["ImportAnalyzer"]) -> bool:
+    """Check whether an analyzer decides for itself which files it handles.
+    
+    Args:
+        analyzer_class: Analyzer class
+        
+    Returns:
+        True if the class overrides ImportAnalyzer.can_analyze
+    """
+    return analyzer_class.can_analyze.__func__ is not ImportAnalyzer.can_analyze.__func__
+
+
+@functools.lru_cache(maxsize=64)
+def _find_analyzer_by_suffix(
+    suffix: str
+) -> Tuple[Optional[Type["ImportAnalyzer"]], Tuple[Type["ImportAnalyzer"], ...]]:
+    """Find the first registered analyzer for a lowercase file suffix.
+    
+    Analyzers that override can_analyze cannot be matched on the suffix alone,
+    so those registered before the match are returned for the caller to ask.
+    Results are cached per suffix; the cache is cleared whenever an analyzer
+    is registered.
+    
+    Args:
+        suffix: Lowercase file suffix, including the leading dot
+        
+    Returns:
+        Tuple of the analyzer class (None if no analyzer handles the suffix)
+        and the custom analyzers registered before it, in registration order
+    """
+    custom_analyzers = []
+    for analyzer_class in ImportAnalyzerRegistry._analyzers.values():
+        if _overrides_can_analyze(analyzer_class):
+            custom_analyzers.append(analyzer_class)
+        elif suffix in analyzer_class.supported_extensions:
+            return analyzer_class, tuple(custom_analyzers)
+    
+    return None, tuple(custom_analyzers)
 
 
 class ImportAnalyzer(ABC):
@@ -1,12 +1,18 @@
 """Analyzer for Java import statements."""
 
+import logging
+import mmap
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from dependency_scanner_tool.analyzers.base import ImportAnalyzer, ImportAnalyzerRegistry
+from dependency_scanner_tool.normalizers.java_package import PACKAGE_PREFIX_REGEX, PACKAGE_TO_MAVEN_MAPPING
 from dependency_scanner_tool.scanner import Dependency, DependencyType
 
+logger = logging.getLogger(__name__)
+
 
 class JavaImportAnalyzer(ImportAnalyzer):
     """Analyzer for Java import statements.
@@ -29,33 +35,34 @@ class JavaImportAnalyzer(ImportAnalyzer):
     # Define supported file extensions
     supported_extensions: Set[str] = {".java"}
     
-    # Regular expressions for extracting import statements
+    # Regular expressions for extracting import statements, matched against
+    # the raw file bytes
     # Match standard imports: import package.name.Class;
-    IMPORT_REGEX = re.compile(r'import\s+(?!static\s+)([^;]+);')
+    IMPORT_REGEX = re.compile(rb'import\s+(?!static\s+)([^;]+);')
     
     # Match static imports: import static package.name.Class.method;
-    STATIC_IMPORT_REGEX = re.compile(r'import\s+static\s+([^;]+);')
+    STATIC_IMPORT_REGEX = re.compile(rb'import\s+static\s+([^;]+);')
+    
+    # Match comments, string and char literals and the first top-level type declaration.
+    # Imports must precede the declaration, so the class body is never searched.
+    # Comments and literals are matched first so that a declaration-like line
+    # inside them (e.g. in a license header) is skipped; only group 1 is a
+    # real declaration.
+    TYPE_DECLARATION_REGEX = re.compile(
+        rb'/\*.*?(?:\*/|\Z)|//[^\n]*|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\''
+        rb'|^([ \t]*(?:(?:public|protected|private|abstract|final|static|sealed|non-sealed|strictfp)[ \t]+)*'
+        rb'(?:class|interface|enum|record|@interface)[ \t]+\w)',
+        re.MULTILINE | re.DOTALL
+    )
+    
+    # Package to Maven artifact mapping, shared with the Java package normalizer
+    PACKAGE_TO_ARTIFACT_MAPPING: Dict[str, str] = PACKAGE_TO_MAVEN_MAPPING
+    _PREFIX_REGEX = PACKAGE_PREFIX_REGEX
     
-    # Package to Maven artifact mapping
-    # This is a simplified mapping for common Java packages
-    PACKAGE_TO_ARTIFACT_MAPPING: Dict[str, str] = {
-        "org.springframework.boot": "org.springframework.boot:spring-boot",
-        "org.springframework.boot.autoconfigure": "org.springframework.boot:spring-boot-autoconfigure",
-        "org.springframework.web": "org.springframework:spring-web",
-        "org.springframework.data": "org.springframework.data:spring-data-commons",
-        "org.springframework.security": "org.springframework.security:spring-security-core",
-        "com.google.common": "com.google.guava:guava",
-        "com.google.gson": "com.google.code.gson:gson",
-        "com.fasterxml.jackson": "com.fasterxml.jackson.core:jackson-core",
-        "org.apache.commons.lang": "org.apache.commons:commons-lang3",
-        "org.apache.commons.io": "org.apache.commons:commons-io",
-        "org.apache.logging.log4j": "org.apache.logging.log4j:log4j-core",
-        "org.slf4j": "org.slf4j:slf4j-api",
-        "org.junit": "junit:junit",
-        "org.mockito": "org.mockito:mockito-core",
-        "javax.servlet": "javax.servlet:javax.servlet-api",
-        "jakarta.servlet": "jakarta.servlet:jakarta.servlet-api",
-    }
+    # Mapped javax.* packages, which are not part of the standard library
+    _JAVAX_ALLOWED: Tuple[str, ...] = tuple(
+        pkg for pkg in PACKAGE_TO_MAVEN_MAPPING if pkg.startswith("javax.")
+    )
     
     def analyze(self, file_path: Path) -> List[Dependency]:
         """Analyze a Java file for import statements.
@@ -67,46 +74,67 @@ class JavaImportAnalyzer(ImportAnalyzer):
             List of dependencies found in the file
         """
         dependencies = []
+        seen_names: Set[str] = set()
         
         try:
-            # Read the file content
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            
-            # Skip empty files
-            if not content.strip():
-                return []
-            
-            # Extract standard imports
-            for match in self.IMPORT_REGEX.finditer(content):
-                import_path = match.group(1).strip()
-                if self._should_process_import(import_path):
-                    dependency = self._convert_import_to_dependency(import_path, file_path)
-                    if dependency:
-                        dependencies.append(dependency)
+            with open(file_path, "rb") as f:
+                # Skip empty files, which cannot be memory-mapped
+                if os.fstat(f.fileno()).st_size == 0:
+                    return []
+                
+                # Map the file instead of reading and decoding all of it
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    # Bind the shared dependency fields once for the loop below
+                    source_file = str(file_path)
+                    unknown = DependencyType.UNKNOWN
+                    
+                    # Create one dependency per artifact, skipping names already seen
+                    for import_path in self._iter_import_paths(content):
+                        if not self._should_process_import(import_path):
+                            continue
+                        artifact_name = self._resolve_artifact(import_path)
+                        if artifact_name and artifact_name not in seen_names:
+                            seen_names.add(artifact_name)
+                            dependencies.append(
+                                Dependency(
+                                    name=artifact_name,
+                                    version=None,
+                                    source_file=source_file,
+                                    dependency_type=unknown
+                                )
+                            )
             
-            # Extract static imports
-            for match in self.STATIC_IMPORT_REGEX.finditer(content):
-                import_path = match.group(1).strip()
-                # Remove the method name from the import path
-                import_path = import_path.rsplit(".", 1)[0]
-                if self._should_process_import(import_path):
-                    dependency = self._convert_import_to_dependency(import_path, file_path)
-                    if dependency:
-                        dependencies.append(dependency)
-            
-            # Remove duplicates based on dependency name
-            unique_dependencies = {}
-            for dep in dependencies:
-                unique_dependencies[dep.name] = dep
-            
-            return list(unique_dependencies.values())
+            return dependencies
         except Exception as e:
             # Log the error but don't fail the analysis
             # This allows the scanner to continue with other files
-            print(f"Error analyzing Java file {file_path}: {str(e)}")
+            logger.warning("Error analyzing Java file %s: %s", file_path, e)
             return []
     
+    def _iter_import_paths(self, content: bytes) -> Iterator[str]:
+        """Yield the package paths of standard and static imports.
+        
+        Args:
+            content: Java source code as bytes or a memory-mapped file
+            
+        Yields:
+            Import paths in the order they are matched
+        """
+        # Only search up to the first type declaration outside comments and literals
+        end = len(content)
+        for match in self.TYPE_DECLARATION_REGEX.finditer(content):
+            if match.start(1) != -1:
+                end = match.start(1)
+                break
+        
+        # Extract standard imports
+        for match in self.IMPORT_REGEX.finditer(content, 0, end):
+            yield match.group(1).decode("utf-8", "replace").strip()
+        
+        # Extract static imports, removing the method name from the import path
+        for match in self.STATIC_IMPORT_REGEX.finditer(content, 0, end):
+            yield match.group(1).decode("utf-8", "replace").strip().rsplit(".", 1)[0]
+    
     def _should_process_import(self, import_path: str) -> bool:
         """Determine if an import should be processed.
         
@@ -121,10 +149,7 @@ class JavaImportAnalyzer(ImportAnalyzer):
             return False
         
         # Skip javax.* imports that are part of the standard library
-        if import_path.startswith("javax.") and not any(
-            import_path.startswith(pkg) for pkg in self.PACKAGE_TO_ARTIFACT_MAPPING
-            if pkg.startswith("javax.")
-        ):
+        if import_path.startswith("javax.") and not import_path.startswith(self._JAVAX_ALLOWED):
             return False
         
         return True
@@ -141,19 +166,35 @@ class JavaImportAnalyzer(ImportAnalyzer):
         Returns:
             Dependency object or None if the import cannot be mapped
         """
+        artifact_name = self._resolve_artifact(import_path)
+        if artifact_name:
+            return Dependency(
+                name=artifact_name,
+                version=None,
+                source_file=str(file_path),
+                dependency_type=DependencyType.UNKNOWN
+            )
+        
+        return None
+    
+    def _resolve_artifact(self, import_path: str) -> Optional[str]:
+        """Resolve an import path to a Maven artifact name.
+        
+        Args:
+            import_path: Import path to resolve
+            
+        Returns:
+            Artifact name or None if the import cannot be mapped
+        """
         # Handle wildcard imports
         if import_path.endswith(".*"):
             import_path = import_path[:-2]
         
-        # Try to map the import to a Maven artifact
-        artifact_name = None
-        
-        # Find the longest matching package prefix
-        matching_prefix = ""
-        for package_prefix, artifact in self.PACKAGE_TO_ARTIFACT_MAPPING.items():
-            if import_path.startswith(package_prefix) and len(package_prefix) > len(matching_prefix):
-                matching_prefix = package_prefix
-                artifact_name = artifact
+        # Map the longest matching package prefix to a Maven artifact. A prefix
+        # may end part-way through a segment, so "org.apache.commons.lang" also
+        # matches "org.apache.commons.lang3".
+        match = self._PREFIX_REGEX.match(import_path)
+        artifact_name = self.PACKAGE_TO_ARTIFACT_MAPPING[match.group(0)] if match else None
         
         if not artifact_name:
             # If no mapping is found, try to guess the artifact name
@@ -166,15 +207,7 @@ class JavaImportAnalyzer(ImportAnalyzer):
                 artifact_id = parts[2] if len(parts) > 2 else parts[1]
                 artifact_name = f"{group_id}:{artifact_id}"
         
-        if artifact_name:
-            return Dependency(
-                name=artifact_name,
-                version=None,
-                source_file=str(file_path),
-                dependency_type=DependencyType.UNKNOWN
-            )
-        
-        return None
+        return artifact_name
 
 
 # Register the analyzer
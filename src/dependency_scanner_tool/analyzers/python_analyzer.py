@@ -1,56 +1,123 @@
 """Analyzer for Python import statements."""
 
 import ast
+import hashlib
+import io
 import logging
+import re
+import sys
+import textwrap
+import tokenize
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Optional, Set
 
 from dependency_scanner_tool.analyzers.base import ImportAnalyzer, ImportAnalyzerRegistry
 from dependency_scanner_tool.exceptions import ParsingError
+from dependency_scanner_tool.result_cache import DigestCache
 from dependency_scanner_tool.scanner import Dependency, DependencyType
 
 
+# Standard library modules (common ones, not exhaustive)
+STDLIB_MODULES: FrozenSet[str] = frozenset({
+    "abc", "argparse", "asyncio", "collections", "concurrent", "contextlib",
+    "copy", "csv", "datetime", "decimal", "email", "enum", "functools",
+    "glob", "gzip", "hashlib", "http", "importlib", "inspect", "io", "itertools",
+    "json", "logging", "math", "multiprocessing", "os", "pathlib", "pickle",
+    "platform", "queue", "random", "re", "shutil", "signal", "socket",
+    "sqlite3", "statistics", "string", "subprocess", "sys", "tempfile",
+    "threading", "time", "typing", "unittest", "urllib", "uuid", "warnings",
+    "xml", "zipfile"
+})
+
+# Mapping of common package imports to their PyPI package names
+PACKAGE_MAPPING: Dict[str, str] = {
+    "numpy": "numpy",
+    "pandas": "pandas",
+    "matplotlib": "matplotlib",
+    "sklearn": "scikit-learn",
+    "tensorflow": "tensorflow",
+    "torch": "torch",
+    "requests": "requests",
+    "flask": "flask",
+    "django": "django",
+    "sqlalchemy": "sqlalchemy",
+    "pytest": "pytest",
+    "bs4": "beautifulsoup4",
+    "PIL": "pillow",
+    "cv2": "opencv-python",
+    "yaml": "pyyaml",
+    "pydantic": "pydantic",
+    "fastapi": "fastapi",
+    "boto3": "boto3",
+    "click": "click",
+    "tqdm": "tqdm",
+}
+
+
+class _ImportCollector(ast.NodeVisitor):
+    """Collect imported module names from an AST.
+    
+    Imports are statements, so only statement lists are searched. Imports
+    nested in functions, classes and control flow are found without visiting
+    any expression nodes.
+    """
+    
+    # Fields of statement nodes that hold nested statements
+    STATEMENT_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+    
+    def __init__(self):
+        self.imports: Set[str] = set()
+    
+    def visit_Import(self, node: ast.Import) -> None:
+        # Handle 'import x' and 'import x as y'
+        for name in node.names:
+            self.imports.add(name.name)
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        # Handle 'from x import y' and 'from x import y as z'
+        if node.module:
+            self.imports.add(node.module)
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        for field in self.STATEMENT_FIELDS:
+            for child in getattr(node, field, ()):
+                self.visit(child)
+
+
 class PythonImportAnalyzer(ImportAnalyzer):
     """Analyzer for Python import statements."""
     
     # Define supported file extensions
     supported_extensions: Set[str] = {".py"}
     
-    # Standard library modules (common ones, not exhaustive)
-    STDLIB_MODULES = {
-        "abc", "argparse", "asyncio", "collections", "concurrent", "contextlib",
-        "copy", "csv", "datetime", "decimal", "email", "enum", "functools",
-        "glob", "gzip", "hashlib", "http", "importlib", "inspect", "io", "itertools",
-        "json", "logging", "math", "multiprocessing", "os", "pathlib", "pickle",
-        "platform", "queue", "random", "re", "shutil", "signal", "socket",
-        "sqlite3", "statistics", "string", "subprocess", "sys", "tempfile",
-        "threading", "time", "typing", "unittest", "urllib", "uuid", "warnings",
-        "xml", "zipfile"
-    }
-    
-    # Mapping of common package imports to their PyPI package names
-    PACKAGE_MAPPING: Dict[str, str] = {
-        "numpy": "numpy",
-        "pandas": "pandas",
-        "matplotlib": "matplotlib",
-        "sklearn": "scikit-learn",
-        "tensorflow": "tensorflow",
-        "torch": "torch",
-        "requests": "requests",
-        "flask": "flask",
-        "django": "django",
-        "sqlalchemy": "sqlalchemy",
-        "pytest": "pytest",
-        "bs4": "beautifulsoup4",
-        "PIL": "pillow",
-        "cv2": "opencv-python",
-        "yaml": "pyyaml",
-        "pydantic": "pydantic",
-        "fastapi": "fastapi",
-        "boto3": "boto3",
-        "click": "click",
-        "tqdm": "tqdm",
-    }
+    # Regular expression for the fallback import extractor. The 'names' group
+    # matches 'import x', 'import x as y' and 'import x, y' up to a comment or
+    # ';', and the 'module' group matches 'from x import y'.
+    IMPORT_STATEMENT_REGEX = re.compile(
+        r'^[ \t]*(?:import[ \t]+(?P<names>[^\r\n#;]+)|from[ \t]+(?P<module>[\w.]+)[ \t]+import\b)',
+        re.MULTILINE
+    )
+    
+    # Tokens that never start or end a statement in the leading import block
+    IGNORED_TOKENS = frozenset({tokenize.COMMENT, tokenize.NL, tokenize.NEWLINE})
+    
+    # Tokens that end a statement in the leading import block
+    STATEMENT_END_TOKENS = frozenset({tokenize.NEWLINE, tokenize.ENDMARKER})
+    
+    # Match the first non-whitespace character, used to check the indentation of the first line
+    NON_WHITESPACE_REGEX = re.compile(r'\S')
+    
+    # Module-level lookup tables, kept on the class for existing references
+    STDLIB_MODULES = STDLIB_MODULES
+    PACKAGE_MAPPING = PACKAGE_MAPPING
+    
+    # Bump when import extraction changes so stale cache entries are ignored
+    CACHE_VERSION = 1
+    
+    def __init__(self):
+        """Initialize the analyzer."""
+        # On-disk cache of extracted imports, enabled with DEP_SCANNER_CACHE=1
+        self.import_cache = DigestCache.from_environment("imports")
     
     def analyze(self, file_path: Path) -> List[Dependency]:
         """Analyze Python file for import statements.
@@ -68,59 +135,95 @@ class PythonImportAnalyzer(ImportAnalyzer):
             raise ParsingError(file_path, f"File does not exist: {file_path}")
         
         dependencies = []
+        seen_names = set()
         
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
                 
-                # Try to normalize indentation to fix common syntax errors in test files
-                normalized_content = self._normalize_indentation(content)
+                imports = self._extract_imports(file_path, content)
                 
-                # Parse the Python file
-                try:
-                    tree = ast.parse(normalized_content)
-                    
-                    # Extract imports using AST
-                    imports = self._extract_imports_from_ast(tree)
-                except SyntaxError as e:
-                    logging.warning(f"Syntax error in {file_path}: {e}")
-                    
-                    # Fall back to regex-based extraction for files with syntax errors
-                    imports = self._extract_imports_with_regex(content)
+                # Bind the lookup tables and shared dependency fields once for the loop below
+                stdlib = self.STDLIB_MODULES
+                mapping_get = self.PACKAGE_MAPPING.get
+                source_file = str(file_path)
+                unknown = DependencyType.UNKNOWN
                 
                 # Convert imports to dependencies
                 for module_name in imports:
                     # Skip standard library modules
-                    if module_name in self.STDLIB_MODULES:
+                    if module_name in stdlib:
                         continue
                         
                     # Get the top-level package name
                     top_level_package = module_name.split('.')[0]
                     
                     # Map to PyPI package name if known
-                    package_name = self.PACKAGE_MAPPING.get(top_level_package, top_level_package)
+                    package_name = mapping_get(top_level_package, top_level_package)
+                    
+                    # Skip duplicates while preserving order
+                    if package_name in seen_names:
+                        continue
+                    seen_names.add(package_name)
                     
                     dependencies.append(
                         Dependency(
                             name=package_name,
                             version=None,  # We can't determine version from imports
-                            source_file=str(file_path),
-                            dependency_type=DependencyType.UNKNOWN
+                            source_file=source_file,
+                            dependency_type=unknown
                         )
                     )
         except Exception as e:
             raise ParsingError(file_path, f"Error analyzing Python imports: {str(e)}")
         
-        # Remove duplicates while preserving order
-        unique_dependencies = []
-        seen_names = set()
+        return dependencies
+    
+    def _extract_imports(self, file_path: Path, content: str) -> Set[str]:
+        """Extract imported module names, using the import cache when enabled.
         
-        for dep in dependencies:
-            if dep.name not in seen_names:
-                seen_names.add(dep.name)
-                unique_dependencies.append(dep)
+        Args:
+            file_path: Path to the Python file
+            content: Content of the Python file
+            
+        Returns:
+            Set of imported module names
+        """
+        digest = None
+        if self.import_cache is not None:
+            # Key on the source and interpreter version, since ast output can differ between versions
+            hasher = hashlib.sha256(
+                f"{self.CACHE_VERSION}:{sys.version_info[0]}.{sys.version_info[1]}:".encode()
+            )
+            hasher.update(content.encode("utf-8", "surrogatepass"))
+            digest = hasher.hexdigest()
+            
+            imports = self.import_cache.get(digest)
+            if imports is not None:
+                return imports
         
-        return unique_dependencies
+        # Most files import everything at the top, so try the leading import block first
+        imports = self._extract_leading_imports(content)
+        if imports is None:
+            # Try to normalize indentation to fix common syntax errors in test files
+            normalized_content = self._normalize_indentation(content)
+            
+            # Parse the Python file
+            try:
+                tree = ast.parse(normalized_content)
+                
+                # Extract imports using AST
+                imports = self._extract_imports_from_ast(tree)
+            except SyntaxError as e:
+                logging.warning(f"Syntax error in {file_path}: {e}")
+                
+                # Fall back to regex-based extraction for files with syntax errors
+                imports = self._extract_imports_with_regex(content)
+        
+        if digest is not None:
+            self.import_cache.put(digest, imports)
+        
+        return imports
     
     def _extract_imports_from_ast(self, tree: ast.Module) -> Set[str]:
         """Extract import statements from an AST.
@@ -131,21 +234,108 @@ class PythonImportAnalyzer(ImportAnalyzer):
         Returns:
             Set of imported module names
         """
-        imports = set()
+        collector = _ImportCollector()
+        collector.visit(tree)
+        return collector.imports
+    
+    def _extract_leading_imports(self, content: str) -> Optional[Set[str]]:
+        """Extract imports from the leading import block without parsing the whole file.
+        
+        Tokenizes top-level statements until the first one that is not an import
+        or a docstring. The result is only used if the word "import" does not
+        appear anywhere after that point, so imports nested in functions or
+        placed further down the module are never missed.
         
-        for node in ast.walk(tree):
-            # Handle 'import x' and 'import x as y'
-            if isinstance(node, ast.Import):
-                for name in node.names:
-                    imports.add(name.name)
+        Args:
+            content: Content of the Python file
             
-            # Handle 'from x import y' and 'from x import y as z'
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:  # Handles 'from x import y'
-                    imports.add(node.module)
+        Returns:
+            Set of imported module names, or None if the whole file must be parsed
+        """
+        imports: Set[str] = set()
+        
+        # Track where each line starts so token positions can be mapped to offsets
+        line_offsets = [0]
+        lines = io.StringIO(content)
+        
+        def readline() -> str:
+            line = lines.readline()
+            line_offsets.append(line_offsets[-1] + len(line))
+            return line
+        
+        try:
+            tokens = tokenize.generate_tokens(readline)
+            token = next(tokens, None)
+            while token is not None:
+                if token.type in self.IGNORED_TOKENS:
+                    token = next(tokens, None)
+                    continue
+                if token.type == tokenize.ENDMARKER:
+                    # The file holds nothing but imports
+                    return imports
+                
+                statement_start = token.start
+                if token.type == tokenize.NAME and token.string in ("import", "from"):
+                    keyword = token.string
+                    words = []
+                    token = next(tokens, None)
+                    while token is not None and token.type not in self.STATEMENT_END_TOKENS and token.string != ";":
+                        if token.type in (tokenize.NAME, tokenize.OP):
+                            words.append(token.string)
+                        token = next(tokens, None)
+                    imports.update(self._modules_from_import_words(keyword, words))
+                elif token.type == tokenize.STRING:
+                    # Skip docstrings, but stop at any other statement starting with a string
+                    token = next(tokens, None)
+                    while token is not None and token.type in (tokenize.STRING, tokenize.NL, tokenize.COMMENT):
+                        token = next(tokens, None)
+                    if token is None or (token.type not in self.STATEMENT_END_TOKENS and token.string != ";"):
+                        break
+                else:
+                    break
+                
+                # Move past the end of the statement
+                token = next(tokens, None)
+            else:
+                return imports
+        except (tokenize.TokenError, SyntaxError):
+            return None
+        
+        # Only trust the leading block if no import can follow it
+        row, col = statement_start
+        if content.find("import", line_offsets[row - 1] + col) != -1:
+            return None
         
         return imports
     
+    @staticmethod
+    def _modules_from_import_words(keyword: str, words: List[str]) -> List[str]:
+        """Get the module names of a tokenized import statement.
+        
+        Args:
+            keyword: "import" or "from"
+            words: Names and operators that follow the keyword
+            
+        Returns:
+            Imported module names, matching what the AST extractor reports
+        """
+        if keyword == "from":
+            # 'from x.y import z' imports x.y; relative dots are not part of the module name
+            if "import" not in words:
+                return []
+            module_words = words[:words.index("import")]
+            while module_words and module_words[0] in (".", "..."):
+                module_words.pop(0)
+            return ["".join(module_words)] if module_words else []
+        
+        # 'import x.y as z, w' imports x.y and w
+        modules = []
+        for name in " ".join(words).split(","):
+            module = name.split(" as ")[0].replace(" ", "")
+            if module:
+                modules.append(module)
+        return modules
+    
     def _extract_imports_with_regex(self, content: str) -> Set[str]:
         """Extract import statements using regex (fallback method).
         
@@ -157,49 +347,18 @@ class PythonImportAnalyzer(ImportAnalyzer):
         """
         imports = set()
         
-        # Normalize line endings
-        content = content.replace('\r\n', '\n').replace('\r', '\n')
-        
-        # Process line by line to handle imports more reliably
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-                
-            # Match 'import x' and 'import x as y'
-            if line.startswith('import '):
-                # Extract everything after 'import '
-                import_part = line[7:].strip()
-                
-                # Handle multiple imports on one line (import x, y, z)
-                modules = import_part.split(',')
-                for module in modules:
-                    module = module.strip()
-                    
-                    # Remove 'as y' if present
-                    if ' as ' in module:
-                        module_name = module.split(' as ')[0].strip()
-                    else:
-                        module_name = module
-                    
-                    # Handle potential nested modules (e.g., torch.nn)
-                    base_module = module_name.split('.')[0].strip()
-                    if base_module:
-                        imports.add(base_module)
+        # For nested imports (e.g., torch.nn) only the top-level package matters
+        for match in self.IMPORT_STATEMENT_REGEX.finditer(content):
+            if match.lastgroup == 'module':
+                modules = [match.group('module')]
+            else:
+                # Several modules may be imported on one line; remove 'as y'
+                modules = [module.split(' as ', 1)[0] for module in match.group('names').split(',')]
             
-            # Match 'from x import y'
-            elif line.startswith('from '):
-                # Extract the module part between 'from ' and ' import'
-                parts = line.split(' import ')
-                if len(parts) >= 2:
-                    module_part = parts[0][5:].strip()  # Remove 'from ' prefix
-                    if module_part:
-                        # For nested imports, we only care about the top-level package
-                        base_module = module_part.split('.')[0].strip()
-                        imports.add(base_module)
+            for module in modules:
+                base_module = module.split('.', 1)[0].strip()
+                if base_module:
+                    imports.add(base_module)
         
         return imports
 
@@ -213,36 +372,18 @@ class PythonImportAnalyzer(ImportAnalyzer):
         Returns:
             Normalized content with consistent indentation
         """
-        # Split into lines and remove leading/trailing whitespace
-        lines = content.splitlines()
-        
-        # Remove any leading blank lines
-        while lines and not lines[0].strip():
-            lines.pop(0)
-            
-        if not lines:
+        # Find the first non-blank character
+        first_code = self.NON_WHITESPACE_REGEX.search(content)
+        if first_code is None:
             return ""
-            
-        # Find the minimum indentation of non-empty lines
-        min_indent = float('inf')
-        for line in lines:
-            if line.strip():  # Skip empty lines
-                indent = len(line) - len(line.lstrip())
-                min_indent = min(min_indent, indent)
-                
-        if min_indent == float('inf'):
-            min_indent = 0
-            
-        # Remove common indentation from all lines
-        normalized_lines = []
-        for line in lines:
-            if not line.strip():  # Keep empty lines as is
-                normalized_lines.append("")
-            else:
-                # Remove the common indentation
-                normalized_lines.append(line[min_indent:] if len(line) >= min_indent else line)
-                
-        return "\n".join(normalized_lines)
+        
+        # Most files start at column 0 and need no changes
+        start = first_code.start()
+        if start == 0 or content[start - 1] in "\r\n":
+            return content
+        
+        # Remove the common indentation from all lines
+        return textwrap.dedent(content)
 
 
 # Register the analyzer
@@ -1,12 +1,16 @@
 """Analyzer for Scala import statements."""
 
+import logging
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
 from dependency_scanner_tool.analyzers.base import ImportAnalyzer, ImportAnalyzerRegistry
+from dependency_scanner_tool.normalizers.java_package import build_prefix_regex
 from dependency_scanner_tool.scanner import Dependency, DependencyType
 
+logger = logging.getLogger(__name__)
+
 
 class ScalaImportAnalyzer(ImportAnalyzer):
     """Analyzer for Scala import statements.
@@ -95,6 +99,8 @@ class ScalaImportAnalyzer(ImportAnalyzer):
         "org.h2": "com.h2database:h2",
     }
     
+    _PREFIX_REGEX = build_prefix_regex(PACKAGE_TO_ARTIFACT_MAPPING)
+    
     def analyze(self, file_path: Path) -> List[Dependency]:
         """Analyze a Scala file for import statements.
         
@@ -138,7 +144,7 @@ class ScalaImportAnalyzer(ImportAnalyzer):
         except Exception as e:
             # Log the error but don't fail the analysis
             # This allows the scanner to continue with other files
-            print(f"Error analyzing Scala file {file_path}: {str(e)}")
+            logger.warning("Error analyzing Scala file %s: %s", file_path, e)
             return []
     
     def _remove_comments(self, content: str) -> str:
@@ -236,15 +242,9 @@ class ScalaImportAnalyzer(ImportAnalyzer):
         Returns:
             Dependency object or None if the import cannot be mapped
         """
-        # Try to map the import to a Maven artifact
-        artifact_name = None
-        
-        # Find the longest matching package prefix
-        matching_prefix = ""
-        for package_prefix, artifact in self.PACKAGE_TO_ARTIFACT_MAPPING.items():
-            if import_path.startswith(package_prefix) and len(package_prefix) > len(matching_prefix):
-                matching_prefix = package_prefix
-                artifact_name = artifact
+        # Map the longest matching package prefix to a Maven artifact
+        match = self._PREFIX_REGEX.match(import_path)
+        artifact_name = self.PACKAGE_TO_ARTIFACT_MAPPING[match.group(0)] if match else None
         
         if not artifact_name:
             # If no mapping is found, try to guess the artifact name
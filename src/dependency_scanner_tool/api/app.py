@@ -8,6 +8,7 @@ load_dotenv()
 import logging
 from datetime import datetime, timezone
 from fastapi import FastAPI, BackgroundTasks, HTTPException, status, Depends
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBasic
 from contextlib import asynccontextmanager
 
@@ -20,6 +21,9 @@ from dependency_scanner_tool.api.validation import validate_git_url
 
 logger = logging.getLogger(__name__)
 
+# Seconds between keep-alive comments on idle job event streams
+EVENT_KEEPALIVE_INTERVAL = 15
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -31,6 +35,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Dependency Scanner API")
     await job_lifecycle_manager.stop()
+    scanner_service.shutdown()
 
 
 app = FastAPI(
@@ -113,6 +118,48 @@ async def get_job_status(job_id: str, current_user: str = Depends(get_current_us
     )
 
 
+@app.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str, current_user: str = Depends(get_current_user)):
+    """Stream job status changes as server-sent events.
+    
+    Each event carries the same payload as the job status endpoint. The
+    stream ends once the job completes or fails.
+    """
+    job = job_manager.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    async def event_stream():
+        current = job
+        while current is not None:
+            version = current.version
+            status_response = JobStatusResponse(
+                job_id=current.job_id,
+                status=current.status,
+                created_at=current.created_at.isoformat(),
+                completed_at=current.completed_at.isoformat() if current.completed_at else None,
+                progress=current.progress
+            )
+            yield f"data: {status_response.model_dump_json()}\n\n"
+            
+            if current.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+                return
+            
+            # Only emit another event once the job has actually changed
+            while current is not None and current.version == version:
+                current = await job_manager.wait_for_update(
+                    job_id, version, EVENT_KEEPALIVE_INTERVAL
+                )
+                if current is not None and current.version == version:
+                    yield ": keep-alive\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
 @app.get("/jobs/{job_id}/results", response_model=ScanResultResponse)
 async def get_job_results(job_id: str, current_user: str = Depends(get_current_user)):
     """Get job results by ID."""
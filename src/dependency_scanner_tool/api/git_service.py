@@ -213,7 +213,7 @@ class RepositoryService:
                 # If there's a single root directory, move its contents up
                 if len(root_dirs) == 1:
                     root_dir = extract_path.parent / list(root_dirs)[0]
-                    if root_dir.exists() and root_dir.is_dir():
+                    if root_dir.is_dir():
                         # Move contents of root_dir to extract_path
                         extract_path.mkdir(exist_ok=True)
                         for item in root_dir.iterdir():
@@ -259,7 +259,7 @@ class RepositoryService:
             True if valid repository structure, False otherwise
         """
         try:
-            return repo_path.exists() and repo_path.is_dir() and any(repo_path.iterdir())
+            return repo_path.is_dir() and any(repo_path.iterdir())
         except Exception:
             return False
     
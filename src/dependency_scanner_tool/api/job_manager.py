@@ -1,5 +1,6 @@
 """Job management for the REST API."""
 
+import asyncio
 import uuid
 from datetime import datetime, timezone
 from typing import Dict, Optional, Any
@@ -21,6 +22,8 @@ class Job:
         self.result: Optional[ScanResultResponse] = None
         self.partial_results: Optional[Dict[str, Any]] = None
         self.last_updated: Optional[datetime] = None
+        # Incremented on every change so waiters can detect updates
+        self.version = 0
 
 
 class JobManager:
@@ -28,6 +31,41 @@ class JobManager:
     
     def __init__(self):
         self._jobs: Dict[str, Job] = {}
+        self._update_events: Dict[str, asyncio.Event] = {}
+    
+    def _notify(self, job: Job) -> None:
+        """Record a change to a job and wake any waiters."""
+        job.version += 1
+        event = self._update_events.pop(job.job_id, None)
+        if event:
+            event.set()
+    
+    async def wait_for_update(
+        self, job_id: str, version: int, timeout: float
+    ) -> Optional[Job]:
+        """Wait until a job changes past the given version.
+        
+        Returns immediately if the job has already changed, otherwise blocks
+        until the next update or until the timeout expires.
+        
+        Args:
+            job_id: Job identifier
+            version: Last job version seen by the caller
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            The job (changed or not), or None if the job does not exist
+        """
+        job = self._jobs.get(job_id)
+        if not job or job.version != version:
+            return job
+        
+        event = self._update_events.setdefault(job_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self._jobs.get(job_id)
     
     def create_job(self, git_url: str) -> str:
         """Create a new scan job."""
@@ -48,6 +86,7 @@ class JobManager:
             job.progress = progress
             if status == JobStatus.COMPLETED or status == JobStatus.FAILED:
                 job.completed_at = datetime.now(timezone.utc)
+            self._notify(job)
     
     def set_job_result(self, job_id: str, result: ScanResultResponse):
         """Set job result."""
@@ -57,6 +96,7 @@ class JobManager:
             job.status = JobStatus.COMPLETED
             job.progress = 100
             job.completed_at = datetime.now(timezone.utc)
+            self._notify(job)
     
     def set_job_error(self, job_id: str, error_message: str):
         """Set job error."""
@@ -65,11 +105,16 @@ class JobManager:
             job.error_message = error_message
             job.status = JobStatus.FAILED
             job.completed_at = datetime.now(timezone.utc)
+            self._notify(job)
     
     def remove_job(self, job_id: str) -> bool:
         """Remove a job by ID."""
         if job_id in self._jobs:
             del self._jobs[job_id]
+            # Wake waiters so they observe the removal
+            event = self._update_events.pop(job_id, None)
+            if event:
+                event.set()
             return True
         return False
     
@@ -79,6 +124,7 @@ class JobManager:
         if job:
             job.partial_results = partial_data
             job.last_updated = datetime.now(timezone.utc)
+            self._notify(job)
     
     def clear_partial_results(self, job_id: str):
         """Clear partial results for a job."""
@@ -86,6 +132,7 @@ class JobManager:
         if job:
             job.partial_results = None
             job.last_updated = None
+            self._notify(job)
     
     @property
     def jobs(self) -> Dict[str, Job]:
@@ -1,9 +1,13 @@
 """Scanner service for integrating with the existing DependencyScanner."""
 
+import asyncio
 import logging
+import os
+import sys
 import yaml
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from dependency_scanner_tool.scanner import DependencyScanner
 from dependency_scanner_tool.api.models import ScanResultResponse, ProjectScanResult
@@ -16,13 +20,71 @@ from dependency_scanner_tool.api.gitlab_service import GitLabGroupService
 
 logger = logging.getLogger(__name__)
 
+# Per-process scanner service used by pool workers
+_worker_service: Optional["ScannerService"] = None
+
+
+def _init_worker() -> None:
+    """Build the scanner once when a pool worker starts."""
+    global _worker_service
+    # Projects already run in parallel, so each one analyzes its files in-process
+    _worker_service = ScannerService(scanner=DependencyScanner(parallel=False))
+
+
+def _scan_project(project_name: str, git_url: str) -> Tuple[Dict[str, bool], Dict[str, bool]]:
+    """Scan one group project inside a pool worker."""
+    return _worker_service.scan_project(project_name, git_url)
+
 
 class ScannerService:
     """Service for scanning repositories."""
     
-    def __init__(self):
-        self.scanner = DependencyScanner()
+    def __init__(self, max_workers: Optional[int] = None, scanner: Optional[DependencyScanner] = None):
+        """
+        Initialize scanner service.
+        
+        Args:
+            max_workers: Number of worker processes used for group scans
+                         (defaults to the number of CPUs)
+            scanner: Optional scanner instance to use. Group scans run in
+                     worker processes with their own default scanner, so an
+                     injected scanner makes them run in threads instead.
+        """
+        self.scanner = scanner or DependencyScanner()
+        self._scanner_injected = scanner is not None
         self.config_path = Path(__file__).parent.parent.parent.parent / "config.yaml"
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor: Optional[Executor] = None
+    
+    def _get_executor(self) -> Optional[Executor]:
+        """Get the long-lived worker pool, starting it on first use.
+        
+        Returns:
+            Process pool, or None if a scanner was injected or process pools
+            are unavailable
+        """
+        # Workers cannot share an injected scanner, so scan with it in threads
+        if self._scanner_injected:
+            return None
+        if self._executor is None:
+            try:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, initializer=_init_worker
+                )
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"Process pool unavailable, scanning projects in threads: {e}")
+                return None
+        return self._executor
+    
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        if self._executor is not None:
+            if sys.version_info >= (3, 9):
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                # cancel_futures was added in Python 3.9
+                self._executor.shutdown(wait=False)
+            self._executor = None
     
     def _load_config(self) -> dict:
         """Load configuration from config.yaml file."""
@@ -121,66 +183,57 @@ class ScannerService:
             
             logger.info(f"Found {len(project_info)} projects in group")
             
-            # Scan each project
+            # Scan projects concurrently in the worker pool
             project_results = []
             failed_projects = []
             group_dependencies = {}
             group_infrastructure = {}
             total_projects = len(project_info)
+            completed = 0
             
+            projects = []
             for i, project in enumerate(project_info):
-                project_name = project['name']
-                git_url = project['git_url']
-                repo_path = None
-                
-                if not git_url:
-                    logger.warning(f"Skipping project {project_name}: no git URL")
+                if not project['git_url']:
+                    logger.warning(f"Skipping project {project['name']}: no git URL")
                     continue
-                
+                projects.append((i, project))
+            
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            
+            async def scan(i: int, project: dict):
+                nonlocal completed
+                project_name = project['name']
                 logger.info(f"Scanning project [{i+1}/{total_projects}]: {project_name}")
-                
                 try:
-                    # Download and scan individual project
-                    repo_path = repository_service.download_repository(git_url)
-                    
-                    if repository_service.validate_repository(repo_path):
-                        scan_result = self.scanner.scan_project(str(repo_path))
-                        project_dependencies = self._transform_dependencies_only(scan_result, project_name)
-                        project_infrastructure = self._transform_infrastructure_usage(scan_result, project_name)
-                        
-                        project_results.append(ProjectScanResult(
-                            project_name=project_name,
-                            git_url=git_url,
-                            dependencies=project_dependencies,
-                            infrastructure_usage=project_infrastructure,
-                            status="success",
-                            error=None
-                        ))
-                        
-                        # Aggregate dependencies (OR logic: if any project has it, mark as present)
-                        for category, has_deps in project_dependencies.items():
-                            if category not in group_dependencies:
-                                group_dependencies[category] = has_deps
-                            else:
-                                group_dependencies[category] = group_dependencies[category] or has_deps
-                        
-                        # Aggregate infrastructure usage (OR logic: if any project has it, mark as present)
-                        for infra_type, has_infra in project_infrastructure.items():
-                            if infra_type not in group_infrastructure:
-                                group_infrastructure[infra_type] = has_infra
-                            else:
-                                group_infrastructure[infra_type] = group_infrastructure[infra_type] or has_infra
-                        
-                        logger.info(f"✅ Project {project_name} scanned successfully")
-                    else:
-                        raise Exception("Invalid or corrupted repository")
-                        
-                except Exception as e:
-                    logger.error(f"❌ Project {project_name} scan failed: {e}")
+                    if executor is not None:
+                        return await loop.run_in_executor(
+                            executor, _scan_project, project_name, project['git_url']
+                        )
+                    return await loop.run_in_executor(
+                        None, self.scan_project, project_name, project['git_url']
+                    )
+                finally:
+                    # Update progress
+                    completed += 1
+                    progress = 10 + int(completed / total_projects * 80)
+                    job_manager.update_job_status(job_id, JobStatus.RUNNING, progress)
+            
+            outcomes = await asyncio.gather(
+                *(scan(i, project) for i, project in projects),
+                return_exceptions=True
+            )
+            
+            for (_, project), outcome in zip(projects, outcomes):
+                project_name = project['name']
+                git_url = project['git_url']
+                
+                if isinstance(outcome, BaseException):
+                    logger.error(f"❌ Project {project_name} scan failed: {outcome}")
                     failed_projects.append({
                         'project_name': project_name,
                         'git_url': git_url,
-                        'error': str(e)
+                        'error': str(outcome)
                     })
                     project_results.append(ProjectScanResult(
                         project_name=project_name,
@@ -188,21 +241,35 @@ class ScannerService:
                         dependencies={},
                         infrastructure_usage={},
                         status="failed",
-                        error=str(e)
+                        error=str(outcome)
                     ))
+                    continue
                 
-                finally:
-                    # Clean up project immediately after scanning (success or failure)
-                    if repo_path:
-                        try:
-                            repository_service.cleanup_repository(repo_path)
-                            logger.debug(f"Cleaned up project {project_name} at {repo_path}")
-                        except Exception as cleanup_e:
-                            logger.warning(f"Failed to cleanup project {project_name}: {cleanup_e}")
+                project_dependencies, project_infrastructure = outcome
+                project_results.append(ProjectScanResult(
+                    project_name=project_name,
+                    git_url=git_url,
+                    dependencies=project_dependencies,
+                    infrastructure_usage=project_infrastructure,
+                    status="success",
+                    error=None
+                ))
+                
+                # Aggregate dependencies (OR logic: if any project has it, mark as present)
+                for category, has_deps in project_dependencies.items():
+                    if category not in group_dependencies:
+                        group_dependencies[category] = has_deps
+                    else:
+                        group_dependencies[category] = group_dependencies[category] or has_deps
                 
-                # Update progress
-                progress = 10 + int((i + 1) / total_projects * 80)
-                job_manager.update_job_status(job_id, JobStatus.RUNNING, progress)
+                # Aggregate infrastructure usage (OR logic: if any project has it, mark as present)
+                for infra_type, has_infra in project_infrastructure.items():
+                    if infra_type not in group_infrastructure:
+                        group_infrastructure[infra_type] = has_infra
+                    else:
+                        group_infrastructure[infra_type] = group_infrastructure[infra_type] or has_infra
+                
+                logger.info(f"✅ Project {project_name} scanned successfully")
             
             # Create group scan result
             successful_scans = len([r for r in project_results if r.status == "success"])
@@ -228,6 +295,43 @@ class ScannerService:
             logger.error(f"Group scan failed for job {job_id}: {str(e)}")
             raise
     
+    def scan_project(self, project_name: str, git_url: str) -> Tuple[Dict[str, bool], Dict[str, bool]]:
+        """Download and scan a single group project.
+        
+        Runs in a pool worker, so only the small category dictionaries are
+        sent back to the API process.
+        
+        Args:
+            project_name: Name of the project, used for logging
+            git_url: Git URL of the project
+            
+        Returns:
+            Tuple of (dependency category flags, infrastructure usage flags)
+            
+        Raises:
+            Exception: If the download or scan fails
+        """
+        repo_path = None
+        try:
+            repo_path = repository_service.download_repository(git_url)
+            
+            if not repository_service.validate_repository(repo_path):
+                raise Exception("Invalid or corrupted repository")
+            
+            scan_result = self.scanner.scan_project(str(repo_path))
+            return (
+                self._transform_dependencies_only(scan_result, project_name),
+                self._transform_infrastructure_usage(scan_result, project_name)
+            )
+        finally:
+            # Clean up project immediately after scanning (success or failure)
+            if repo_path:
+                try:
+                    repository_service.cleanup_repository(repo_path)
+                    logger.debug(f"Cleaned up project {project_name} at {repo_path}")
+                except Exception as cleanup_e:
+                    logger.warning(f"Failed to cleanup project {project_name}: {cleanup_e}")
+    
     def is_service_ready(self) -> bool:
         """Check if the scanner service is ready to accept jobs."""
         return job_lifecycle_manager.can_create_job()
@@ -3,7 +3,7 @@
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from dependency_scanner_tool.scanner import Dependency
 from dependency_scanner_tool.normalizers.python_package import is_package_match
@@ -25,6 +25,8 @@ class DependencyCategorizer:
         """
         self.categories = {}
         self.java_normalizer = JavaPackageNormalizer()
+        self._exact_index: Dict[str, List[str]] = {}
+        self._category_cache: Dict[str, List[str]] = {}
         
         if config and "categories" in config:
             # Handle new unified structure with dependencies and api_patterns
@@ -38,10 +40,19 @@ class DependencyCategorizer:
                 else:
                     logger.warning(f"Skipping invalid category format for '{category_name}'")
             
+            self._build_exact_index()
             logger.info(f"Initialized dependency categorizer with {len(self.categories)} categories")
         else:
             logger.info("Initialized dependency categorizer with no categories")
     
+    def _build_exact_index(self) -> None:
+        """Index lowercased dependency names to the categories that list them."""
+        for category, deps in self.categories.items():
+            for dep_name in deps:
+                categories = self._exact_index.setdefault(dep_name.lower(), [])
+                if category not in categories:
+                    categories.append(category)
+    
     @classmethod
     def from_json(cls, json_path: Path) -> 'DependencyCategorizer':
         """Create a DependencyCategorizer from a JSON configuration file.
@@ -109,11 +120,17 @@ class DependencyCategorizer:
         Returns:
             List of category names the dependency belongs to, or ["Uncategorized"] if none
         """
+        # Categorization depends only on the name, so repeated names are served from cache
+        cached = self._category_cache.get(dependency.name)
+        if cached is not None:
+            return list(cached)
+        
+        exact_categories = self._exact_index.get(dependency.name.lower(), ())
         matching_categories = []
         
         for category, deps in self.categories.items():
             # Direct match (case-insensitive)
-            if dependency.name.lower() in [dep.lower() for dep in deps]:
+            if category in exact_categories:
                 matching_categories.append(category)
                 continue
             
@@ -135,20 +152,24 @@ class DependencyCategorizer:
                             matching_categories.append(category)
                             break
         
-        return matching_categories if matching_categories else ["Uncategorized"]
+        result = matching_categories if matching_categories else ["Uncategorized"]
+        self._category_cache[dependency.name] = result
+        return list(result)
     
-    def categorize_dependencies(self, dependencies: List[Dependency]) -> Dict[str, List[Dependency]]:
+    def categorize_dependencies(self, dependencies: Iterable[Dependency]) -> Dict[str, List[Dependency]]:
         """Categorize multiple dependencies.
         
         Args:
-            dependencies: List of dependencies to categorize
+            dependencies: Dependencies to categorize; any iterable, so callers can stream them
             
         Returns:
             Dictionary mapping category names to lists of dependencies
         """
         categorized = {}
+        count = 0
         
         for dep in dependencies:
+            count += 1
             categories = self.categorize_dependency(dep)
             
             for category in categories:
@@ -157,5 +178,5 @@ class DependencyCategorizer:
                 
                 categorized[category].append(dep)
         
-        logger.info(f"Categorized {len(dependencies)} dependencies into {len(categorized)} categories")
+        logger.info(f"Categorized {count} dependencies into {len(categorized)} categories")
         return categorized
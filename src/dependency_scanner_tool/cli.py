@@ -1,19 +1,18 @@
 """Command-line interface for the dependency scanner."""
 
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import Dict, List, Set
 
 import click
-import yaml
 
 from dependency_scanner_tool.scanner import (
     DependencyScanner,
     DependencyClassifier
 )
 from dependency_scanner_tool.reporters.json_reporter import JSONReporter
-from dependency_scanner_tool.reporters.html_reporter import HTMLReporter
 
 
 def load_configuration(config_path: Path) -> dict:
@@ -25,6 +24,9 @@ def load_configuration(config_path: Path) -> dict:
     Returns:
         Dictionary containing configuration settings
     """
+    # Imported here so runs without a configuration file don't pay for loading yaml
+    import yaml
+    
     try:
         with config_path.open() as f:
             return yaml.safe_load(f)
@@ -33,97 +35,111 @@ def load_configuration(config_path: Path) -> dict:
         sys.exit(1)
 
 
-def format_scan_result(result, output_format="text", category_config=None):
+def format_scan_result(result, output_format="text", category_config=None, out=None):
     """Format scan results for output.
     
     Args:
         result: ScanResult object
         output_format: Desired output format (text/json)
         category_config: Optional path to category configuration file
+        out: Optional text stream; when given, the results are written to it
+            as they are formatted instead of being returned
         
     Returns:
-        Formatted string containing the results
+        Formatted string containing the results, or None if out is given
     """
     if output_format == "json":
         # Use the JSONReporter to format the result
         json_reporter = JSONReporter(category_config=category_config)
+        if out is not None:
+            json_reporter.write_report(result, out)
+            return None
         return json_reporter.generate_report(result)
-    else:
-        # Text format
-        lines = [
-            "=== Dependency Scanner Results ===",
-            "",
-            "Languages Detected:",
-        ]
-        
-        for lang, percentage in result.languages.items():
-            lines.append(f"  - {lang}: {percentage:.1f}%")
+    
+    # Text format
+    lines = _iter_text_lines(result, category_config)
+    if out is None:
+        return "\n".join(lines)
+    
+    for line in lines:
+        out.write(f"{line}\n")
+    return None
+
+
+def _iter_text_lines(result, category_config=None):
+    """Yield the lines of the text report one at a time.
+    
+    Args:
+        result: ScanResult object
+        category_config: Optional path to category configuration file
         
-        lines.extend([
-            "",
-            "Package Managers:",
-            *[f"  - {pm}" for pm in sorted(result.package_managers)],
-            "",
-            "Dependency Files:",
-            *[f"  - {df}" for df in result.dependency_files],
-            "",
-            "Dependencies:",
-        ])
+    Yields:
+        Report lines without trailing newlines
+    """
+    yield "=== Dependency Scanner Results ==="
+    yield ""
+    yield "Languages Detected:"
+    
+    for lang, percentage in result.languages.items():
+        yield f"  - {lang}: {percentage:.1f}%"
+    
+    yield ""
+    yield "Package Managers:"
+    for pm in sorted(result.package_managers):
+        yield f"  - {pm}"
+    yield ""
+    yield "Dependency Files:"
+    for df in result.dependency_files:
+        yield f"  - {df}"
+    yield ""
+    yield "Dependencies:"
+    
+    for dep in result.dependencies:
+        status = dep.dependency_type.value.upper()
+        version = f" ({dep.version})" if dep.version else ""
+        source = f" from {dep.source_file}" if dep.source_file else ""
+        yield f"  - {dep.name}{version} [{status}]{source}"
+    
+    # Add API calls section
+    if hasattr(result, 'api_calls') and result.api_calls:
+        yield ""
+        yield "REST API Calls:"
         
-        for dep in result.dependencies:
-            status = dep.dependency_type.value.upper()
-            version = f" ({dep.version})" if dep.version else ""
-            source = f" from {dep.source_file}" if dep.source_file else ""
-            lines.append(f"  - {dep.name}{version} [{status}]{source}")
+        for api_call in result.api_calls:
+            method = f"[{api_call.http_method}] " if api_call.http_method else ""
+            auth = f" (Auth: {api_call.auth_type.value})" if api_call.auth_type.value != "unknown" else ""
+            source = f" in {api_call.source_file}" if api_call.source_file else ""
+            line = f":{api_call.line_number}" if api_call.line_number else ""
+            yield f"  - {method}{api_call.url}{auth}{source}{line}"
+    
+    if result.errors:
+        yield ""
+        yield "Errors:"
+        for error in result.errors:
+            yield f"  - {error}"
+    
+    # Add categorized dependencies if a categorizer is available
+    if category_config and category_config.exists():
+        from dependency_scanner_tool.categorization import DependencyCategorizer
+        try:
+            categorizer = DependencyCategorizer.from_json(category_config)
+            categorized = categorizer.categorize_dependencies(result.dependencies)
+        except Exception as e:
+            yield ""
+            yield f"Error loading category configuration: {e}"
+            return
         
-        # Add API calls section
-        if hasattr(result, 'api_calls') and result.api_calls:
-            lines.extend([
-                "",
-                "REST API Calls:",
-            ])
+        if categorized:
+            yield ""
+            yield "Categorized Dependencies:"
             
-            for api_call in result.api_calls:
-                method = f"[{api_call.http_method}] " if api_call.http_method else ""
-                auth = f" (Auth: {api_call.auth_type.value})" if api_call.auth_type.value != "unknown" else ""
-                source = f" in {api_call.source_file}" if api_call.source_file else ""
-                line = f":{api_call.line_number}" if api_call.line_number else ""
-                lines.append(f"  - {method}{api_call.url}{auth}{source}{line}")
-        
-        if result.errors:
-            lines.extend([
-                "",
-                "Errors:",
-                *[f"  - {error}" for error in result.errors],
-            ])
-        
-        # Add categorized dependencies if a categorizer is available
-        if category_config and category_config.exists():
-            from dependency_scanner_tool.categorization import DependencyCategorizer
-            try:
-                categorizer = DependencyCategorizer.from_json(category_config)
-                categorized = categorizer.categorize_dependencies(result.dependencies)
-                
-                if categorized:
-                    lines.extend([
-                        "",
-                        "Categorized Dependencies:",
-                    ])
-                    
-                    for category, deps in categorized.items():
-                        lines.append(f"  {category}:")
-                        for dep in deps:
-                            status = dep.dependency_type.value.upper()
-                            version = f" ({dep.version})" if dep.version else ""
-                            source = f" from {dep.source_file}" if dep.source_file else ""
-                            lines.append(f"    - {dep.name}{version} [{status}]{source}")
-            except Exception as e:
-                lines.extend([
-                    "",
-                    f"Error loading category configuration: {e}",
-                ])
-        
-        return "\n".join(lines)
+            for category, deps in categorized.items():
+                yield f"  {category}:"
+                for dep in deps:
+                    status = dep.dependency_type.value.upper()
+                    version = f" ({dep.version})" if dep.version else ""
+                    source = f" from {dep.source_file}" if dep.source_file else ""
+                    yield f"    - {dep.name}{version} [{status}]{source}"
 
 
 @click.command()
@@ -243,7 +259,8 @@ def main(project_path: Path, config: Path, output_format: str, json_output: Path
     scanner = DependencyScanner(
         language_detector=language_detector,
         package_manager_detector=package_manager_detector,
-        ignore_patterns=config_data.get("ignore_patterns", []) + list(exclude)
+        ignore_patterns=config_data.get("ignore_patterns", []) + list(exclude),
+        parallel=True
     )
     
     # If JSON or HTML output is specified, force JSON format
@@ -269,7 +286,8 @@ def main(project_path: Path, config: Path, output_format: str, json_output: Path
         
         # Print results to console if not suppressed
         if output_format != "json" or not json_output:
-            click.echo(format_scan_result(result, output_format, category_config))
+            # Stream the results instead of building the whole string first
+            format_scan_result(result, output_format, category_config, out=sys.stdout)
         
         # Save JSON output if requested
         if json_output:
@@ -279,6 +297,9 @@ def main(project_path: Path, config: Path, output_format: str, json_output: Path
         
         # Generate HTML report if requested
         if html_output:
+            # Imported here so runs without an HTML report don't pay for loading jinja2
+            from dependency_scanner_tool.reporters.html_reporter import HTMLReporter
+            
             # If we don't have JSON output yet, create a temporary one
             if not json_output:
                 json_data = JSONReporter(category_config=category_config).generate_report(result)
@@ -339,13 +360,24 @@ class SimpleLanguageDetector:
         extension_counts = {}
         total_files = 0
         
-        for file_path in project_path.glob("**/*"):
-            if file_path.is_file():
-                ext = file_path.suffix.lower()
-                if ext in extension_map:
-                    lang = extension_map[ext]
-                    extension_counts[lang] = extension_counts.get(lang, 0) + 1
-                    total_files += 1
+        # Walk with os.scandir so file types come from the directory listing
+        # instead of a stat call per entry
+        pending = [str(project_path)]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                            continue
+                        
+                        lang = extension_map.get(os.path.splitext(entry.name)[1].lower())
+                        if lang and entry.is_file():
+                            extension_counts[lang] = extension_counts.get(lang, 0) + 1
+                            total_files += 1
+            except OSError as e:
+                logging.debug(f"Cannot read directory {current}: {e}")
         
         # Calculate percentages
         if total_files == 0:
@@ -386,8 +418,16 @@ class SimplePackageManagerDetector:
         
         package_managers = set()
         
+        # List the project root once rather than probing each file name
+        try:
+            with os.scandir(project_path) as entries:
+                root_files = {entry.name for entry in entries if entry.is_file()}
+        except OSError as e:
+            logging.debug(f"Cannot read directory {project_path}: {e}")
+            root_files = set()
+        
         for file_name, manager in package_manager_files.items():
-            if (project_path / file_name).exists():
+            if file_name in root_files:
                 package_managers.add(manager)
                 
         return package_managers
@@ -5,6 +5,7 @@ import logging
 from typing import Optional, Dict, Any, List, Tuple
 from urllib.parse import urljoin
 import requests
+from pydantic import ValidationError
 from requests.auth import HTTPBasicAuth
 
 from dependency_scanner_tool.api.models import (
@@ -14,6 +15,10 @@ from dependency_scanner_tool.api.models import (
 
 logger = logging.getLogger(__name__)
 
+# Read timeout for the job event stream, well above the server's 15 second
+# keep-alive interval so an idle stream is not cut off
+EVENT_READ_TIMEOUT = 60
+
 
 class DependencyScannerClient:
     """Client for interacting with the Dependency Scanner REST API."""
@@ -201,27 +206,110 @@ class DependencyScannerClient:
                 print(f"Job {job_id}: {status_response.status.value} - {status_response.progress}%")
                 last_progress = status_response.progress
             
-            if status_response.status == JobStatus.COMPLETED:
-                try:
-                    results = self.get_job_results(job_id)
-                    return status_response, results
-                except Exception as e:
-                    logger.error(f"Failed to get results for completed job {job_id}: {e}")
-                    return status_response, None
-            
-            elif status_response.status == JobStatus.FAILED:
-                logger.error(f"Job {job_id} failed")
-                return status_response, None
+            if status_response.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+                return self._finish_job(job_id, status_response)
             
             time.sleep(self.poll_interval)
         
         raise TimeoutError(f"Job {job_id} did not complete within {max_wait} seconds")
     
+    def wait_for_completion_events(
+        self, 
+        job_id: str, 
+        max_wait: int = 600,
+        show_progress: bool = True
+    ) -> Tuple[JobStatusResponse, Optional[ScanResultResponse]]:
+        """Wait for a job to complete by following its server-sent event stream.
+        
+        The server pushes an event only when the job changes, so no requests
+        are spent on unchanged status. Falls back to polling with
+        wait_for_completion if the server does not provide the events endpoint
+        or the stream fails.
+        
+        Args:
+            job_id: Job identifier
+            max_wait: Maximum wait time in seconds
+            show_progress: Whether to print progress updates
+            
+        Returns:
+            Tuple of (final_status, results). Results is None if job failed.
+            
+        Raises:
+            TimeoutError: If job doesn't complete within max_wait seconds
+        """
+        start_time = time.time()
+        last_progress = -1
+        url = urljoin(self.base_url + '/', f'jobs/{job_id}/events')
+        
+        timeout = (self.timeout, max(self.timeout, EVENT_READ_TIMEOUT))
+        
+        try:
+            with self.session.get(url, stream=True, timeout=timeout) as response:
+                if response.status_code == 404:
+                    logger.info("Job events endpoint not available, falling back to polling")
+                    return self.wait_for_completion(job_id, max_wait, show_progress)
+                response.raise_for_status()
+                
+                # The server sends keep-alive comments while idle, so max_wait is checked regularly
+                for line in response.iter_lines(decode_unicode=True):
+                    if time.time() - start_time >= max_wait:
+                        break
+                    if not line or not line.startswith('data:'):
+                        continue
+                    
+                    status_response = JobStatusResponse.model_validate_json(line[len('data:'):])
+                    
+                    if show_progress and status_response.progress != last_progress:
+                        print(f"Job {job_id}: {status_response.status.value} - {status_response.progress}%")
+                        last_progress = status_response.progress
+                    
+                    if status_response.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+                        return self._finish_job(job_id, status_response)
+        except requests.RequestException as e:
+            logger.error(f"GET {url} failed: {e}")
+            logger.info("Job event stream unavailable, falling back to polling")
+        except ValidationError as e:
+            logger.error(f"Malformed job event from {url}: {e}")
+            logger.info("Job event stream unusable, falling back to polling")
+        
+        remaining = max_wait - (time.time() - start_time)
+        if remaining <= 0:
+            raise TimeoutError(f"Job {job_id} did not complete within {max_wait} seconds")
+        
+        # The stream closed or failed before the job finished; poll for the rest of the wait
+        return self.wait_for_completion(job_id, int(remaining), show_progress)
+    
+    def _finish_job(
+        self, 
+        job_id: str, 
+        status_response: JobStatusResponse
+    ) -> Tuple[JobStatusResponse, Optional[ScanResultResponse]]:
+        """Fetch results for a job that has reached a final status.
+        
+        Args:
+            job_id: Job identifier
+            status_response: Final job status
+            
+        Returns:
+            Tuple of (final_status, results). Results is None if job failed.
+        """
+        if status_response.status == JobStatus.FAILED:
+            logger.error(f"Job {job_id} failed")
+            return status_response, None
+        
+        try:
+            results = self.get_job_results(job_id)
+            return status_response, results
+        except Exception as e:
+            logger.error(f"Failed to get results for completed job {job_id}: {e}")
+            return status_response, None
+    
     def scan_repository_and_wait(
         self, 
         git_url: str, 
         max_wait: int = 600,
-        show_progress: bool = True
+        show_progress: bool = True,
+        use_events: bool = True
     ) -> Tuple[str, ScanResultResponse]:
         """Submit a repository scan and wait for completion.
         
@@ -229,6 +317,7 @@ class DependencyScannerClient:
             git_url: Git repository URL to scan
             max_wait: Maximum wait time in seconds
             show_progress: Whether to print progress updates
+            use_events: Whether to wait on the job event stream instead of polling
             
         Returns:
             Tuple of (job_id, scan_results)
@@ -243,9 +332,8 @@ class DependencyScannerClient:
         print(f"Scan submitted successfully. Job ID: {job_id}")
         print(f"Waiting for completion (max {max_wait} seconds)...")
         
-        final_status, results = self.wait_for_completion(
-            job_id, max_wait, show_progress
-        )
+        wait = self.wait_for_completion_events if use_events else self.wait_for_completion
+        final_status, results = wait(job_id, max_wait, show_progress)
         
         if final_status.status == JobStatus.FAILED:
             raise Exception(f"Scan failed for job {job_id}")
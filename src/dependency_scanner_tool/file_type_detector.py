@@ -1,19 +1,26 @@
 """File type detection system for the dependency scanner."""
 
+import codecs
+import json
 import logging
 import mimetypes
 import os
 import re
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Pattern, Tuple
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
 
 from dependency_scanner_tool.exceptions import FileAccessError
 
 # Initialize mimetypes
 mimetypes.init()
 
+# Threads used by analyze_file_types; detection is dominated by file reads,
+# which release the GIL, so more threads than CPUs still overlap usefully
+FILE_TYPE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 class FileCategory(Enum):
     """Categories for different file types."""
@@ -34,18 +41,21 @@ class FileType:
     name: str
     extensions: List[str]
     category: FileCategory
-    mime_types: List[str] = None
-    patterns: List[Pattern] = None
+    mime_types: List[str] = field(default_factory=list)
+    patterns: List[Pattern] = field(default_factory=list)
     shebang: Optional[str] = None
-    
-    def __post_init__(self):
-        """Initialize default values for optional fields."""
-        if self.mime_types is None:
-            self.mime_types = []
-        if self.patterns is None:
-            self.patterns = []
 
 
+# Mapping of file_utils.get_file_type classifications to file categories
+FILE_TYPE_CATEGORIES = {
+    "source_file": FileCategory.SOURCE_CODE,
+    "dependency_file": FileCategory.DEPENDENCY_FILE,
+    "binary_file": FileCategory.BINARY,
+    "image_file": FileCategory.IMAGE,
+    "document_file": FileCategory.DOCUMENTATION,
+    "unknown_file": FileCategory.UNKNOWN,
+}
+
 # File signatures (magic numbers) for binary file detection
 # Format: (offset, signature bytes, description)
 FILE_SIGNATURES = [
@@ -60,20 +70,49 @@ FILE_SIGNATURES = [
     (0, b'%PDF', 'PDF document'),
 ]
 
+# Signatures at the start of the file, checked with one bytes.startswith call
+FILE_SIGNATURE_PREFIXES = tuple(
+    signature for offset, signature, _ in FILE_SIGNATURES if offset == 0
+)
+
+# Signatures further into the file, as (offset, signature bytes) pairs
+FILE_SIGNATURES_AT_OFFSET = [
+    (offset, signature) for offset, signature, _ in FILE_SIGNATURES if offset != 0
+]
+
 # Shebang patterns for script detection
 SHEBANG_PATTERNS = {
-    r'^#!/usr/bin/env\s+python': 'Python',
+    r'^#!/usr/bin/env[^\S\n]+python': 'Python',
     r'^#!/usr/bin/python': 'Python',
     r'^#!/bin/bash': 'Bash',
     r'^#!/bin/sh': 'Shell',
-    r'^#!/usr/bin/env\s+node': 'JavaScript',
+    r'^#!/usr/bin/env[^\S\n]+node': 'JavaScript',
     r'^#!/usr/bin/node': 'JavaScript',
-    r'^#!/usr/bin/env\s+ruby': 'Ruby',
+    r'^#!/usr/bin/env[^\S\n]+ruby': 'Ruby',
     r'^#!/usr/bin/ruby': 'Ruby',
-    r'^#!/usr/bin/env\s+perl': 'Perl',
+    r'^#!/usr/bin/env[^\S\n]+perl': 'Perl',
     r'^#!/usr/bin/perl': 'Perl',
 }
 
+# All shebang patterns as one alternation, with a named group per pattern
+SHEBANG_REGEX = re.compile("|".join(
+    f"(?P<shebang{index}>{pattern})" for index, pattern in enumerate(SHEBANG_PATTERNS)
+))
+
+# Language for each named group of SHEBANG_REGEX
+SHEBANG_GROUPS = {
+    f"shebang{index}": language for index, language in enumerate(SHEBANG_PATTERNS.values())
+}
+
+# First non-whitespace character, located without copying the content
+FIRST_CHAR_REGEX = re.compile(r'\S')
+
+# Shared decoder for the JSON content check
+JSON_DECODER = json.JSONDecoder()
+
+# Match a 'key: value' line, shared by content detection and the YAML fallback
+YAML_KEY_REGEX = re.compile(r'^\s*[a-zA-Z0-9_]+:\s*[^\s]', re.MULTILINE)
+
 # Content patterns for language detection
 CONTENT_PATTERNS = {
     # Python patterns
@@ -113,7 +152,7 @@ CONTENT_PATTERNS = {
     ],
     # YAML patterns
     'YAML': [
-        re.compile(r'^\s*[a-zA-Z0-9_]+:\s*[^\s]', re.MULTILINE),
+        YAML_KEY_REGEX,
     ],
     # Markdown patterns
     'Markdown': [
@@ -122,6 +161,28 @@ CONTENT_PATTERNS = {
     ],
 }
 
+# Substring each content pattern needs in order to match, in the same order as
+# CONTENT_PATTERNS; a cheap 'in' test skips the regex when it cannot match
+CONTENT_PATTERN_LITERALS = {
+    'Python': ('import', 'from', 'def', 'class'),
+    'JavaScript': ('import', 'const', 'let', 'var', 'function'),
+    'Java': ('package', 'import', 'public', 'private'),
+    'XML': ('<?xml',),
+    'HTML': ('<!', '<'),
+    'JSON': ('{',),
+    'YAML': (':',),
+    'Markdown': ('#', ''),
+}
+
+# (language, [(literal, pattern), ...]) pairs used by detect_language_from_content
+CONTENT_CHECKS = [
+    (language, list(zip(CONTENT_PATTERN_LITERALS[language], patterns)))
+    for language, patterns in CONTENT_PATTERNS.items()
+]
+
+# Bytes read before deciding whether a file is binary
+BINARY_SNIFF_SIZE = 512
+
 # File encodings to try when reading files
 ENCODINGS_TO_TRY = [
     'utf-8',
@@ -152,40 +213,49 @@ def read_file_with_encoding(file_path: Path, max_read_size: int = 8192) -> Tuple
     if not os.access(file_path, os.R_OK):
         raise FileAccessError(file_path, f"Permission denied: {file_path}")
     
-    # First, try to detect if it's a binary file
+    # Read the start of the file once; binary detection and decoding both use it.
+    # The reads are unbuffered so the bytes land directly in raw_data.
     try:
-        with open(file_path, 'rb') as f:
-            raw_data = f.read(max_read_size)
+        with open(file_path, 'rb', buffering=0) as f:
+            raw_data = f.read(min(BINARY_SNIFF_SIZE, max_read_size))
             
-            # Check for null bytes which often indicate binary data
-            if b'\x00' in raw_data:
+            # Null bytes or a leading signature mark most binary files, so
+            # those are rejected before the rest of the window is read
+            if b'\x00' in raw_data or raw_data.startswith(FILE_SIGNATURE_PREFIXES):
                 return None, "binary"
             
-            # Check for file signatures
-            for offset, signature, description in FILE_SIGNATURES:
-                if raw_data[offset:offset+len(signature)] == signature:
+            if len(raw_data) == BINARY_SNIFF_SIZE and max_read_size > BINARY_SNIFF_SIZE:
+                rest = f.read(max_read_size - BINARY_SNIFF_SIZE)
+                if b'\x00' in rest:
                     return None, "binary"
+                raw_data += rest
     except Exception as e:
         raise FileAccessError(file_path, f"Error reading file: {str(e)}")
     
-    # Try different encodings
+    # Check for signatures that are not at the start of the file
+    if any(
+        raw_data.startswith(signature, offset) for offset, signature in FILE_SIGNATURES_AT_OFFSET
+    ):
+        return None, "binary"
+    
+    # A multi-byte character may be cut off at the end of a full read
+    truncated = len(raw_data) == max_read_size
+    
+    # Try different encodings on the bytes already read
     for encoding in ENCODINGS_TO_TRY:
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read(max_read_size)
-                return content, encoding
+            decoder = codecs.getincrementaldecoder(encoding)()
+            content = decoder.decode(raw_data, final=not truncated)
         except UnicodeDecodeError:
             continue
-        except Exception as e:
-            raise FileAccessError(file_path, f"Error reading file with encoding {encoding}: {str(e)}")
+        
+        # Translate newlines the same way as reading in text mode
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content, encoding
     
-    # If all encodings fail, try binary mode and decode with latin-1 as a fallback
-    try:
-        with open(file_path, 'rb') as f:
-            raw_data = f.read(max_read_size)
-            return raw_data.decode('latin-1'), 'latin-1'
-    except Exception as e:
-        raise FileAccessError(file_path, f"Error reading file in binary mode: {str(e)}")
+    # If all encodings fail, decode with latin-1 as a fallback
+    return raw_data.decode('latin-1'), 'latin-1'
 
 
 def detect_shebang(content: str) -> Optional[str]:
@@ -200,13 +270,9 @@ def detect_shebang(content: str) -> Optional[str]:
     if not content or not content.startswith('#!'):
         return None
     
-    first_line = content.split('\n', 1)[0]
-    
-    for pattern, language in SHEBANG_PATTERNS.items():
-        if re.match(pattern, first_line):
-            return language
-    
-    return None
+    # The patterns never match past a newline, so only the first line is examined
+    match = SHEBANG_REGEX.match(content)
+    return SHEBANG_GROUPS[match.lastgroup] if match else None
 
 
 def detect_language_from_content(content: str) -> Optional[str]:
@@ -226,23 +292,22 @@ def detect_language_from_content(content: str) -> Optional[str]:
     if shebang_language:
         return shebang_language
     
-    # Check content patterns
-    matches = {}
+    # Check content patterns, keeping the language with the most matches;
+    # on a tie the language listed first in CONTENT_PATTERNS wins
+    best_language = None
+    best_count = 0
     
-    for language, patterns in CONTENT_PATTERNS.items():
+    for language, checks in CONTENT_CHECKS:
         match_count = 0
-        for pattern in patterns:
-            if pattern.search(content):
+        for literal, pattern in checks:
+            if literal in content and pattern.search(content):
                 match_count += 1
         
-        if match_count > 0:
-            matches[language] = match_count
-    
-    if matches:
-        # Return the language with the most matches
-        return max(matches.items(), key=lambda x: x[1])[0]
+        if match_count > best_count:
+            best_language = language
+            best_count = match_count
     
-    return None
+    return best_language
 
 
 def get_mime_type(file_path: Path) -> str:
@@ -258,6 +323,27 @@ def get_mime_type(file_path: Path) -> str:
     return mime_type or "application/octet-stream"
 
 
+def _starts_with_json(content: str, start: int) -> bool:
+    """Check whether content starts with a JSON value.
+    
+    Decoding stops at the end of the first value, and a value cut off by the
+    end of the sniffed buffer still counts, so large JSON files are accepted
+    from their prefix.
+    
+    Args:
+        content: File content to check
+        start: Index of the first non-whitespace character
+        
+    Returns:
+        True if the content starts with a JSON value
+    """
+    try:
+        JSON_DECODER.raw_decode(content, start)
+    except json.JSONDecodeError as e:
+        return e.pos >= len(content)
+    return True
+
+
 def detect_file_type(file_path: Path, use_content_detection: bool = True) -> Tuple[str, FileCategory, str]:
     """Detect the type of a file using multiple methods.
     
@@ -279,16 +365,11 @@ def detect_file_type(file_path: Path, use_content_detection: bool = True) -> Tup
     detection_method = "extension"
     
     # Map file_type to FileCategory
-    category_mapping = {
-        "source_file": FileCategory.SOURCE_CODE,
-        "dependency_file": FileCategory.DEPENDENCY_FILE,
-        "binary_file": FileCategory.BINARY,
-        "image_file": FileCategory.IMAGE,
-        "document_file": FileCategory.DOCUMENTATION,
-        "unknown_file": FileCategory.UNKNOWN,
-    }
+    category = FILE_TYPE_CATEGORIES.get(file_type, FileCategory.UNKNOWN)
     
-    category = category_mapping.get(file_type, FileCategory.UNKNOWN)
+    # The extension settled both the language and the category, so don't read the file
+    if language is not None and category is not FileCategory.UNKNOWN:
+        return language, category, detection_method
     
     # If extension-based detection was inconclusive and content detection is enabled
     if (language is None or category == FileCategory.UNKNOWN) and use_content_detection:
@@ -308,25 +389,23 @@ def detect_file_type(file_path: Path, use_content_detection: bool = True) -> Tup
             
             # Check for specific file types based on content
             if content and not content_language:
-                # Check for XML
-                if content.lstrip().startswith('<?xml') or content.lstrip().startswith('<'):
+                first_char_match = FIRST_CHAR_REGEX.search(content)
+                first_char = first_char_match.group() if first_char_match else ''
+                
+                # Check for XML, including '<?xml' declarations
+                if first_char == '<':
                     language = "XML"
                     category = FileCategory.DATA
                     detection_method = "content_pattern"
                 
                 # Check for JSON
-                elif content.lstrip().startswith('{') or content.lstrip().startswith('['):
-                    try:
-                        import json
-                        json.loads(content)
-                        language = "JSON"
-                        category = FileCategory.DATA
-                        detection_method = "content_pattern"
-                    except json.JSONDecodeError:
-                        pass
+                elif first_char in ('{', '[') and _starts_with_json(content, first_char_match.start()):
+                    language = "JSON"
+                    category = FileCategory.DATA
+                    detection_method = "content_pattern"
                 
                 # Check for YAML
-                elif re.search(r'^\s*[a-zA-Z0-9_]+:\s*[^\s]', content, re.MULTILINE):
+                elif YAML_KEY_REGEX.search(content):
                     language = "YAML"
                     category = FileCategory.DATA
                     detection_method = "content_pattern"
@@ -366,6 +445,22 @@ def detect_file_type(file_path: Path, use_content_detection: bool = True) -> Tup
     return language, category, detection_method
 
 
+def _detect_file_type_or_none(file_path: Path) -> Optional[Tuple[str, FileCategory, str]]:
+    """Detect the type of a file, logging failures instead of raising.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        Result of detect_file_type, or None if detection failed
+    """
+    try:
+        return detect_file_type(file_path)
+    except Exception as e:
+        logging.warning(f"Error detecting file type for {file_path}: {e}")
+        return None
+
+
 def analyze_file_types(directory_path: Path, ignore_patterns: List[str] = None) -> Dict[str, Dict[str, int]]:
     """Analyze file types in a directory.
     
@@ -391,24 +486,39 @@ def analyze_file_types(directory_path: Path, ignore_patterns: List[str] = None)
     if not os.access(directory_path, os.R_OK):
         raise DirectoryAccessError(directory_path, f"Permission denied: {directory_path}")
     
+    try:
+        return count_file_types(scan_directory(str(directory_path), ignore_patterns))
+    except Exception as e:
+        logging.error(f"Error scanning directory for file types: {e}")
+        raise DirectoryAccessError(directory_path, f"Error scanning directory: {str(e)}")
+
+
+def count_file_types(file_paths: Iterable[Path]) -> Dict[str, Dict[str, int]]:
+    """Count the detected file types of the given files.
+    
+    Files whose type cannot be detected are logged and skipped.
+    
+    Args:
+        file_paths: Paths of the files to detect
+        
+    Returns:
+        Dictionary mapping file categories to counts of file types
+    """
     result: Dict[str, Dict[str, int]] = {}
     
     for category in FileCategory:
         result[category.value] = {}
     
-    try:
-        for file_path in scan_directory(str(directory_path), ignore_patterns):
-            try:
-                file_type, category, _ = detect_file_type(file_path)
-                
-                if file_type:
-                    category_dict = result[category.value]
-                    category_dict[file_type] = category_dict.get(file_type, 0) + 1
-            except Exception as e:
-                logging.warning(f"Error detecting file type for {file_path}: {e}")
-    except Exception as e:
-        logging.error(f"Error scanning directory for file types: {e}")
-        raise DirectoryAccessError(directory_path, f"Error scanning directory: {str(e)}")
+    # Detection runs in worker threads; counting stays in this thread
+    with ThreadPoolExecutor(max_workers=FILE_TYPE_WORKERS) as executor:
+        for detection in executor.map(_detect_file_type_or_none, file_paths):
+            if detection is None:
+                continue
+            
+            file_type, category, _ = detection
+            if file_type:
+                category_dict = result[category.value]
+                category_dict[file_type] = category_dict.get(file_type, 0) + 1
     
     # Remove empty categories
     result = {k: v for k, v in result.items() if v}
@@ -1,14 +1,18 @@
 """Utilities for file operations and detection."""
 
+import functools
 import logging
 import os
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from dependency_scanner_tool.exceptions import (
     DirectoryAccessError,
     LanguageDetectionError,
 )
+from dependency_scanner_tool.scanner import scan_directory
 
 # Mapping of file extensions to programming languages
 LANGUAGE_EXTENSIONS = {
@@ -104,6 +108,52 @@ SPECIAL_FILES = {
     "composer.json": "PHP-Dependencies",
 }
 
+# Extensions of files that are not source code
+BINARY_EXTENSIONS = frozenset({".exe", ".dll", ".so", ".dylib", ".bin", ".dat", ".o"})
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp", ".svg", ".ico", ".webp"})
+DOCUMENT_EXTENSIONS = frozenset({
+    ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".odt", ".ods", ".odp"
+})
+
+
+def _file_type_for_language(language: str) -> str:
+    """Classify a file with a known language.
+    
+    Args:
+        language: Language name from get_file_language
+        
+    Returns:
+        "dependency_file" for dependency definitions, otherwise "source_file"
+    """
+    # If it's a dependency file, return that classification
+    if language.endswith("-Dependencies"):
+        return "dependency_file"
+    
+    # Otherwise it's a source file
+    return "source_file"
+
+
+# (language, file type) of every special file name
+FILE_INFO_BY_NAME: Dict[str, Tuple[str, str]] = {
+    name: (language, _file_type_for_language(language))
+    for name, language in SPECIAL_FILES.items()
+}
+
+# (language, file type) of every known lowercase extension; a language
+# takes precedence over the non-source extension sets
+FILE_INFO_BY_EXTENSION: Dict[str, Tuple[Optional[str], str]] = {
+    **{extension: (None, "binary_file") for extension in BINARY_EXTENSIONS},
+    **{extension: (None, "image_file") for extension in IMAGE_EXTENSIONS},
+    **{extension: (None, "document_file") for extension in DOCUMENT_EXTENSIONS},
+    **{
+        extension: (language, _file_type_for_language(language))
+        for extension, language in LANGUAGE_EXTENSIONS.items()
+    },
+}
+
+# (language, file type) of a file that is not recognized at all
+UNKNOWN_FILE_INFO: Tuple[Optional[str], str] = (None, "unknown_file")
+
 
 def get_file_language(file_path: Path) -> Optional[str]:
     """Determine the programming language of a file based on its extension.
@@ -114,13 +164,7 @@ def get_file_language(file_path: Path) -> Optional[str]:
     Returns:
         Language name or None if the language cannot be determined
     """
-    # Check if it's a special file first
-    if file_path.name in SPECIAL_FILES:
-        return SPECIAL_FILES[file_path.name]
-    
-    # Check by extension
-    extension = file_path.suffix.lower()
-    return LANGUAGE_EXTENSIONS.get(extension)
+    return _file_info(file_path)[0]
 
 
 def get_file_type(file_path: Path) -> str:
@@ -132,33 +176,40 @@ def get_file_type(file_path: Path) -> str:
     Returns:
         File type classification
     """
-    language = get_file_language(file_path)
-    
-    if language:
-        # If it's a dependency file, return that classification
-        if language.endswith("-Dependencies"):
-            return "dependency_file"
-        
-        # Otherwise it's a source file
-        return "source_file"
+    return _file_info(file_path)[1]
+
+
+def _file_info(file_path: Path) -> Tuple[Optional[str], str]:
+    """Look up the language and file type of a file.
     
-    # Binary files
-    binary_extensions = {".exe", ".dll", ".so", ".dylib", ".bin", ".dat", ".o"}
-    if file_path.suffix.lower() in binary_extensions:
-        return "binary_file"
+    Special file names take precedence over the extension.
     
-    # Image files
-    image_extensions = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".svg", ".ico", ".webp"}
-    if file_path.suffix.lower() in image_extensions:
-        return "image_file"
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        Tuple of (language or None, file type classification)
+    """
+    info = FILE_INFO_BY_NAME.get(file_path.name)
+    if info is None:
+        info = _file_info_for_suffix(file_path.suffix)
+    return info
+
+
+@functools.lru_cache(maxsize=4096)
+def _file_info_for_suffix(suffix: str) -> Tuple[Optional[str], str]:
+    """Look up the language and file type for a file suffix, ignoring case.
     
-    # Document files
-    doc_extensions = {".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".odt", ".ods", ".odp"}
-    if file_path.suffix.lower() in doc_extensions:
-        return "document_file"
+    File names are nearly all unique while suffixes repeat, so lookups are
+    cached per suffix rather than per file.
     
-    # Default to unknown
-    return "unknown_file"
+    Args:
+        suffix: File suffix, including the leading dot
+        
+    Returns:
+        Tuple of (language or None, file type classification)
+    """
+    return FILE_INFO_BY_EXTENSION.get(suffix.lower(), UNKNOWN_FILE_INFO)
 
 
 def analyze_directory_extensions(directory_path: Path, ignore_patterns: List[str] = None) -> Dict[str, int]:
@@ -174,30 +225,7 @@ def analyze_directory_extensions(directory_path: Path, ignore_patterns: List[str
     Raises:
         DirectoryAccessError: If the directory cannot be accessed
     """
-    from dependency_scanner_tool.scanner import scan_directory
-    
-    if not directory_path.exists():
-        raise DirectoryAccessError(directory_path, f"Directory does not exist: {directory_path}")
-    
-    if not directory_path.is_dir():
-        raise DirectoryAccessError(directory_path, f"Not a directory: {directory_path}")
-    
-    if not os.access(directory_path, os.R_OK):
-        raise DirectoryAccessError(directory_path, f"Permission denied: {directory_path}")
-    
-    extension_counts: Dict[str, int] = {}
-    
-    try:
-        for file_path in scan_directory(str(directory_path), ignore_patterns):
-            extension = file_path.suffix.lower()
-            if extension:
-                extension_counts[extension] = extension_counts.get(extension, 0) + 1
-    except Exception as e:
-        logging.error(f"Error analyzing directory extensions: {e}")
-        # Re-raise as our custom exception
-        raise DirectoryAccessError(directory_path, f"Error analyzing directory: {str(e)}")
-    
-    return extension_counts
+    return _classify_directory(directory_path, ignore_patterns).extension_counts
 
 
 def detect_languages(directory_path: Path, ignore_patterns: List[str] = None) -> Dict[str, float]:
@@ -214,8 +242,90 @@ def detect_languages(directory_path: Path, ignore_patterns: List[str] = None) ->
         DirectoryAccessError: If the directory cannot be accessed
         LanguageDetectionError: If language detection fails
     """
-    from dependency_scanner_tool.scanner import scan_directory
+    classification = _classify_directory(directory_path, ignore_patterns)
+    return _language_percentages(directory_path, classification)
+
+
+def detect_dependency_files(directory_path: Path, ignore_patterns: List[str] = None) -> List[Path]:
+    """Detect dependency definition files in a directory.
     
+    Args:
+        directory_path: Path to the directory to analyze
+        ignore_patterns: Optional list of patterns to ignore
+        
+    Returns:
+        List of paths to dependency files
+        
+    Raises:
+        DirectoryAccessError: If the directory cannot be accessed
+    """
+    return _classify_directory(directory_path, ignore_patterns).dependency_files
+
+
+def scan_and_classify(
+    directory_path: Path,
+    ignore_patterns: List[str] = None,
+    file_paths: Optional[List[Path]] = None,
+) -> Tuple[Dict[str, float], List[Path], Dict[str, Dict[str, int]]]:
+    """Detect languages, dependency files and file types in one directory walk.
+    
+    Gives the same results as calling detect_languages, detect_dependency_files
+    and analyze_file_types, but walks the directory only once.
+    
+    Args:
+        directory_path: Path to the directory to analyze
+        ignore_patterns: Optional list of patterns to ignore
+        file_paths: Optional list that receives every scanned path, so callers
+            can pick further files without walking the directory again
+        
+    Returns:
+        Tuple of (language percentages, dependency file paths, file type counts
+        per category)
+        
+    Raises:
+        DirectoryAccessError: If the directory cannot be accessed
+        LanguageDetectionError: If language detection fails
+    """
+    from dependency_scanner_tool.file_type_detector import count_file_types
+    
+    if file_paths is None:
+        file_paths = []
+    classification = _classify_directory(directory_path, ignore_patterns, file_paths)
+    return (
+        _language_percentages(directory_path, classification),
+        classification.dependency_files,
+        count_file_types(file_paths),
+    )
+
+
+@dataclass
+class _DirectoryClassification:
+    """Per-file classification results gathered during one directory walk."""
+    extension_counts: Dict[str, int] = field(default_factory=Counter)
+    language_counts: Dict[str, int] = field(default_factory=dict)
+    total_files: int = 0
+    errors: List[str] = field(default_factory=list)
+    dependency_files: List[Path] = field(default_factory=list)
+
+
+def _classify_directory(
+    directory_path: Path,
+    ignore_patterns: Optional[List[str]],
+    file_paths: Optional[List[Path]] = None,
+) -> _DirectoryClassification:
+    """Walk a directory once and classify every file by name and extension.
+    
+    Args:
+        directory_path: Path to the directory to analyze
+        ignore_patterns: Optional list of patterns to ignore
+        file_paths: Optional list that receives every scanned path
+        
+    Returns:
+        Extension counts, language counts and dependency files of the directory
+        
+    Raises:
+        DirectoryAccessError: If the directory cannot be accessed
+    """
     if not directory_path.exists():
         raise DirectoryAccessError(directory_path, f"Directory does not exist: {directory_path}")
     
@@ -225,25 +335,64 @@ def detect_languages(directory_path: Path, ignore_patterns: List[str] = None) ->
     if not os.access(directory_path, os.R_OK):
         raise DirectoryAccessError(directory_path, f"Permission denied: {directory_path}")
     
-    language_counts: Dict[str, int] = {}
-    total_files = 0
-    errors = []
+    classification = _DirectoryClassification()
+    extension_counts = classification.extension_counts
+    language_counts = classification.language_counts
     
     try:
-        for file_path in scan_directory(str(directory_path), ignore_patterns):
+        # Entries carry the name and lowercased suffix as strings; a Path is
+        # only built for files that end up in a result
+        for entry in scan_directory(str(directory_path), ignore_patterns, as_entries=True):
+            if file_paths is not None:
+                file_paths.append(Path(entry.path))
+            
+            extension = entry.suffix
+            if extension:
+                extension_counts[extension] += 1
+            
             try:
-                language = get_file_language(file_path)
-                if language and not language.endswith("-Dependencies"):
-                    language_counts[language] = language_counts.get(language, 0) + 1
-                    total_files += 1
+                language = SPECIAL_FILES.get(entry.name)
+                if language is None:
+                    language = _file_info_for_suffix(extension)[0]
             except Exception as e:
                 # Log the error but continue processing other files
-                logging.warning(f"Error detecting language for {file_path}: {e}")
-                errors.append(f"{file_path}: {str(e)}")
+                logging.warning(f"Error detecting language for {entry.path}: {e}")
+                classification.errors.append(f"{entry.path}: {str(e)}")
+                continue
+            
+            if not language:
+                continue
+            if language.endswith("-Dependencies"):
+                classification.dependency_files.append(Path(entry.path))
+            else:
+                language_counts[language] = language_counts.get(language, 0) + 1
+                classification.total_files += 1
     except Exception as e:
-        logging.error(f"Error scanning directory for language detection: {e}")
+        logging.error(f"Error scanning directory: {e}")
         raise DirectoryAccessError(directory_path, f"Error scanning directory: {str(e)}")
     
+    return classification
+
+
+def _language_percentages(
+    directory_path: Path, classification: _DirectoryClassification
+) -> Dict[str, float]:
+    """Turn per-language file counts into usage percentages.
+    
+    Args:
+        directory_path: Directory the files were found in, for error messages
+        classification: Results of walking the directory
+        
+    Returns:
+        Dictionary mapping language names to their usage percentage
+        
+    Raises:
+        LanguageDetectionError: If no language was detected and errors occurred
+    """
+    language_counts = classification.language_counts
+    total_files = classification.total_files
+    errors = classification.errors
+    
     # Calculate percentages
     language_percentages: Dict[str, float] = {}
     if total_files > 0:
@@ -262,45 +411,3 @@ def detect_languages(directory_path: Path, ignore_patterns: List[str] = None) ->
         raise LanguageDetectionError(None, error_msg)
     
     return language_percentages
-
-
-def detect_dependency_files(directory_path: Path, ignore_patterns: List[str] = None) -> List[Path]:
-    """Detect dependency definition files in a directory.
-    
-    Args:
-        directory_path: Path to the directory to analyze
-        ignore_patterns: Optional list of patterns to ignore
-        
-    Returns:
-        List of paths to dependency files
-        
-    Raises:
-        DirectoryAccessError: If the directory cannot be accessed
-    """
-    from dependency_scanner_tool.scanner import scan_directory
-    
-    if not directory_path.exists():
-        raise DirectoryAccessError(directory_path, f"Directory does not exist: {directory_path}")
-    
-    if not directory_path.is_dir():
-        raise DirectoryAccessError(directory_path, f"Not a directory: {directory_path}")
-    
-    if not os.access(directory_path, os.R_OK):
-        raise DirectoryAccessError(directory_path, f"Permission denied: {directory_path}")
-    
-    dependency_files: List[Path] = []
-    
-    try:
-        for file_path in scan_directory(str(directory_path), ignore_patterns):
-            try:
-                language = get_file_language(file_path)
-                if language and language.endswith("-Dependencies"):
-                    dependency_files.append(file_path)
-            except Exception as e:
-                # Log the error but continue processing other files
-                logging.warning(f"Error processing dependency file {file_path}: {e}")
-    except Exception as e:
-        logging.error(f"Error scanning directory for dependency files: {e}")
-        raise DirectoryAccessError(directory_path, f"Error scanning directory: {str(e)}")
-    
-    return dependency_files
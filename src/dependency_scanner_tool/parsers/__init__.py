@@ -1,10 +1,28 @@
 """Dependency file parsers for the dependency scanner."""
 
-# Import all parsers to register them
-# These imports are needed for registration even though they appear unused
-# ruff: noqa: F401
+from dependency_scanner_tool.parsers.base import ParserRegistry
 from dependency_scanner_tool.parsers.requirements_txt import RequirementsTxtParser
 from dependency_scanner_tool.parsers.pyproject_toml import PyprojectTomlParser
 from dependency_scanner_tool.parsers.build_sbt import BuildSbtParser
+from dependency_scanner_tool.parsers.pip_dependencies import PipDependencyParser
+from dependency_scanner_tool.parsers.devfile_parser import DevfileParser
+from dependency_scanner_tool.parsers.conda_environment import CondaEnvironmentParser
+from dependency_scanner_tool.parsers.maven_pom import MavenPomParser
+from dependency_scanner_tool.parsers.gradle_build import GradleBuildParser
+
+# Built-in parsers, in lookup priority order. The devfile parser comes before
+# the conda parser so its own can_parse is asked first for YAML files.
+PARSER_TABLE = {
+    "requirements_txt": RequirementsTxtParser,
+    "pyproject_toml": PyprojectTomlParser,
+    "build_sbt": BuildSbtParser,
+    "pip_dependencies": PipDependencyParser,
+    "devfile": DevfileParser,
+    "conda_environment": CondaEnvironmentParser,
+    "maven_pom": MavenPomParser,
+    "gradle_build": GradleBuildParser,
+}
+
+ParserRegistry.register_all(PARSER_TABLE)
 
 __all__ = []
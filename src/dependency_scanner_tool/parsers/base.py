@@ -3,7 +3,7 @@
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Type
+from typing import Dict, List, Optional, Set, Tuple, Type
 
 from dependency_scanner_tool.scanner import Dependency
 
@@ -58,6 +58,14 @@ class ParserRegistry:
     
     _parsers: Dict[str, Type[DependencyParser]] = {}
     
+    # Dispatch tables, rebuilt whenever a parser is registered. The file name
+    # and extension tables map to the registration index and class of the
+    # first parser that claims them. Parsers that override can_parse cannot be
+    # tabulated and are asked directly, in registration order.
+    _parsers_by_filename: Dict[str, Tuple[int, Type[DependencyParser]]] = {}
+    _parsers_by_extension: Dict[str, Tuple[int, Type[DependencyParser]]] = {}
+    _custom_parsers: List[Tuple[int, Type[DependencyParser]]] = []
+    
     @classmethod
     def register(cls, parser_name: str, parser_class: Type[DependencyParser]) -> None:
         """Register a parser.
@@ -67,8 +75,20 @@ class ParserRegistry:
             parser_class: Parser class
         """
         cls._parsers[parser_name] = parser_class
+        cls._build_dispatch_tables()
         logging.debug(f"Registered parser: {parser_name}")
     
+    @classmethod
+    def register_all(cls, parsers: Dict[str, Type[DependencyParser]]) -> None:
+        """Register several parsers at once, in the order given.
+        
+        Args:
+            parsers: Dictionary of parser names to parser classes
+        """
+        cls._parsers.update(parsers)
+        cls._build_dispatch_tables()
+        logging.debug(f"Registered parsers: {', '.join(parsers)}")
+    
     @classmethod
     def get_parser(cls, parser_name: str) -> Optional[Type[DependencyParser]]:
         """Get a parser by name.
@@ -100,8 +120,33 @@ class ParserRegistry:
         Returns:
             Parser class or None if no parser can handle the file
         """
-        for parser_class in cls._parsers.values():
+        # The earliest registered of the file name and extension matches
+        match = cls._parsers_by_filename.get(file_path.name)
+        extension_match = cls._parsers_by_extension.get(file_path.suffix.lower())
+        if match is None or (extension_match is not None and extension_match[0] < match[0]):
+            match = extension_match
+        
+        # Parsers with their own can_parse win if they were registered first
+        for index, parser_class in cls._custom_parsers:
+            if match is not None and index > match[0]:
+                break
             if parser_class.can_parse(file_path):
                 return parser_class
         
-        return None
+        return match[1] if match is not None else None
+    
+    @classmethod
+    def _build_dispatch_tables(cls) -> None:
+        """Rebuild the file name and extension dispatch tables from the registered parsers."""
+        cls._parsers_by_filename = {}
+        cls._parsers_by_extension = {}
+        cls._custom_parsers = []
+        
+        for index, parser_class in enumerate(cls._parsers.values()):
+            if parser_class.can_parse.__func__ is not DependencyParser.can_parse.__func__:
+                cls._custom_parsers.append((index, parser_class))
+                continue
+            for filename in parser_class.supported_filenames:
+                cls._parsers_by_filename.setdefault(filename, (index, parser_class))
+            for extension in parser_class.supported_extensions:
+                cls._parsers_by_extension.setdefault(extension, (index, parser_class))
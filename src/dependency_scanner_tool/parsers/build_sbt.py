@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import List, Set
 
 from dependency_scanner_tool.exceptions import ParsingError
-from dependency_scanner_tool.parsers.base import DependencyParser, ParserRegistry
+from dependency_scanner_tool.parsers.base import DependencyParser
 from dependency_scanner_tool.scanner import Dependency, DependencyType
 
 
@@ -17,15 +17,21 @@ class BuildSbtParser(DependencyParser):
     supported_extensions: Set[str] = {".sbt"}
     supported_filenames: Set[str] = {"build.sbt"}
     
-    # Regular expressions for dependency extraction
+    # Regular expressions for dependency extraction, matched against the raw
+    # file bytes
     # Match patterns like: "org.example" %% "library" % "1.0.0"
     # or "org.example" % "library" % "1.0.0"
+    # The organization and artifact spans are captured in a lookahead and
+    # consumed by backreference, which makes them atomic: a failed match never
+    # backtracks through a long quoted span one byte at a time.
     DEP_REGEX = re.compile(
-        r'[\"\']([^\"\']+)[\"\'][\s\n]*%%?[\s\n]*[\"\']([^\"\']+)[\"\'][\s\n]*%[\s\n]*[\"\']([^\"\']+)[\"\']'
+        rb'["\'](?=([^"\']+))\1["\']\s*%%?\s*'
+        rb'["\'](?=([^"\']+))\2["\']\s*%\s*'
+        rb'["\']([^"\']+)["\']'
     )
     
     # Match libraryDependencies += ... pattern
-    LIB_DEP_LINE_REGEX = re.compile(r'libraryDependencies\s*\+?=')
+    LIB_DEP_LINE_REGEX = re.compile(rb'libraryDependencies\s*\+?=')
     
     def parse(self, file_path: Path) -> List[Dependency]:
         """Parse dependencies from a build.sbt file.
@@ -45,58 +51,56 @@ class BuildSbtParser(DependencyParser):
         dependencies = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Match against the raw bytes; only the captured groups are decoded
+            content = file_path.read_bytes()
+            
+            # Find all dependency declarations
+            for match in self.DEP_REGEX.finditer(content):
+                organization, artifact, version = (
+                    group.decode('utf-8') for group in match.groups()
+                )
                 
-                # Find all dependency declarations
-                for match in self.DEP_REGEX.finditer(content):
-                    organization, artifact, version = match.groups()
-                    
-                    # Create a dependency name in the format org:artifact
-                    name = f"{organization}:{artifact}"
-                    
-                    dependencies.append(
-                        Dependency(
-                            name=name,
-                            version=version,
-                            source_file=str(file_path),
-                            dependency_type=DependencyType.UNKNOWN
-                        )
-                    )
+                # Create a dependency name in the format org:artifact
+                name = f"{organization}:{artifact}"
                 
-                # If we couldn't find any dependencies, check if this is actually a build.sbt file
-                if not dependencies and not self._is_valid_build_sbt(content):
-                    logging.warning(f"File {file_path} appears to be an invalid build.sbt file")
+                dependencies.append(
+                    Dependency(
+                        name=name,
+                        version=version,
+                        source_file=str(file_path),
+                        dependency_type=DependencyType.UNKNOWN
+                    )
+                )
+            
+            # If we couldn't find any dependencies, check if this is actually a build.sbt file
+            if not dependencies and not self._is_valid_build_sbt(content):
+                logging.warning(f"File {file_path} appears to be an invalid build.sbt file")
         
         except Exception as e:
             raise ParsingError(file_path, f"Error parsing build.sbt file: {str(e)}")
         
         return dependencies
     
-    def _is_valid_build_sbt(self, content: str) -> bool:
+    def _is_valid_build_sbt(self, content: bytes) -> bool:
         """Check if the content appears to be a valid build.sbt file.
         
         Args:
-            content: File content to check
+            content: Raw file content to check
             
         Returns:
             True if the content appears to be a valid build.sbt file
         """
         # Check for common build.sbt patterns
-        if "scalaVersion" in content:
+        if b"scalaVersion" in content:
             return True
         
-        if "organization" in content:
+        if b"organization" in content:
             return True
         
-        if "libraryDependencies" in content:
+        if b"libraryDependencies" in content:
             return True
         
-        if "sbt." in content:
+        if b"sbt." in content:
             return True
         
         return False
-
-
-# Register the parser
-ParserRegistry.register("build_sbt", BuildSbtParser)
@@ -1,13 +1,20 @@
 """Parser for conda environment files."""
 
 import logging
+import re
 from pathlib import Path
 from typing import List, Optional, Set, Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    # Fall back to the pure-Python loader when PyYAML is built without LibYAML
+    from yaml import SafeLoader as YamlLoader
+
 from dependency_scanner_tool.exceptions import ParsingError
-from dependency_scanner_tool.parsers.base import DependencyParser, ParserRegistry
+from dependency_scanner_tool.parsers.base import DependencyParser
 from dependency_scanner_tool.scanner import Dependency, DependencyType
 
 
@@ -38,6 +45,10 @@ class CondaEnvironmentParser(DependencyParser):
     supported_extensions: Set[str] = {".yml", ".yaml"}
     supported_filenames: Set[str] = {"environment.yml", "environment.yaml"}
     
+    # Match the first version operator in a dependency spec
+    # (==, >=, <=, ~=, =, > or <)
+    SPEC_OPERATOR_REGEX = re.compile(r'[=<>]=?|~=')
+    
     def parse(self, file_path: Path) -> List[Dependency]:
         """Parse dependencies from a conda environment file.
         
@@ -52,73 +63,67 @@ class CondaEnvironmentParser(DependencyParser):
         """
         dependencies = []
         
+        # Parse YAML content straight from the file; only reading and parsing
+        # can fail, the checks below handle any document shape
         try:
-            # Read the file content
             with open(file_path, "r") as f:
-                content = f.read()
-            
-            # Skip empty files
-            if not content.strip():
-                return []
-            
-            # Parse YAML content
-            try:
-                env_data = yaml.safe_load(content)
-            except yaml.YAMLError as e:
-                raise ParsingError(file_path, f"Invalid YAML format: {str(e)}")
-            
-            # Check if the file has a dependencies section
-            if not env_data or not isinstance(env_data, dict) or "dependencies" not in env_data:
-                logging.warning(f"No dependencies found in {file_path}")
-                return []
+                env_data = yaml.load(f, Loader=YamlLoader)
+        except yaml.YAMLError as e:
+            raise ParsingError(file_path, f"Invalid YAML format: {str(e)}") from e
+        except (OSError, UnicodeDecodeError) as e:
+            raise ParsingError(file_path, f"Error parsing conda environment file: {str(e)}") from e
+        
+        # Skip empty files
+        if env_data is None:
+            return []
+        
+        # Check if the file has a dependencies section
+        if not env_data or not isinstance(env_data, dict) or "dependencies" not in env_data:
+            logging.warning(f"No dependencies found in {file_path}")
+            return []
+        
+        # Extract dependencies
+        deps_list = env_data["dependencies"]
+        if not deps_list or not isinstance(deps_list, list):
+            logging.warning(f"Dependencies section is empty or not a list in {file_path}")
+            return []
+        
+        # Process conda dependencies
+        for dep_item in deps_list:
+            # Skip pip section (we'll handle it separately)
+            if isinstance(dep_item, dict) and "pip" in dep_item:
+                continue
             
-            # Extract dependencies
-            deps_list = env_data["dependencies"]
-            if not deps_list or not isinstance(deps_list, list):
-                logging.warning(f"Dependencies section is empty or not a list in {file_path}")
-                return []
+            # Skip the pip package itself
+            if isinstance(dep_item, str) and dep_item == "pip":
+                dependencies.append(
+                    Dependency(
+                        name="pip",
+                        version=None,
+                        source_file=str(file_path),
+                        dependency_type=DependencyType.UNKNOWN
+                    )
+                )
+                continue
             
-            # Process conda dependencies
-            for dep_item in deps_list:
-                # Skip pip section (we'll handle it separately)
-                if isinstance(dep_item, dict) and "pip" in dep_item:
-                    continue
-                
-                # Skip the pip package itself
-                if isinstance(dep_item, str) and dep_item == "pip":
+            # Process regular conda dependency
+            if isinstance(dep_item, str):
+                name, version = self._parse_dependency_spec(dep_item)
+                if name:
                     dependencies.append(
                         Dependency(
-                            name="pip",
-                            version=None,
+                            name=name,
+                            version=version,
                             source_file=str(file_path),
                             dependency_type=DependencyType.UNKNOWN
                         )
                     )
-                    continue
-                
-                # Process regular conda dependency
-                if isinstance(dep_item, str):
-                    name, version = self._parse_dependency_spec(dep_item)
-                    if name:
-                        dependencies.append(
-                            Dependency(
-                                name=name,
-                                version=version,
-                                source_file=str(file_path),
-                                dependency_type=DependencyType.UNKNOWN
-                            )
-                        )
-            
-            # Process pip dependencies if present
-            pip_deps = self._extract_pip_dependencies(deps_list, file_path)
-            dependencies.extend(pip_deps)
-            
-            return dependencies
         
-        except Exception as e:
-            if not isinstance(e, ParsingError):
-                raise ParsingError(file_path, f"Error parsing conda environment file: {str(e)}")
-            raise
+        # Process pip dependencies if present
+        pip_deps = self._extract_pip_dependencies(deps_list, file_path)
+        dependencies.extend(pip_deps)
+        
+        return dependencies
     
     def _parse_dependency_spec(self, spec: str) -> tuple[str, Optional[str]]:
         """Parse a conda dependency specification.
@@ -133,19 +138,21 @@ class CondaEnvironmentParser(DependencyParser):
         if not spec or not isinstance(spec, str):
             return "", None
         
-        # Split by version operators
-        for operator in ["==", ">=", "<=", ">", "<", "~="]:
-            if operator in spec:
-                parts = spec.split(operator, 1)
-                return parts[0].strip(), f"{operator}{parts[1].strip()}"
+        # No version specified; every operator contains one of these
+        # characters, so most plain package names skip the regex entirely
+        if "=" not in spec and "<" not in spec and ">" not in spec:
+            return spec.strip(), None
         
-        # Handle the simple equals operator (=) separately
-        if "=" in spec:
-            parts = spec.split("=", 1)
-            return parts[0].strip(), parts[1].strip()
+        # Split at the first version operator
+        match = self.SPEC_OPERATOR_REGEX.search(spec)
+        name = spec[:match.start()].strip()
+        version = spec[match.end():].strip()
+        operator = match.group()
         
-        # No version specified
-        return spec.strip(), None
+        # The simple equals operator (=) is not kept in the version
+        if operator == "=":
+            return name, version
+        return name, f"{operator}{version}"
     
     def _extract_pip_dependencies(self, deps_list: List[Any], file_path: Path) -> List[Dependency]:
         """Extract pip dependencies from the conda environment file.
@@ -182,6 +189,3 @@ class CondaEnvironmentParser(DependencyParser):
                             )
         
         return pip_deps
-
-# Register the parser
-ParserRegistry.register("conda_environment", CondaEnvironmentParser)
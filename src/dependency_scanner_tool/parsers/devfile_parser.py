@@ -12,7 +12,7 @@ except ImportError:
     yaml = None
 
 from dependency_scanner_tool.exceptions import ParsingError
-from dependency_scanner_tool.parsers.base import DependencyParser, ParserRegistry
+from dependency_scanner_tool.parsers.base import DependencyParser
 from dependency_scanner_tool.scanner import Dependency, DependencyType
 
 
@@ -25,6 +25,9 @@ class DevfileParser(DependencyParser):
     supported_extensions: Set[str] = set()  # Empty to avoid conflicts
     supported_filenames: Set[str] = {"devfile.yaml", "devfile.yml"}
     
+    # Every devfile pattern accepted by can_parse has one of these extensions
+    YAML_EXTENSIONS: Set[str] = {".yaml", ".yml"}
+    
     # Container image regex for extracting name and version
     IMAGE_REGEX = re.compile(r'^([^:/@]+(?:/[^:/@]+)*?)(?::([^@/]+))?(?:@sha256:[a-f0-9]{64})?$')
     
@@ -42,6 +45,11 @@ class DevfileParser(DependencyParser):
         Returns:
             True if this parser can handle the file, False otherwise
         """
+        # Reject non-YAML files before looking at the name or parent directory
+        suffix = file_path.suffix.lower()
+        if suffix not in cls.YAML_EXTENSIONS:
+            return False
+        
         # Check standard filename patterns first - highest priority  
         base_result = super().can_parse(file_path)
         if base_result:
@@ -54,11 +62,10 @@ class DevfileParser(DependencyParser):
             return True
         
         # Check for YAML files with devfile indicators in filename only (not path) - high priority
-        if file_path.suffix.lower() in {'.yaml', '.yml'}:
-            filename_lower = file_path.name.lower()
-            filename_match = 'devfile' in filename_lower or 'devpod' in filename_lower
-            if filename_match:
-                return True
+        filename_lower = file_path.name.lower()
+        filename_match = 'devfile' in filename_lower or 'devpod' in filename_lower
+        if filename_match:
+            return True
         
         # For now, disable content-based detection to avoid false positives
         # Only rely on filename patterns for reliable detection
@@ -426,7 +433,7 @@ class DevfileParser(DependencyParser):
         Returns:
             True if DevPod usage is detected, False otherwise
         """
-        if not project_path.exists() or not project_path.is_dir():
+        if not project_path.is_dir():
             logging.warning(f"Project path does not exist or is not a directory: {project_path}")
             return False
         
@@ -454,7 +461,3 @@ class DevfileParser(DependencyParser):
         except Exception as e:
             logging.warning(f"Error scanning for DevPod usage in {project_path}: {e}")
             return False
-
-
-# Register the parser
-ParserRegistry.register("devfile", DevfileParser)
\ No newline at end of file
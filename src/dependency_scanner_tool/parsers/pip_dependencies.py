@@ -2,20 +2,23 @@
 
 import json
 import logging
+import re
 import subprocess
 import sys
+from importlib.metadata import distributions
 from pathlib import Path
-from typing import List, Set
+from typing import Dict, List, Optional, Set
 
 from dependency_scanner_tool.exceptions import ParsingError
-from dependency_scanner_tool.parsers.base import DependencyParser, ParserRegistry
+from dependency_scanner_tool.parsers.base import DependencyParser
 from dependency_scanner_tool.scanner import Dependency, DependencyType
 
 
 class PipDependencyParser(DependencyParser):
     """Parser for Python pip dependencies.
     
-    This parser extracts installed packages from pip's internal database.
+    This parser extracts installed packages from pip's internal database,
+    reading the distribution metadata directly instead of running pip.
     It can work in two modes:
     1. Global mode: Extracts all packages installed in the current Python environment
     2. Virtual environment mode: Extracts packages from a specified virtual environment
@@ -26,6 +29,14 @@ class PipDependencyParser(DependencyParser):
     supported_extensions: Set[str] = set()
     supported_filenames: Set[str] = set()
     
+    # Runs of these characters are equivalent in distribution names (PEP 503)
+    NAME_SEPARATOR_REGEX = re.compile(r"[-_.]+")
+    
+    # pyvenv.cfg setting that makes a venv also see the base interpreter's packages
+    SYSTEM_SITE_PACKAGES_REGEX = re.compile(
+        r"^\s*include-system-site-packages\s*=\s*true\s*$", re.IGNORECASE | re.MULTILINE
+    )
+    
     def parse(self, file_path: Path) -> List[Dependency]:
         """Parse dependencies from pip's internal database.
         
@@ -41,11 +52,13 @@ class PipDependencyParser(DependencyParser):
         dependencies = []
         
         try:
-            # Get installed packages using pip list in JSON format
-            result = self._run_pip_list()
-            
-            # Parse the JSON output
-            packages = json.loads(result)
+            # Read the installed packages' metadata in-process; pip list is only
+            # started if that fails
+            try:
+                packages = self._list_distributions()
+            except Exception as e:
+                logging.warning(f"Cannot read installed package metadata, using pip list: {e}")
+                packages = json.loads(self._run_pip_list())
             
             # Convert to dependencies
             for package in packages:
@@ -81,11 +94,17 @@ class PipDependencyParser(DependencyParser):
         dependencies = []
         
         try:
-            # Get installed packages using pip list in JSON format from the venv
-            result = self._run_pip_list_in_venv(venv_path)
-            
-            # Parse the JSON output
-            packages = json.loads(result)
+            # Read the metadata in the venv's site-packages directly when they
+            # are all it can see; otherwise ask the venv's own pip
+            packages = None
+            site_packages = self._venv_site_packages(venv_path)
+            if site_packages:
+                try:
+                    packages = self._list_distributions(site_packages)
+                except Exception as e:
+                    logging.warning(f"Cannot read package metadata in {venv_path}, using pip list: {e}")
+            if packages is None:
+                packages = json.loads(self._run_pip_list_in_venv(venv_path))
             
             # Convert to dependencies
             for package in packages:
@@ -106,11 +125,65 @@ class PipDependencyParser(DependencyParser):
         
         return dependencies
     
-    def _run_pip_list(self) -> str:
+    def _list_distributions(self, path: Optional[List[str]] = None) -> List[Dict[str, str]]:
+        """List installed distributions from their metadata, like ``pip list``.
+        
+        Args:
+            path: Directories to search, or None for the running interpreter's sys.path
+            
+        Returns:
+            List of dictionaries with 'name' and 'version', sorted by name
+        """
+        found = distributions() if path is None else distributions(path=path)
+        
+        packages: Dict[str, Dict[str, str]] = {}
+        for dist in found:
+            name = dist.metadata.get("Name")
+            # Skip distributions with broken metadata, as pip does
+            if not name:
+                continue
+            # The first copy on the path is the one that gets imported
+            key = self.NAME_SEPARATOR_REGEX.sub("-", name).lower()
+            if key not in packages:
+                packages[key] = {"name": name, "version": dist.version}
+        
+        return [packages[key] for key in sorted(packages)]
+    
+    def _venv_site_packages(self, venv_path: Path) -> List[str]:
+        """Find the site-packages directories of a virtual environment.
+        
+        Args:
+            venv_path: Path to the virtual environment
+            
+        Returns:
+            Existing site-packages directories, or an empty list if the venv
+            also sees the system packages and pip has to be asked instead
+        """
+        pyvenv_cfg = venv_path / "pyvenv.cfg"
+        if pyvenv_cfg.is_file() and self.SYSTEM_SITE_PACKAGES_REGEX.search(
+            pyvenv_cfg.read_text(encoding="utf-8", errors="replace")
+        ):
+            return []
+        
+        # lib/pythonX.Y/site-packages on Unix-like systems, Lib/site-packages on Windows
+        candidates = sorted(venv_path.glob("lib/python*/site-packages"))
+        candidates.append(venv_path / "Lib" / "site-packages")
+        return [str(candidate) for candidate in candidates if candidate.is_dir()]
+    
+    @staticmethod
+    def _decode_stderr(stderr) -> str:
+        """Decode captured stderr for error messages."""
+        if isinstance(stderr, bytes):
+            return stderr.decode("utf-8", errors="replace")
+        return stderr
+    
+    def _run_pip_list(self) -> bytes:
         """Run pip list command and return the output.
         
+        The output is kept as bytes; json.loads decodes it in a single pass.
+        
         Returns:
-            JSON string with installed packages
+            JSON document (UTF-8 bytes) with installed packages
             
         Raises:
             RuntimeError: If pip list command fails
@@ -121,23 +194,23 @@ class PipDependencyParser(DependencyParser):
             result = subprocess.run(
                 [sys.executable, "-m", "pip", "list", "--format=json"],
                 capture_output=True,
-                text=True,
                 check=True
             )
             return result.stdout
         except subprocess.CalledProcessError as e:
+            stderr = self._decode_stderr(e.stderr)
             logging.error(f"Error running pip list: {e}")
-            logging.error(f"Stderr: {e.stderr}")
-            raise RuntimeError(f"Failed to run pip list: {e.stderr}")
+            logging.error(f"Stderr: {stderr}")
+            raise RuntimeError(f"Failed to run pip list: {stderr}")
     
-    def _run_pip_list_in_venv(self, venv_path: Path) -> str:
+    def _run_pip_list_in_venv(self, venv_path: Path) -> bytes:
         """Run pip list command in a virtual environment and return the output.
         
         Args:
             venv_path: Path to the virtual environment
             
         Returns:
-            JSON string with installed packages
+            JSON document (UTF-8 bytes) with installed packages
             
         Raises:
             RuntimeError: If pip list command fails
@@ -157,15 +230,11 @@ class PipDependencyParser(DependencyParser):
             result = subprocess.run(
                 [str(pip_path), "list", "--format=json"],
                 capture_output=True,
-                text=True,
                 check=True
             )
             return result.stdout
         except subprocess.CalledProcessError as e:
+            stderr = self._decode_stderr(e.stderr)
             logging.error(f"Error running pip list in venv: {e}")
-            logging.error(f"Stderr: {e.stderr}")
-            raise RuntimeError(f"Failed to run pip list in venv: {e.stderr}")
-
-
-# Register the parser
-ParserRegistry.register("pip_dependencies", PipDependencyParser)
+            logging.error(f"Stderr: {stderr}")
+            raise RuntimeError(f"Failed to run pip list in venv: {stderr}")
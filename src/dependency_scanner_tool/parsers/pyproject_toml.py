@@ -14,7 +14,7 @@ except ImportError:
         tomllib = None
 
 from dependency_scanner_tool.exceptions import ParsingError
-from dependency_scanner_tool.parsers.base import DependencyParser, ParserRegistry
+from dependency_scanner_tool.parsers.base import DependencyParser
 from dependency_scanner_tool.scanner import Dependency, DependencyType
 
 
@@ -299,7 +299,3 @@ class PyprojectTomlParser(DependencyParser):
                     )
         
         return dependencies
-
-
-# Register the parser
-ParserRegistry.register("pyproject_toml", PyprojectTomlParser)
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import List, Optional, Set, Tuple
 
 from dependency_scanner_tool.exceptions import ParsingError
-from dependency_scanner_tool.parsers.base import DependencyParser, ParserRegistry
+from dependency_scanner_tool.parsers.base import DependencyParser
 from dependency_scanner_tool.scanner import Dependency, DependencyType
 
 
@@ -156,7 +156,3 @@ class RequirementsTxtParser(DependencyParser):
                 version = version_part.split('!=', 1)[0] + '!=' + version_part.split('!=', 1)[1].split(',')[0].strip()
         
         return name, version
-
-
-# Register the parser
-ParserRegistry.register("requirements_txt", RequirementsTxtParser)
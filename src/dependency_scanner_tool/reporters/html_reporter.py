@@ -12,6 +12,7 @@ import jinja2
 from dependency_scanner_tool.scanner import ScanResult, Dependency
 from dependency_scanner_tool.reporters.json_reporter import JSONReporter
 from dependency_scanner_tool.api_analyzers.base import ApiCall, ApiAuthType
+from dependency_scanner_tool.result_cache import CACHE_ENV_VAR, DEFAULT_CACHE_DIR
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,9 @@ logger = logging.getLogger(__name__)
 class HTMLReporter:
     """Reporter for generating HTML reports from scan results."""
 
+    # Jinja2 environment shared by all reporters so templates are compiled once per process
+    _env: Optional[jinja2.Environment] = None
+
     def __init__(self, 
                  output_path: Optional[Path] = None,
                  template_path: Optional[Path] = None,
@@ -44,11 +48,46 @@ class HTMLReporter:
         self._load_category_status()
         
         # Set up Jinja2 environment
-        template_dir = os.path.join(os.path.dirname(__file__), 'templates')
-        self.jinja_env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(template_dir),
-            autoescape=jinja2.select_autoescape(['html', 'xml'])
-        )
+        self.jinja_env = self._get_environment()
+
+    @classmethod
+    def _get_environment(cls) -> jinja2.Environment:
+        """Get the Jinja2 environment shared by all reporter instances.
+        
+        The bundled templates do not change at runtime, so auto-reload is
+        disabled. When DEP_SCANNER_CACHE=1 the compiled templates are also
+        stored on disk and reused by later runs.
+        
+        Returns:
+            Jinja2 environment
+        """
+        if cls._env is None:
+            template_dir = os.path.join(os.path.dirname(__file__), 'templates')
+            cls._env = jinja2.Environment(
+                loader=jinja2.FileSystemLoader(template_dir),
+                autoescape=jinja2.select_autoescape(['html', 'xml']),
+                auto_reload=False,
+                bytecode_cache=cls._get_bytecode_cache()
+            )
+        return cls._env
+
+    @staticmethod
+    def _get_bytecode_cache() -> Optional[jinja2.BytecodeCache]:
+        """Create the on-disk template bytecode cache if caching is enabled.
+        
+        Returns:
+            Bytecode cache, or None if caching is disabled or unavailable
+        """
+        if os.environ.get(CACHE_ENV_VAR) != "1":
+            return None
+        
+        cache_dir = DEFAULT_CACHE_DIR / "jinja2"
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Template bytecode cache disabled, cannot create {cache_dir}: {e}")
+            return None
+        return jinja2.FileSystemBytecodeCache(str(cache_dir))
 
     def _load_category_status(self):
         """Load category statuses from config.yaml."""
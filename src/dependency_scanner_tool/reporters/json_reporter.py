@@ -3,9 +3,15 @@
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, TextIO
 from collections import defaultdict
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the json module for serialization
+    orjson = None
+
 from dependency_scanner_tool.scanner import ScanResult, Dependency
 from dependency_scanner_tool.categorization import DependencyCategorizer
 from dependency_scanner_tool.api_analyzers.base import ApiCall, ApiAuthType
@@ -59,20 +65,60 @@ class JSONReporter:
         result_dict = self._convert_to_dict(result)
         
         # Convert to JSON string
-        json_output = json.dumps(result_dict, indent=2)
+        json_output = self._dumps(result_dict)
         
         # Write to file if output path is specified
         if self.output_path:
             try:
-                with open(self.output_path, 'w') as f:
+                # orjson output holds raw non-ASCII characters, so never use the locale encoding
+                with open(self.output_path, 'w', encoding='utf-8') as f:
                     f.write(json_output)
                 logger.info(f"JSON report written to {self.output_path}")
-            except (IOError, OSError, FileNotFoundError) as e:
+            except (IOError, OSError, FileNotFoundError, UnicodeError) as e:
                 logger.error(f"Failed to write JSON report to {self.output_path}: {e}")
                 # Don't re-raise the exception, just log it and continue
         
         return json_output
     
+    def write_report(self, result: ScanResult, stream: TextIO) -> None:
+        """Write a JSON report of scan results to a stream.
+        
+        Unlike generate_report, the JSON text is written out directly instead
+        of being returned, so the whole report is never held as a string.
+        
+        Args:
+            result: ScanResult object containing the scan results
+            stream: Writable text stream, such as sys.stdout
+        """
+        result_dict = self._convert_to_dict(result)
+        
+        # orjson writes UTF-8 bytes, so only use it for UTF-8 streams
+        buffer = getattr(stream, 'buffer', None)
+        encoding = (getattr(stream, 'encoding', None) or '').replace('-', '').replace('_', '').lower()
+        if orjson is not None and buffer is not None and encoding == 'utf8':
+            # Write the encoded bytes past the text layer, flushing it first to keep ordering
+            stream.flush()
+            buffer.write(orjson.dumps(result_dict, option=orjson.OPT_INDENT_2))
+            buffer.write(b"\n")
+            buffer.flush()
+        else:
+            json.dump(result_dict, stream, indent=2)
+            stream.write("\n")
+    
+    @staticmethod
+    def _dumps(result_dict: Dict[str, Any]) -> str:
+        """Serialize a report dictionary as JSON indented by two spaces.
+        
+        Args:
+            result_dict: Report dictionary
+            
+        Returns:
+            JSON string
+        """
+        if orjson is not None:
+            return orjson.dumps(result_dict, option=orjson.OPT_INDENT_2).decode('utf-8')
+        return json.dumps(result_dict, indent=2)
+    
     def _deduplicate_dependencies(self, dependencies: List[Dependency]) -> List[Dict[str, Any]]:
         """Deduplicate dependencies by name while preserving usage information.
         
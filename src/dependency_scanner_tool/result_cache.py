@@ -0,0 +1,252 @@
+"""Persistent cache of per-file scan results keyed on file metadata."""
+
+import atexit
+import logging
+import os
+import pickle
+import shelve
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows, where the cache is opened without a lock
+    fcntl = None
+
+from dependency_scanner_tool import __version__
+
+# Environment variable that enables the on-disk cache when set to "1"
+CACHE_ENV_VAR = "DEP_SCANNER_CACHE"
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "dep_scanner"
+
+
+class ResultCache:
+    """Shelve-backed cache of per-file results.
+    
+    Entries are stored under the absolute path of the file together with a
+    fingerprint of its modification time, size and the cache version, so an
+    edited file or an upgraded tool misses the cache and the new result
+    replaces the old entry. Only one process writes to a database at a time;
+    others run without the cache while it is held.
+    """
+    
+    # Bump when the stored entry format changes
+    CACHE_VERSION = 2
+    
+    def __init__(self, cache_path: Path, version: str = ""):
+        """Initialize the cache.
+        
+        Args:
+            cache_path: Path of the shelve database (created on first use)
+            version: Version of the code producing the cached results
+        """
+        self.cache_path = cache_path
+        self.version = f"{self.CACHE_VERSION}:{__version__}:{version}"
+        self._shelf: Optional[shelve.Shelf] = None
+        self._lock_file: Optional[int] = None
+        self._disabled = False
+    
+    @classmethod
+    def from_environment(cls, name: str, version: str = "") -> Optional["ResultCache"]:
+        """Create a cache if it is enabled through the environment.
+        
+        Args:
+            name: Base name of the cache database inside the cache directory
+            version: Version of the code producing the cached results
+        
+        Returns:
+            ResultCache instance, or None if caching is disabled
+        """
+        if os.environ.get(CACHE_ENV_VAR) != "1":
+            return None
+        return cls(DEFAULT_CACHE_DIR / name, version)
+    
+    def key_for(self, file_path: Path) -> Optional[Tuple[str, str]]:
+        """Build the cache key for a file.
+        
+        Args:
+            file_path: Path to the file
+        
+        Returns:
+            Tuple of the absolute path and the file's fingerprint, or None if
+            the file cannot be stat'ed
+        """
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return None
+        return (
+            os.path.abspath(file_path),
+            f"{self.version}:{stat_result.st_mtime_ns}:{stat_result.st_size}"
+        )
+    
+    def get(self, key: Optional[Tuple[str, str]]) -> Optional[Any]:
+        """Get a cached result.
+        
+        Args:
+            key: Cache key from key_for
+        
+        Returns:
+            Cached value, or None on a miss
+        """
+        if key is None:
+            return None
+        shelf = self._open()
+        if shelf is None:
+            return None
+        path, fingerprint = key
+        try:
+            entry = shelf.get(path)
+        except Exception as e:
+            logging.debug(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+        # Entries for an older version of the file or of the tool are misses
+        if entry is None or entry[0] != fingerprint:
+            return None
+        return entry[1]
+    
+    def put(self, key: Optional[Tuple[str, str]], value: Any) -> None:
+        """Store a result.
+        
+        Args:
+            key: Cache key from key_for
+            value: Picklable value to store
+        """
+        if key is None:
+            return
+        shelf = self._open()
+        if shelf is not None:
+            path, fingerprint = key
+            # Replace any entry for an older version of the file
+            shelf[path] = (fingerprint, value)
+    
+    def flush(self) -> None:
+        """Write pending changes to disk."""
+        if self._shelf is not None:
+            self._shelf.sync()
+    
+    def close(self) -> None:
+        """Close the underlying database and release its lock."""
+        if self._shelf is not None:
+            self._shelf.close()
+            self._shelf = None
+        if self._lock_file is not None:
+            os.close(self._lock_file)
+            self._lock_file = None
+    
+    def _open(self) -> Optional[shelve.Shelf]:
+        """Open the database on first use.
+        
+        Returns:
+            Open shelf, or None if the database cannot be opened
+        """
+        if self._shelf is None and not self._disabled:
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                if not self._lock():
+                    # Another process (e.g. a pool worker) is writing to the database
+                    logging.debug(f"Result cache {self.cache_path} is in use, running without it")
+                    self._disabled = True
+                    return None
+                self._shelf = shelve.open(str(self.cache_path))
+            except Exception as e:
+                logging.warning(f"Result cache disabled, cannot open {self.cache_path}: {e}")
+                self.close()
+                self._disabled = True
+                return None
+            atexit.register(self.close)
+        return self._shelf
+    
+    def _lock(self) -> bool:
+        """Take an exclusive lock on the database for this process.
+        
+        Returns:
+            True if the lock was taken (or locking is unavailable), False if
+            another process holds it
+        """
+        if fcntl is None:
+            return True
+        lock_file = os.open(f"{self.cache_path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(lock_file)
+            return False
+        self._lock_file = lock_file
+        return True
+
+
+class DigestCache:
+    """Directory of pickled results keyed by a digest of the input.
+    
+    Each entry is its own file and is written atomically, so the cache can be
+    shared by several worker processes without locking.
+    """
+    
+    def __init__(self, cache_dir: Path):
+        """Initialize the cache.
+        
+        Args:
+            cache_dir: Directory holding the entries (created on first write)
+        """
+        self.cache_dir = cache_dir
+    
+    @classmethod
+    def from_environment(cls, name: str) -> Optional["DigestCache"]:
+        """Create a cache if it is enabled through the environment.
+        
+        Args:
+            name: Name of the cache directory inside the cache directory
+        
+        Returns:
+            DigestCache instance, or None if caching is disabled
+        """
+        if os.environ.get(CACHE_ENV_VAR) != "1":
+            return None
+        return cls(DEFAULT_CACHE_DIR / name)
+    
+    def get(self, digest: str) -> Optional[Any]:
+        """Get a cached result.
+        
+        Args:
+            digest: Hex digest identifying the entry
+        
+        Returns:
+            Cached value, or None on a miss
+        """
+        try:
+            with open(self._path(digest), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.debug(f"Ignoring unreadable cache entry {digest}: {e}")
+            return None
+    
+    def put(self, digest: str, value: Any) -> None:
+        """Store a result.
+        
+        Args:
+            digest: Hex digest identifying the entry
+            value: Picklable value to store
+        """
+        path = self._path(digest)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            logging.debug(f"Cannot write cache entry {digest}: {e}")
+    
+    def _path(self, digest: str) -> Path:
+        """Get the file holding an entry, fanned out by the first two characters."""
+        return self.cache_dir / digest[:2] / f"{digest[2:]}.pkl"
@@ -1,17 +1,18 @@
 """Core scanner module for analyzing project dependencies."""
 
 import fnmatch
+import functools
 import logging
 import os
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Set
+from typing import Dict, Iterator, List, NamedTuple, Optional, Pattern, Set, Tuple, Union
 
 from dependency_scanner_tool.exceptions import (
     DirectoryAccessError,
-    ParsingError,
     LanguageDetectionError,
     PackageManagerDetectionError,
 )
@@ -165,9 +166,36 @@ class DependencyClassifier:
         
         return DependencyType.UNKNOWN
 
+@functools.lru_cache(maxsize=32)
+def _compile_ignore_patterns(
+    ignore_patterns: Tuple[str, ...]
+) -> Tuple[Pattern[str], Optional[Pattern[str]]]:
+    """Compile ignore patterns into single regex alternations.
+    
+    Args:
+        ignore_patterns: Tuple of glob patterns to ignore
+        
+    Returns:
+        Tuple of (regex matching any pattern, regex matching any directory
+        pattern with its trailing '/' removed, or None if there are none)
+    """
+    def combine(patterns: List[str]) -> Pattern[str]:
+        # fnmatch.fnmatch normalizes case on both sides; the candidates are
+        # normalized the same way in _should_ignore
+        return re.compile(
+            "|".join(f"(?:{fnmatch.translate(os.path.normcase(p))})" for p in patterns)
+        )
+    
+    dir_patterns = [pattern[:-1] for pattern in ignore_patterns if pattern.endswith('/')]
+    return combine(list(ignore_patterns)), combine(dir_patterns) if dir_patterns else None
+
 def _should_ignore(file_path: Path, root_dir: Path, ignore_patterns: List[str]) -> bool:
     """Check if a file should be ignored based on patterns.
     
+    A path is ignored if any pattern matches its relative path, its name, or
+    any parent directory (as a relative path or by name). Patterns ending in
+    '/' additionally match parent directories with the slash removed.
+    
     Args:
         file_path: Path to the file to check
         root_dir: Root directory of the scan
@@ -185,44 +213,66 @@ def _should_ignore(file_path: Path, root_dir: Path, ignore_patterns: List[str])
     try:    
         # Get the relative path from the root directory
         rel_path = file_path.relative_to(root_dir)
-        rel_path_str = str(rel_path)
-        
-        for pattern in ignore_patterns:
-            # Check for directory pattern (ending with '/')
-            if pattern.endswith('/'):
-                dir_pattern = pattern[:-1]
-                # Check if any parent directory matches the pattern
-                parent_dirs = [str(p) for p in rel_path.parents]
-                if any(fnmatch.fnmatch(d, dir_pattern) for d in parent_dirs):
-                    return True
-            
-            # Check for direct file match
-            if fnmatch.fnmatch(rel_path_str, pattern) or fnmatch.fnmatch(file_path.name, pattern):
-                return True
-            
-            # Check if any parent directory matches the pattern (for directory exclusions without trailing slash)
-            for parent in rel_path.parents:
-                if fnmatch.fnmatch(str(parent), pattern):
-                    return True
-                # Also check just the directory name
-                if fnmatch.fnmatch(parent.name, pattern):
-                    return True
     except ValueError as e:
         # If the file_path is not relative to root_dir, log a warning and re-raise
         logging.warning(f"Error checking ignore pattern: {e}")
         raise ValueError(f"File path {file_path} is not relative to root directory {root_dir}")
+    
+    # All patterns are tested with one regex call per candidate string
+    any_pattern, dir_pattern = _compile_ignore_patterns(tuple(ignore_patterns))
+    
+    normcase = os.path.normcase
+    
+    # Check for direct file match
+    if any_pattern.match(normcase(str(rel_path))) or any_pattern.match(normcase(file_path.name)):
+        return True
+    
+    for parent in rel_path.parents:
+        parent_str = normcase(str(parent))
+        # Check for directory pattern (ending with '/')
+        if dir_pattern is not None and dir_pattern.match(parent_str):
+            return True
+        # Check the parent path and just the directory name
+        if any_pattern.match(parent_str) or any_pattern.match(normcase(parent.name)):
+            return True
             
     return False
 
-def scan_directory(directory: str, ignore_patterns: Optional[List[str]] = None) -> Iterator[Path]:
+class ScanEntry(NamedTuple):
+    """A file found by scan_directory, described by plain strings."""
+    path: str
+    name: str
+    suffix: str
+
+
+def _suffix_of(name: str) -> str:
+    """Get the lowercased suffix of a file name, following Path.suffix rules.
+    
+    Args:
+        name: File name
+        
+    Returns:
+        Suffix including the leading dot, or an empty string if there is none
+    """
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[dot:].lower()
+    return ''
+
+
+def scan_directory(
+    directory: str, ignore_patterns: Optional[List[str]] = None, as_entries: bool = False
+) -> Iterator[Union[Path, ScanEntry]]:
     """Scan a directory recursively and yield file paths.
     
     Args:
         directory: Path to the directory to scan
         ignore_patterns: Optional list of patterns to ignore
+        as_entries: Yield ScanEntry tuples instead of Path objects, for callers
+            that only need names and suffixes
         
     Returns:
-        Iterator of Path objects for each file found
+        Iterator of Path objects (or ScanEntry tuples) for each file found
         
     Raises:
         DirectoryAccessError: If the directory cannot be accessed
@@ -245,13 +295,13 @@ def scan_directory(directory: str, ignore_patterns: Optional[List[str]] = None)
         for root, dirs, files in os.walk(directory_path, topdown=True):
             root_path = Path(root)
             
-            # Process files
+            # Process files; paths stay strings until a Path is actually needed
             for file in files:
-                file_path = root_path / file
+                file_path = os.path.join(root, file)
                 
                 try:
                     # Skip files that should be ignored
-                    if _should_ignore(file_path, root_dir, ignore_patterns):
+                    if ignore_patterns and _should_ignore(Path(file_path), root_dir, ignore_patterns):
                         continue
                 
                     # Check file permissions
@@ -271,7 +321,10 @@ def scan_directory(directory: str, ignore_patterns: Optional[List[str]] = None)
                         try:
                             with open(file_path, 'rb') as f:
                                 f.read(1)
-                            yield file_path
+                            if as_entries:
+                                yield ScanEntry(file_path, file, _suffix_of(file))
+                            else:
+                                yield root_path / file
                         except (PermissionError, OSError) as e:
                             logging.debug(f"Cannot open file {file_path}: {e}")
                             continue
@@ -336,7 +389,8 @@ class DependencyScanner:
         analyzer_manager=None,
         api_analyzer_manager=None,
         api_dependency_classifier=None,
-        ignore_patterns=None
+        ignore_patterns=None,
+        parallel=False
     ):
         """Initialize the dependency scanner.
         
@@ -348,6 +402,8 @@ class DependencyScanner:
             api_analyzer_manager: API analyzer manager instance
             api_dependency_classifier: API dependency classifier instance
             ignore_patterns: List of patterns to ignore
+            parallel: Whether to analyze large sets of source files in a process pool
+                      (off by default; the command line interface turns it on)
         """
         from dependency_scanner_tool.parsers.parser_manager import ParserManager
         from dependency_scanner_tool.analyzers.analyzer_manager import AnalyzerManager
@@ -359,6 +415,7 @@ class DependencyScanner:
         self.analyzer_manager = analyzer_manager or AnalyzerManager()
         self.api_analyzer_manager = api_analyzer_manager or ApiCallAnalyzerManager()
         self.ignore_patterns = ignore_patterns or []
+        self.parallel = parallel
         
         # Load config for API dependency classification
         config = {}
@@ -402,8 +459,22 @@ class DependencyScanner:
         dependencies: List[Dependency] = []
         api_calls: List[ApiCall] = []  # New list for API calls
         
-        # Detect languages
-        if self.language_detector is not None:
+        # Walk the project once; dependency and source files are picked from this list
+        from dependency_scanner_tool.file_utils import scan_and_classify
+        project_files: List[Path] = []
+        walk_languages: Dict[str, float] = {}
+        try:
+            walk_languages, _, _ = scan_and_classify(project_path_obj, self.ignore_patterns, project_files)
+        except LanguageDetectionError as e:
+            if self.language_detector is None:
+                error_msg = f"Language detection failed: {str(e)}"
+                logging.error(error_msg)
+                errors.append(error_msg)
+        
+        # Detect languages, preferring a configured detector over the walk's counts
+        if self.language_detector is None:
+            languages = walk_languages
+        else:
             try:
                 logging.info(f"Detecting languages in {project_path}")
                 languages = self.language_detector.detect_languages(project_path_obj)
@@ -433,7 +504,7 @@ class DependencyScanner:
                 errors.append(error_msg)
         
         # Find dependency files
-        dependency_files = self._find_dependency_files(project_path_obj)
+        dependency_files = self._find_dependency_files(project_files)
         logging.info(f"Found {len(dependency_files)} dependency files")
         
         # Parse dependency files
@@ -452,7 +523,7 @@ class DependencyScanner:
                 # Extract virtual environment dependencies if provided
                 if venv_path:
                     venv_path_obj = Path(venv_path)
-                    if venv_path_obj.exists() and venv_path_obj.is_dir():
+                    if venv_path_obj.is_dir():
                         logging.info(f"Extracting dependencies from virtual environment: {venv_path}")
                         venv_deps = self.parser_manager.extract_venv_dependencies(venv_path_obj)
                         dependencies.extend(venv_deps)
@@ -466,7 +537,7 @@ class DependencyScanner:
         if conda_env_path:
             try:
                 conda_env_path_obj = Path(conda_env_path)
-                if conda_env_path_obj.exists() and conda_env_path_obj.is_file():
+                if conda_env_path_obj.is_file():
                     logging.info(f"Extracting dependencies from conda environment file: {conda_env_path}")
                     conda_deps = self.parser_manager.extract_conda_environment(conda_env_path_obj)
                     dependencies.extend(conda_deps)
@@ -481,7 +552,7 @@ class DependencyScanner:
                 errors.append(error_msg)
         
         # Find source files for analysis
-        source_files = self._find_source_files(project_path_obj)
+        source_files = self._find_source_files(project_files)
         logging.info(f"Found {len(source_files)} source files for analysis")
         
         # Analyze import statements if requested
@@ -489,15 +560,11 @@ class DependencyScanner:
             try:
                 logging.info(f"Analyzing source code imports in {project_path}")
                 
-                # Analyze each source file
-                for file_path in source_files:
-                    try:
-                        file_dependencies = self.analyzer_manager.analyze_file(file_path)
-                        dependencies.extend(file_dependencies)
-                    except ParsingError as e:
-                        error_msg = f"Error analyzing imports in {file_path}: {str(e)}"
-                        logging.error(error_msg)
-                        errors.append(error_msg)
+                # Analyze source files, spread across worker processes for large projects
+                for _, file_dependencies in self.analyzer_manager.iter_analyze_files(
+                    source_files, parallel=self.parallel, errors=errors
+                ):
+                    dependencies.extend(file_dependencies)
             except Exception as e:
                 error_msg = f"Unexpected error during import analysis: {str(e)}"
                 logging.error(error_msg)
@@ -592,11 +659,11 @@ class DependencyScanner:
             logging.info(f"Infrastructure usage: {infra_summary}")
         logging.info(f"Errors encountered: {len(result.errors)}")
     
-    def _find_dependency_files(self, project_path: Path) -> List[Path]:
+    def _find_dependency_files(self, project_files: List[Path]) -> List[Path]:
         """Find dependency files in the project.
         
         Args:
-            project_path: Root directory of the project
+            project_files: Paths of all files in the project
             
         Returns:
             List of paths to dependency files
@@ -606,8 +673,7 @@ class DependencyScanner:
         
         logging.debug(f"Looking for dependency files with names: {supported_filenames}")
         
-        # Scan the project directory for dependency files
-        for file_path in scan_directory(str(project_path), self.ignore_patterns):
+        for file_path in project_files:
             # Check if the file is a known dependency file by name
             if file_path.name in supported_filenames:
                 dependency_files.append(file_path)
@@ -615,11 +681,11 @@ class DependencyScanner:
                 
         return dependency_files
     
-    def _find_source_files(self, project_path: Path) -> List[Path]:
+    def _find_source_files(self, project_files: List[Path]) -> List[Path]:
         """Find source code files in the project for import and API analysis.
         
         Args:
-            project_path: Root directory of the project
+            project_files: Paths of all files in the project
             
         Returns:
             List of paths to source code files
@@ -631,10 +697,13 @@ class DependencyScanner:
         api_extensions = set()
         
         # Check import analyzer extensions
-        from dependency_scanner_tool.analyzers.base import ImportAnalyzerRegistry
+        from dependency_scanner_tool.analyzers.base import ImportAnalyzerRegistry, _overrides_can_analyze
+        custom_analyzers = False
         for name, analyzer_class in ImportAnalyzerRegistry.get_all_analyzers().items():
             if hasattr(analyzer_class, 'supported_extensions'):
                 import_extensions.update(analyzer_class.supported_extensions)
+            # Analyzers with their own can_analyze may accept any file name
+            custom_analyzers = custom_analyzers or _overrides_can_analyze(analyzer_class)
         
         # Check API analyzer extensions  
         for ext, analyzer_class in self.api_analyzer_manager.registry._analyzers.items():
@@ -645,10 +714,9 @@ class DependencyScanner:
         
         logging.debug(f"Looking for source files with extensions: {supported_extensions}")
         
-        # Scan the project directory for source files
-        for file_path in scan_directory(str(project_path), self.ignore_patterns):
+        for file_path in project_files:
             # Check if the file has a supported extension
-            if file_path.suffix.lower() in supported_extensions:
+            if custom_analyzers or file_path.suffix.lower() in supported_extensions:
                 # Verify that at least one analyzer can handle this file
                 import_analyzer = self.analyzer_manager.get_analyzer_for_file(file_path)
                 api_analyzer = self.api_analyzer_manager.registry.get_analyzer_for_file(file_path)
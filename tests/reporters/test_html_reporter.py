@@ -19,6 +19,11 @@ class TestHTMLReporter(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
+        # Give each test its own Jinja2 environment so patched environments don't leak
+        self._shared_env = HTMLReporter._env
+        HTMLReporter._env = None
+        self.addCleanup(setattr, HTMLReporter, '_env', self._shared_env)
+        
         # Create a sample scan result
         self.scan_result = ScanResult(
             languages={"Python": 75.5, "JavaScript": 24.5},
@@ -307,5 +312,15 @@ class TestHTMLReporter(unittest.TestCase):
             reporter.generate_report(123)  # Not a ScanResult, JSON string, or file path
 
 
+def test_jinja_environment_is_shared():
+    """Test that reporters share one Jinja2 environment and its compiled templates."""
+    first = HTMLReporter()
+    second = HTMLReporter()
+    
+    assert first.jinja_env is second.jinja_env
+    assert not first.jinja_env.auto_reload
+    assert first._get_template() is second._get_template()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,6 @@
 """Tests for the JSON reporter module."""
 
+import io
 import json
 import os
 import tempfile
@@ -8,6 +9,9 @@ import logging
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from dependency_scanner_tool.reporters import json_reporter
 from dependency_scanner_tool.reporters.json_reporter import JSONReporter
 from dependency_scanner_tool.scanner import ScanResult, Dependency, DependencyType
 
@@ -161,5 +165,63 @@ class TestJSONReporter(unittest.TestCase):
             logger.setLevel(original_level)
 
 
+def test_write_report_matches_generate_report():
+    """Test that streaming a report writes the same JSON as generate_report."""
+    scan_result = ScanResult(
+        languages={"Python": 100.0},
+        package_managers={"pip"},
+        dependency_files=[Path("requirements.txt")],
+        dependencies=[Dependency(name="requests", version="2.28.1", source_file="requirements.txt")],
+        api_calls=[],
+        errors=[],
+    )
+    reporter = JSONReporter()
+    expected = json.loads(reporter.generate_report(scan_result))
+    
+    # Text-only stream
+    text_stream = io.StringIO()
+    reporter.write_report(scan_result, text_stream)
+    assert json.loads(text_stream.getvalue()) == expected
+    
+    # Stream with an underlying binary buffer, like sys.stdout
+    binary = io.BytesIO()
+    wrapper = io.TextIOWrapper(binary, encoding="utf-8")
+    reporter.write_report(scan_result, wrapper)
+    wrapper.flush()
+    assert json.loads(binary.getvalue()) == expected
+
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_reports_non_ascii_dependency_names(tmp_path, monkeypatch, use_orjson):
+    """Test that non-ASCII names survive file and stream output with either backend."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_reporter, "orjson", None)
+    scan_result = ScanResult(
+        languages={"Python": 100.0},
+        package_managers={"pip"},
+        dependency_files=[Path("requirements.txt")],
+        dependencies=[Dependency(name="caf\u00e9-\u65e5\u672c", version="1.0", source_file="requirements.txt")],
+        api_calls=[],
+        errors=[],
+    )
+    output_path = tmp_path / "report.json"
+    reporter = JSONReporter(output_path=output_path)
+    
+    expected = json.loads(reporter.generate_report(scan_result))
+    assert expected["dependencies"][0]["name"] == "caf\u00e9-\u65e5\u672c"
+    assert json.loads(output_path.read_bytes().decode("utf-8")) == expected
+    
+    # A stream that cannot encode the name directly still gets valid JSON
+    for encoding in ("utf-8", "ascii"):
+        binary = io.BytesIO()
+        wrapper = io.TextIOWrapper(binary, encoding=encoding)
+        reporter.write_report(scan_result, wrapper)
+        wrapper.flush()
+        assert json.loads(binary.getvalue().decode(encoding)) == expected
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,191 @@
+"""Test cases for analyzer manager."""
+
+import logging
+from pathlib import Path
+from unittest.mock import patch
+
+from dependency_scanner_tool.analyzers.analyzer_manager import PARALLEL_THRESHOLD, AnalyzerManager
+from dependency_scanner_tool.analyzers.base import (
+    ImportAnalyzer,
+    ImportAnalyzerRegistry,
+    _find_analyzer_by_suffix,
+)
+from dependency_scanner_tool.analyzers.java_analyzer import JavaImportAnalyzer
+from dependency_scanner_tool.analyzers.python_analyzer import PythonImportAnalyzer
+from dependency_scanner_tool.analyzers.scala_analyzer import ScalaImportAnalyzer
+from dependency_scanner_tool.scanner import Dependency
+
+
+def test_get_analyzer_for_file():
+    """Test that the analyzer manager can find the correct analyzer for a file."""
+    manager = AnalyzerManager()
+    
+    assert isinstance(manager.get_analyzer_for_file(Path("module.py")), PythonImportAnalyzer)
+    assert isinstance(manager.get_analyzer_for_file(Path("Main.java")), JavaImportAnalyzer)
+    assert isinstance(manager.get_analyzer_for_file(Path("App.scala")), ScalaImportAnalyzer)
+    
+    # Extension matching is case-insensitive
+    assert isinstance(manager.get_analyzer_for_file(Path("MODULE.PY")), PythonImportAnalyzer)
+    
+    # Test with unsupported file
+    assert manager.get_analyzer_for_file(Path("unsupported.xyz")) is None
+
+
+def test_get_analyzer_for_file_returns_managed_instance():
+    """Test that the returned analyzer is the instance held by the manager."""
+    manager = AnalyzerManager()
+    
+    analyzer = manager.get_analyzer_for_file(Path("module.py"))
+    assert analyzer is manager.analyzers["python"]
+
+
+def test_get_supported_extensions():
+    """Test getting supported extensions."""
+    manager = AnalyzerManager()
+    
+    extensions = manager.get_supported_extensions()
+    assert ".py" in extensions
+    assert ".java" in extensions
+    assert ".scala" in extensions
+
+
+def test_analyze_files_parallel_matches_sequential(tmp_path):
+    """Test that pooled analysis returns the same results as sequential analysis."""
+    manager = AnalyzerManager()
+    
+    file_paths = []
+    for i in range(60):
+        py_file = tmp_path / f"module_{i}.py"
+        py_file.write_text("import numpy\nimport os\n")
+        file_paths.append(py_file)
+    
+    # A file with no analyzer should map to an empty list in both modes
+    unsupported = tmp_path / "notes.xyz"
+    unsupported.write_text("nothing to see")
+    file_paths.append(unsupported)
+    
+    sequential = manager.analyze_files(file_paths, parallel=False)
+    parallel = manager.analyze_files(file_paths, parallel=True)
+    
+    assert list(parallel) == file_paths
+    assert parallel == sequential
+    assert [dep.name for dep in parallel[file_paths[0]]] == ["numpy"]
+    assert parallel[unsupported] == []
+
+
+def test_analyze_files_keeps_custom_managers_in_process(tmp_path):
+    """Test that a manager with its own analysis never hands files to pool workers."""
+    class CustomManager(AnalyzerManager):
+        def analyze_file(self, file_path):
+            return [Dependency(name="custom", source_file=str(file_path))]
+    
+    manager = CustomManager()
+    file_paths = [tmp_path / f"module_{i}.py" for i in range(PARALLEL_THRESHOLD)]
+    for file_path in file_paths:
+        file_path.write_text("import numpy\n")
+    
+    with patch.object(manager, "_iter_analyze_files_parallel", side_effect=AssertionError("pooled")):
+        results = manager.analyze_files(file_paths, parallel=True)
+    
+    assert all([dep.name for dep in dependencies] == ["custom"] for dependencies in results.values())
+
+
+def test_get_analyzer_for_file_late_registration():
+    """Test that analyzers registered after construction are still found."""
+    manager = AnalyzerManager()
+    
+    class KotlinImportAnalyzer(ImportAnalyzer):
+        supported_extensions = {".kt"}
+        
+        def analyze(self, file_path):
+            return []
+    
+    try:
+        ImportAnalyzerRegistry.register("kotlin_test", KotlinImportAnalyzer)
+        
+        analyzer = manager.get_analyzer_for_file(Path("Main.kt"))
+        assert isinstance(analyzer, KotlinImportAnalyzer)
+        assert manager.get_analyzer_for_file(Path("Other.kt")) is analyzer
+    finally:
+        ImportAnalyzerRegistry._analyzers.pop("kotlin_test", None)
+        _find_analyzer_by_suffix.cache_clear()
+
+
+def test_registry_find_analyzer_for_file_is_cached_by_suffix():
+    """Test that registry lookups are memoized per suffix and reset on register."""
+    _find_analyzer_by_suffix.cache_clear()
+    
+    assert ImportAnalyzerRegistry.find_analyzer_for_file(Path("a.py")) is PythonImportAnalyzer
+    assert ImportAnalyzerRegistry.find_analyzer_for_file(Path("b.PY")) is PythonImportAnalyzer
+    assert ImportAnalyzerRegistry.find_analyzer_for_file(Path("c.kt")) is None
+    assert _find_analyzer_by_suffix.cache_info().hits == 1
+    
+    class KotlinImportAnalyzer(ImportAnalyzer):
+        supported_extensions = {".kt"}
+        
+        def analyze(self, file_path):
+            return []
+    
+    try:
+        ImportAnalyzerRegistry.register("kotlin_test", KotlinImportAnalyzer)
+        assert ImportAnalyzerRegistry.find_analyzer_for_file(Path("c.kt")) is KotlinImportAnalyzer
+    finally:
+        ImportAnalyzerRegistry._analyzers.pop("kotlin_test", None)
+        _find_analyzer_by_suffix.cache_clear()
+
+
+def test_registry_asks_analyzers_that_override_can_analyze():
+    """Test that an analyzer deciding on the whole path is found by registry and manager."""
+    class BazelImportAnalyzer(ImportAnalyzer):
+        @classmethod
+        def can_analyze(cls, file_path):
+            return file_path.name == "BUILD"
+        
+        def analyze(self, file_path):
+            return []
+    
+    try:
+        ImportAnalyzerRegistry.register("bazel_test", BazelImportAnalyzer)
+        manager = AnalyzerManager()
+        
+        assert ImportAnalyzerRegistry.find_analyzer_for_file(Path("BUILD")) is BazelImportAnalyzer
+        assert ImportAnalyzerRegistry.find_analyzer_for_file(Path("app.py")) is PythonImportAnalyzer
+        assert isinstance(manager.get_analyzer_for_file(Path("BUILD")), BazelImportAnalyzer)
+    finally:
+        ImportAnalyzerRegistry._analyzers.pop("bazel_test", None)
+        _find_analyzer_by_suffix.cache_clear()
+
+
+def test_analyze_files_logs_errors(tmp_path, caplog):
+    """Test that files that fail to analyze are logged and mapped to no dependencies."""
+    manager = AnalyzerManager()
+    
+    missing = tmp_path / "missing.py"
+    present = tmp_path / "present.py"
+    present.write_text("import requests\n")
+    
+    with caplog.at_level(logging.WARNING):
+        results = manager.analyze_files([missing, present], parallel=False)
+    
+    assert results[missing] == []
+    assert [dep.name for dep in results[present]] == ["requests"]
+    assert f"Error analyzing file {missing}" in caplog.text
+    assert "Encountered 1 errors while analyzing files" in caplog.text
+
+
+def test_iter_analyze_files_yields_in_order(tmp_path):
+    """Test that streaming analysis yields one result per file in input order."""
+    manager = AnalyzerManager()
+    
+    file_paths = []
+    for i in range(3):
+        py_file = tmp_path / f"module_{i}.py"
+        py_file.write_text(f"import package_{i}\n")
+        file_paths.append(py_file)
+    
+    results = manager.iter_analyze_files(file_paths, parallel=False)
+    
+    first_path, first_deps = next(results)
+    assert first_path == file_paths[0]
+    assert [dep.name for dep in first_deps] == ["package_0"]
+    assert [path for path, _ in results] == file_paths[1:]
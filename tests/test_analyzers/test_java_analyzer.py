@@ -1,5 +1,6 @@
 """Tests for the Java import statement analyzer."""
 
+import logging
 import os
 import tempfile
 from pathlib import Path
@@ -203,3 +204,95 @@ public class HelloWorld {
             assert len(dependencies) == 0
         finally:
             os.unlink(file_path)
+    
+    def test_convert_import_uses_longest_prefix(self):
+        """Test that imports map to the artifact of the longest matching package prefix."""
+        analyzer = JavaImportAnalyzer()
+        source = Path("Main.java")
+        
+        def artifact(import_path):
+            dependency = analyzer._convert_import_to_dependency(import_path, source)
+            return dependency.name if dependency else None
+        
+        assert artifact("org.springframework.boot.SpringApplication") == "org.springframework.boot:spring-boot"
+        assert artifact("org.springframework.boot.autoconfigure.SpringBootApplication") == (
+            "org.springframework.boot:spring-boot-autoconfigure"
+        )
+        # A prefix may end part-way through a package segment
+        assert artifact("org.apache.commons.lang3.StringUtils") == "org.apache.commons:commons-lang3"
+        assert artifact("com.fasterxml.jackson.databind.*") == "com.fasterxml.jackson.core:jackson-core"
+        # Unmapped packages fall back to a guessed artifact
+        assert artifact("io.netty.channel.Channel") == "io.netty:channel"
+    
+    def test_should_process_javax_imports(self):
+        """Test that only mapped javax packages are treated as dependencies."""
+        analyzer = JavaImportAnalyzer()
+        
+        assert analyzer._should_process_import("javax.servlet.http.HttpServlet")
+        assert not analyzer._should_process_import("javax.swing.JFrame")
+        assert not analyzer._should_process_import("java.util.List")
+    
+    def test_analyze_deduplicates_artifacts(self, tmp_path):
+        """Test that each artifact is reported once, in first-seen order."""
+        analyzer = JavaImportAnalyzer()
+        file_path = tmp_path / "Main.java"
+        file_path.write_text(
+            "import com.google.common.collect.ImmutableList;\n"
+            "import org.slf4j.Logger;\n"
+            "import com.google.common.base.Preconditions;\n"
+            "import static com.google.common.base.Preconditions.checkNotNull;\n"
+            "import org.slf4j.LoggerFactory;\n"
+        )
+        
+        dependencies = analyzer.analyze(file_path)
+        
+        assert [dep.name for dep in dependencies] == ["com.google.guava:guava", "org.slf4j:slf4j-api"]
+    
+    def test_analyze_stops_at_type_declaration(self, tmp_path):
+        """Test that import-like text inside the class body is not scanned."""
+        analyzer = JavaImportAnalyzer()
+        file_path = tmp_path / "Main.java"
+        file_path.write_bytes(
+            b"// \xff not utf-8\n"
+            b"import org.slf4j.Logger;\n"
+            b"\n"
+            b"@Deprecated\n"
+            b"public final class Main {\n"
+            b"    String doc = \"import com.google.common.base.Strings;\";\n"
+            b"}\n"
+        )
+        
+        dependencies = analyzer.analyze(file_path)
+        
+        assert [dep.name for dep in dependencies] == ["org.slf4j:slf4j-api"]
+    
+    def test_analyze_ignores_declarations_in_comments(self, tmp_path):
+        """Test that a declaration-like line in a comment does not end the import search."""
+        analyzer = JavaImportAnalyzer()
+        file_path = tmp_path / "Main.java"
+        file_path.write_text(
+            "/*\n"
+            " * Licensed for the\n"
+            "class loading subsystem.\n"
+            " */\n"
+            "// enum values are listed below\n"
+            "import com.google.common.base.Strings;\n"
+            "import org.slf4j.Logger;\n"
+            "\n"
+            "public class Main {\n"
+            "}\n"
+        )
+        
+        dependencies = analyzer.analyze(file_path)
+        
+        assert [dep.name for dep in dependencies] == ["com.google.guava:guava", "org.slf4j:slf4j-api"]
+    
+    def test_analyze_logs_errors(self, tmp_path, caplog):
+        """Test that unreadable files are logged and yield no dependencies."""
+        analyzer = JavaImportAnalyzer()
+        missing = tmp_path / "Missing.java"
+        
+        with caplog.at_level(logging.WARNING):
+            assert analyzer.analyze(missing) == []
+        
+        assert f"Error analyzing Java file {missing}" in caplog.text
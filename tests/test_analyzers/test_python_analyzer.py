@@ -1,10 +1,15 @@
 """Tests for the Python import analyzer."""
 
+import ast
 import tempfile
 from pathlib import Path
 from unittest import TestCase
 
-from dependency_scanner_tool.analyzers.python_analyzer import PythonImportAnalyzer
+from dependency_scanner_tool.analyzers.python_analyzer import (
+    PACKAGE_MAPPING,
+    STDLIB_MODULES,
+    PythonImportAnalyzer,
+)
 
 
 class TestPythonImportAnalyzer(TestCase):
@@ -142,6 +147,91 @@ class TestPythonImportAnalyzer(TestCase):
         self.assertIn("numpy", dep_names)
         self.assertIn("pandas", dep_names)
 
+    def test_extract_imports_from_ast_nested(self):
+        """Test that imports nested in functions, classes and control flow are found."""
+        content = (
+            "import os\n"
+            "try:\n"
+            "    import ujson as json\n"
+            "except ImportError:\n"
+            "    import json\n"
+            "else:\n"
+            "    from simplejson import loads\n"
+            "finally:\n"
+            "    import atexit\n"
+            "class Loader:\n"
+            "    def load(self):\n"
+            "        with open('x') as f:\n"
+            "            if f:\n"
+            "                from yaml import safe_load\n"
+            "        return [x for x in __import__('pickle').loads(b'')]\n"
+            "from . import sibling\n"
+        )
+
+        imports = self.analyzer._extract_imports_from_ast(ast.parse(content))
+        self.assertEqual(
+            imports, {"os", "ujson", "json", "simplejson", "atexit", "yaml"}
+        )
+
+    def test_lookup_tables_are_module_level(self):
+        """Test that the class exposes the module-level lookup tables."""
+        self.assertIsInstance(STDLIB_MODULES, frozenset)
+        self.assertIs(PythonImportAnalyzer.STDLIB_MODULES, STDLIB_MODULES)
+        self.assertIs(PythonImportAnalyzer.PACKAGE_MAPPING, PACKAGE_MAPPING)
+        self.assertEqual(PACKAGE_MAPPING["sklearn"], "scikit-learn")
+
+    def test_normalize_indentation(self):
+        """Test that only uniformly indented content is rewritten."""
+        content = "\nimport os\n\ndef f():\n    import json\n"
+        self.assertIs(self.analyzer._normalize_indentation(content), content)
+
+        indented = "\n    import os\n\n    def f():\n        import json\n"
+        self.assertEqual(
+            self.analyzer._normalize_indentation(indented),
+            "\nimport os\n\ndef f():\n    import json\n",
+        )
+        self.assertEqual(self.analyzer._normalize_indentation(" \n\t\n"), "")
+
+    def test_extract_leading_imports(self):
+        """Test that the leading import block is used only when no later imports exist."""
+        content = (
+            '"""Module docstring."""\n'
+            "from __future__ import annotations\n"
+            "import os.path as osp, numpy  # comment\n"
+            "from .local import helper\n"
+            "from . import sibling\n"
+            "from pandas import (\n"
+            "    DataFrame,\n"
+            "    Series,\n"
+            ")\n"
+            "\n"
+            "def main():\n"
+            "    return osp.join('a', 'b')\n"
+        )
+
+        imports = self.analyzer._extract_leading_imports(content)
+        self.assertEqual(imports, {"__future__", "os.path", "numpy", "local", "pandas"})
+        self.assertEqual(imports, self.analyzer._extract_imports_from_ast(ast.parse(content)))
+
+        # Imports after the leading block require a full parse
+        lazy = content + "    import requests\n"
+        self.assertIsNone(self.analyzer._extract_leading_imports(lazy))
+        self.assertIn("requests", self.analyzer._extract_imports(Path("lazy.py"), lazy))
+
+    def test_extract_imports_with_regex(self):
+        """Test the regex fallback on aliases, multi-imports, comments and CRLF."""
+        content = (
+            "import numpy as np, requests\r\n"
+            "    from torch.nn import functional\n"
+            "import flask  # web framework\n"
+            "from . import sibling\n"
+            "# import commented_out\n"
+            "x = 'import not_an_import'\n"
+        )
+
+        imports = self.analyzer._extract_imports_with_regex(content)
+        self.assertEqual(imports, {"numpy", "requests", "torch", "flask"})
+
     def test_analyze_empty_file(self):
         """Test analyzing an empty file."""
         py_file = self.temp_path / "empty.py"
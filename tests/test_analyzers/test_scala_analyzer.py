@@ -257,4 +257,17 @@ class TestScalaImportAnalyzer(TestCase):
         
         # Should not process empty imports
         self.assertFalse(self.analyzer._should_process_import(""))
-        self.assertFalse(self.analyzer._should_process_import("   "))
\ No newline at end of file
+        self.assertFalse(self.analyzer._should_process_import("   "))
+    
+    def test_convert_import_uses_longest_prefix(self):
+        """Test that imports map to the artifact of the longest matching package prefix."""
+        def artifact(import_path):
+            dependency = self.analyzer._convert_import_to_dependency(import_path, Path("Main.scala"))
+            return dependency.name if dependency else None
+        
+        self.assertEqual(artifact("org.apache.spark.sql.SparkSession"), "org.apache.spark:spark-sql")
+        self.assertEqual(artifact("org.apache.spark.SparkContext"), "org.apache.spark:spark-core")
+        self.assertEqual(artifact("cats.effect.IO"), "org.typelevel:cats-effect")
+        self.assertEqual(artifact("cats.syntax.all"), "org.typelevel:cats-core")
+        # Unmapped packages fall back to a guessed artifact
+        self.assertEqual(artifact("com.example.lib.Thing"), "com.example:lib")
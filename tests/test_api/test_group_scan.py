@@ -0,0 +1,70 @@
+"""Tests for GitLab group scans in the scanner service."""
+
+import pytest
+from unittest.mock import patch
+
+from dependency_scanner_tool.api.job_manager import job_manager
+from dependency_scanner_tool.api.models import JobStatus
+from dependency_scanner_tool.api.scanner_service import ScannerService
+from dependency_scanner_tool.scanner import DependencyScanner
+
+
+PROJECTS = [
+    {'name': 'alpha', 'git_url': 'https://gitlab.com/group/alpha.git'},
+    {'name': 'no-url', 'git_url': None},
+    {'name': 'beta', 'git_url': 'https://gitlab.com/group/beta.git'},
+    {'name': 'gamma', 'git_url': 'https://gitlab.com/group/gamma.git'},
+]
+
+
+def fake_scan_project(project_name, git_url):
+    """Return fixed category flags per project, failing for beta."""
+    if project_name == 'beta':
+        raise Exception("download failed")
+    return {'Web': project_name == 'alpha', 'Database': project_name == 'gamma'}, {'DevPod': False}
+
+
+class TestGroupScan:
+    """Test concurrent scanning of group projects."""
+    
+    @pytest.mark.asyncio
+    async def test_group_scan_aggregates_results_in_project_order(self):
+        """Test that pooled project scans are aggregated like sequential ones."""
+        service = ScannerService(max_workers=2)
+        job_id = job_manager.create_job("https://gitlab.com/group")
+        
+        try:
+            # Run projects in threads so the patched scan_project is used
+            with patch.object(service, '_get_executor', return_value=None), \
+                 patch.object(service, 'scan_project', side_effect=fake_scan_project), \
+                 patch('dependency_scanner_tool.api.scanner_service.GitLabGroupService') as mock_gitlab:
+                mock_gitlab.return_value.get_project_info.return_value = PROJECTS
+                
+                await service._scan_gitlab_group(job_id, "https://gitlab.com/group")
+            
+            job = job_manager.get_job(job_id)
+            result = job.result
+            
+            assert job.status == JobStatus.COMPLETED
+            assert [r.project_name for r in result.project_results] == ['alpha', 'beta', 'gamma']
+            assert [r.status for r in result.project_results] == ['success', 'failed', 'success']
+            assert result.dependencies == {'Web': True, 'Database': True}
+            assert result.failed_projects == [{
+                'project_name': 'beta',
+                'git_url': 'https://gitlab.com/group/beta.git',
+                'error': 'download failed'
+            }]
+            assert result.successful_scans == 2
+            assert result.failed_scans == 1
+        finally:
+            job_manager.remove_job(job_id)
+            service.shutdown()
+    
+    def test_injected_scanner_skips_worker_pool(self):
+        """Test that group scans with an injected scanner do not use worker processes."""
+        service = ScannerService(max_workers=2, scanner=DependencyScanner(parallel=False))
+        
+        try:
+            assert service._get_executor() is None
+        finally:
+            service.shutdown()
@@ -0,0 +1,56 @@
+"""Tests for the job events endpoint."""
+
+import base64
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from dependency_scanner_tool.api.app import app
+from dependency_scanner_tool.api.job_manager import job_manager
+from dependency_scanner_tool.api.models import JobStatus
+
+
+@pytest.fixture
+def client():
+    """Create a test client for the FastAPI app."""
+    return TestClient(app)
+
+
+@pytest.fixture
+def auth_headers():
+    """Create valid authentication headers."""
+    credentials = base64.b64encode(b"test_user_secure:test_password_secure_123!").decode("utf-8")
+    return {"Authorization": f"Basic {credentials}"}
+
+
+def test_job_events_stream_ends_on_final_status(client, auth_headers):
+    """Test that a finished job yields a single event and closes the stream."""
+    job_id = job_manager.create_job("https://github.com/test/repo.git")
+    try:
+        job_manager.set_job_error(job_id, "boom")
+        
+        response = client.get(f"/jobs/{job_id}/events", headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        
+        events = [line for line in response.text.splitlines() if line.startswith("data:")]
+        assert len(events) == 1
+        payload = json.loads(events[0][len("data:"):])
+        assert payload["job_id"] == job_id
+        assert payload["status"] == JobStatus.FAILED.value
+    finally:
+        job_manager.remove_job(job_id)
+
+
+def test_job_events_returns_404_for_invalid_job(client, auth_headers):
+    """Test that the events endpoint returns 404 for an unknown job ID."""
+    response = client.get("/jobs/invalid-job-id/events", headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_job_events_requires_authentication(client):
+    """Test that the events endpoint requires authentication."""
+    response = client.get("/jobs/some-job-id/events")
+    assert response.status_code == 401
@@ -0,0 +1,56 @@
+"""Tests for job update notifications in the job manager."""
+
+import asyncio
+import pytest
+
+from dependency_scanner_tool.api.job_manager import JobManager
+from dependency_scanner_tool.api.models import JobStatus
+
+
+class TestJobUpdateNotifications:
+    """Test waiting for job changes instead of polling."""
+    
+    @pytest.mark.asyncio
+    async def test_wait_returns_immediately_when_version_is_stale(self):
+        """Test that a waiter behind the current version is not blocked."""
+        manager = JobManager()
+        job_id = manager.create_job("https://github.com/user/repo.git")
+        manager.update_job_status(job_id, JobStatus.RUNNING, 10)
+        
+        job = await asyncio.wait_for(manager.wait_for_update(job_id, 0, timeout=30), 1)
+        
+        assert job.status == JobStatus.RUNNING
+        assert job.version == 1
+    
+    @pytest.mark.asyncio
+    async def test_wait_wakes_on_update(self):
+        """Test that a waiter is woken as soon as the job changes."""
+        manager = JobManager()
+        job_id = manager.create_job("https://github.com/user/repo.git")
+        
+        waiter = asyncio.ensure_future(manager.wait_for_update(job_id, 0, timeout=30))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        
+        manager.update_job_status(job_id, JobStatus.COMPLETED, 100)
+        job = await asyncio.wait_for(waiter, 1)
+        
+        assert job.status == JobStatus.COMPLETED
+    
+    @pytest.mark.asyncio
+    async def test_wait_times_out_without_update(self):
+        """Test that a waiter returns the unchanged job after the timeout."""
+        manager = JobManager()
+        job_id = manager.create_job("https://github.com/user/repo.git")
+        
+        job = await manager.wait_for_update(job_id, 0, timeout=0.01)
+        
+        assert job.status == JobStatus.PENDING
+        assert job.version == 0
+    
+    @pytest.mark.asyncio
+    async def test_wait_for_unknown_job(self):
+        """Test waiting on a job that does not exist."""
+        manager = JobManager()
+        
+        assert await manager.wait_for_update("missing", 0, timeout=0.01) is None
@@ -1,11 +1,17 @@
 """Tests for the CLI module."""
 
+import io
 from unittest.mock import patch, MagicMock
 import pytest
 from click.testing import CliRunner
 import tempfile
 from pathlib import Path
-from dependency_scanner_tool.cli import main
+from dependency_scanner_tool.cli import (
+    main,
+    format_scan_result,
+    SimpleLanguageDetector,
+    SimplePackageManagerDetector,
+)
 from dependency_scanner_tool.scanner import DependencyType, ScanResult, Dependency
 
 
@@ -340,3 +346,38 @@ dependencies:
         assert call_args["project_path"] == str(project_dir)
         assert call_args["conda_env_path"] == conda_env_file
         assert call_args["venv_path"] == venv_dir
+
+
+def test_simple_detectors(tmp_path):
+    """Test language and package manager detection on a small project tree."""
+    (tmp_path / "requirements.txt").write_text("requests\n")
+    (tmp_path / "app.py").write_text("import requests\n")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "util.py").write_text("")
+    (tmp_path / "pkg" / "Main.java").write_text("")
+    (tmp_path / "pkg" / "package.json").write_text("{}")
+    
+    languages = SimpleLanguageDetector().detect_languages(tmp_path)
+    assert languages == {"Python": 50.0, "Java": 25.0, "JSON": 25.0}
+    
+    # Only manifest files at the project root count
+    assert SimplePackageManagerDetector().detect_package_managers(tmp_path) == {"pip"}
+
+
+def test_format_scan_result_streams_to_output():
+    """Test that streaming the text report writes the same lines it returns."""
+    scan_result = ScanResult(
+        languages={"Python": 100.0},
+        package_managers={"pip"},
+        dependency_files=[Path("requirements.txt")],
+        dependencies=[Dependency(name="requests", version="2.28.1", source_file="requirements.txt")],
+        api_calls=[],
+        errors=["Error parsing file: broken.txt"],
+    )
+    
+    formatted = format_scan_result(scan_result)
+    assert "  - requests (2.28.1) [UNKNOWN] from requirements.txt" in formatted.splitlines()
+    
+    out = io.StringIO()
+    assert format_scan_result(scan_result, out=out) is None
+    assert out.getvalue() == formatted + "\n"
@@ -0,0 +1,109 @@
+"""Tests for waiting on scan jobs with the REST API client."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from dependency_scanner_tool.api.models import JobStatus, JobStatusResponse
+from dependency_scanner_tool.client import EVENT_READ_TIMEOUT, DependencyScannerClient
+
+
+def make_client():
+    """Create a client without contacting a server."""
+    with patch.object(DependencyScannerClient, '_verify_connection'):
+        return DependencyScannerClient("http://scanner.test", "user", "secret", timeout=5)
+
+
+def event(status, progress):
+    """Build one server-sent event line for a job status."""
+    status_response = JobStatusResponse(
+        job_id="job-1", status=status, created_at="2024-01-01T00:00:00", progress=progress
+    )
+    return f"data: {status_response.model_dump_json()}"
+
+
+def stream_response(lines, status_code=200):
+    """Build a streaming response that yields the given lines."""
+    def iter_lines(decode_unicode=False):
+        for line in lines:
+            if isinstance(line, Exception):
+                raise line
+            yield line
+    
+    response = MagicMock(status_code=status_code)
+    response.__enter__.return_value = response
+    response.iter_lines.side_effect = iter_lines
+    return response
+
+
+def test_wait_for_completion_events_returns_on_completed_event():
+    """Test that a completed event fetches the results without polling."""
+    client = make_client()
+    client.session.get = MagicMock(return_value=stream_response([
+        ": keep-alive", event(JobStatus.RUNNING, 40), "", event(JobStatus.COMPLETED, 100)
+    ]))
+    
+    with patch.object(client, 'get_job_results', return_value="results"), \
+         patch.object(client, 'wait_for_completion') as poll:
+        status_response, results = client.wait_for_completion_events("job-1", show_progress=False)
+    
+    assert status_response.status == JobStatus.COMPLETED
+    assert results == "results"
+    poll.assert_not_called()
+    
+    # The read timeout outlasts the server's keep-alive interval
+    assert client.session.get.call_args.kwargs['timeout'] == (5, EVENT_READ_TIMEOUT)
+
+
+def test_wait_for_completion_events_polls_without_endpoint():
+    """Test that servers without the events endpoint are polled instead."""
+    client = make_client()
+    client.session.get = MagicMock(return_value=stream_response([], status_code=404))
+    
+    with patch.object(client, 'wait_for_completion', return_value=("status", None)) as poll:
+        assert client.wait_for_completion_events("job-1", max_wait=30, show_progress=False) == ("status", None)
+    
+    poll.assert_called_once_with("job-1", 30, False)
+
+
+@pytest.mark.parametrize("failure", [
+    requests.ConnectionError("connection reset"),
+    requests.ReadTimeout("idle stream"),
+])
+def test_wait_for_completion_events_polls_after_stream_error(failure):
+    """Test that a stream failing part-way falls back to polling for the remaining time."""
+    client = make_client()
+    client.session.get = MagicMock(return_value=stream_response([event(JobStatus.RUNNING, 10), failure]))
+    
+    with patch.object(client, 'wait_for_completion', return_value=("status", None)) as poll:
+        assert client.wait_for_completion_events("job-1", max_wait=30, show_progress=False) == ("status", None)
+    
+    job_id, remaining, show_progress = poll.call_args.args
+    assert (job_id, show_progress) == ("job-1", False)
+    assert 0 < remaining <= 30
+
+
+def test_wait_for_completion_events_polls_after_malformed_event():
+    """Test that an event that is not a job status falls back to polling."""
+    client = make_client()
+    client.session.get = MagicMock(return_value=stream_response(['data: {"progress": "half"}']))
+    
+    with patch.object(client, 'wait_for_completion', return_value=("status", None)) as poll:
+        assert client.wait_for_completion_events("job-1", max_wait=30, show_progress=False) == ("status", None)
+    
+    poll.assert_called_once()
+
+
+def test_wait_for_completion_events_times_out():
+    """Test that an idle stream raises TimeoutError once max_wait has passed."""
+    client = make_client()
+    client.session.get = MagicMock(return_value=stream_response([": keep-alive"] * 3))
+    
+    # Each keep-alive arrives 15 seconds after the previous one
+    with patch('dependency_scanner_tool.client.time.time', side_effect=[0, 15, 30, 45, 45]), \
+         patch.object(client, 'wait_for_completion') as poll:
+        with pytest.raises(TimeoutError):
+            client.wait_for_completion_events("job-1", max_wait=30, show_progress=False)
+    
+    poll.assert_not_called()
@@ -189,3 +189,22 @@ def test_dependency_in_multiple_categories():
     assert "requests" in [dep.name for dep in result["B"]]
     assert "numpy" in [dep.name for dep in result["B"]]
     assert result["C"][0].name == "pytest"
+
+
+def test_categorize_dependency_case_insensitive_and_cached():
+    """Test that exact matches ignore case and repeated lookups are stable."""
+    config = {
+        "categories": {
+            "A": ["Requests"],
+            "B": ["requests", "numpy"]
+        }
+    }
+    
+    categorizer = DependencyCategorizer(config)
+    
+    first = categorizer.categorize_dependency(Dependency(name="REQUESTS"))
+    assert first == ["A", "B"]
+    
+    # Mutating a returned list must not leak into later results
+    first.append("Z")
+    assert categorizer.categorize_dependency(Dependency(name="REQUESTS")) == ["A", "B"]
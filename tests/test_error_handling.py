@@ -86,7 +86,7 @@ def test_detect_dependency_files_error_handling():
     assert "Directory does not exist" in str(excinfo.value)
 
 
-@patch('dependency_scanner_tool.scanner.scan_directory')
+@patch('dependency_scanner_tool.file_utils.scan_directory')
 def test_scan_directory_exception_handling(mock_scan):
     """Test that exceptions in scan_directory are properly handled."""
     # Setup the mock to raise an exception
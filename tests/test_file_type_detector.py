@@ -5,9 +5,13 @@ from pathlib import Path
 
 import pytest
 
+from dependency_scanner_tool import file_type_detector
 from dependency_scanner_tool.exceptions import FileAccessError
 from dependency_scanner_tool.file_type_detector import (
+    CONTENT_PATTERN_LITERALS,
+    CONTENT_PATTERNS,
     FileCategory,
+    FileType,
     detect_file_type,
     detect_language_from_content,
     detect_shebang,
@@ -36,6 +40,17 @@ def test_read_file_with_encoding():
         os.unlink(tmp_path)
 
 
+def test_file_type_defaults_are_not_shared():
+    """Test that each FileType gets its own default lists."""
+    first = FileType(name="Text", extensions=[".txt"], category=FileCategory.DOCUMENTATION)
+    second = FileType(name="Log", extensions=[".log"], category=FileCategory.DOCUMENTATION)
+    
+    first.mime_types.append("text/plain")
+    
+    assert second.mime_types == []
+    assert first.patterns == [] and first.patterns is not second.patterns
+
+
 def test_detect_shebang():
     """Test shebang detection."""
     # Python shebang
@@ -45,6 +60,14 @@ def test_detect_shebang():
     # Bash shebang
     assert detect_shebang("#!/bin/bash\necho 'Hello'") == "Bash"
     
+    # Other interpreters, with no trailing newline
+    assert detect_shebang("#!/usr/bin/env node") == "JavaScript"
+    assert detect_shebang("#!/usr/bin/perl -w\nuse strict;") == "Perl"
+    
+    # Only the first line is considered
+    assert detect_shebang("#!/usr/bin/env\npython") is None
+    assert detect_shebang("#!/usr/local/bin/tool\n#!/bin/bash") is None
+    
     # No shebang
     assert detect_shebang("import sys\nprint('Hello')") is None
     assert detect_shebang("") is None
@@ -100,6 +123,20 @@ public class HelloWorld {
     assert detect_language_from_content(None) is None
 
 
+def test_content_pattern_literals_match_patterns():
+    """Test that every content pattern has a required literal that it needs to match."""
+    assert CONTENT_PATTERN_LITERALS.keys() == CONTENT_PATTERNS.keys()
+    for language, patterns in CONTENT_PATTERNS.items():
+        assert len(CONTENT_PATTERN_LITERALS[language]) == len(patterns)
+    
+    # A literal that is absent skips the pattern without changing the result
+    assert detect_language_from_content("key: value\nother: 1\n") == "YAML"
+    assert detect_language_from_content("plain words only") is None
+    
+    # Python and JavaScript both match one pattern; the earlier language wins
+    assert detect_language_from_content("def main():\n    pass\nconst x = 1;\n") == "Python"
+
+
 def test_detect_file_type():
     """Test file type detection."""
     with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as tmp_file:
@@ -185,6 +222,35 @@ function greet() {
         assert "JSON" in data_files or "JSON" in documentation_files or "JSON" in result[FileCategory.SOURCE_CODE.value]
 
 
+def test_detect_file_type_skips_read_for_known_extension(tmp_path, monkeypatch):
+    """Test that files classified by extension are not read."""
+    def fail_read(file_path, max_read_size=8192):
+        raise AssertionError(f"unexpected read of {file_path}")
+    
+    monkeypatch.setattr(file_type_detector, "read_file_with_encoding", fail_read)
+    
+    source_path = tmp_path / "module.py"
+    source_path.write_text("print('hello')\n")
+    
+    assert detect_file_type(source_path) == ("Python", FileCategory.SOURCE_CODE, "extension")
+
+
+def test_analyze_file_types_matches_per_file_detection(tmp_path):
+    """Test that threaded analysis counts the same types as detecting each file."""
+    for i in range(100):
+        (tmp_path / f"module_{i}.py").write_text("import sys\n")
+        (tmp_path / f"data_{i}").write_text('{"key": %d}\n' % i)
+        (tmp_path / f"image_{i}.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+    
+    expected = {}
+    for file_path in tmp_path.iterdir():
+        file_type, category, _ = detect_file_type(file_path)
+        category_dict = expected.setdefault(category.value, {})
+        category_dict[file_type] = category_dict.get(file_type, 0) + 1
+    
+    assert analyze_file_types(tmp_path) == expected
+
+
 def test_file_type_detection_with_content():
     """Test file type detection with content analysis."""
     with tempfile.NamedTemporaryFile(mode='w', delete=False) as tmp_file:
@@ -234,3 +300,61 @@ print('Hello, world!')
     finally:
         # Clean up
         os.unlink(shebang_path)
+
+
+def test_read_file_with_encoding_decodes_in_memory(tmp_path):
+    """Test decoding of the initial read, including a character cut off at the limit."""
+    utf8_file = tmp_path / "utf8.txt"
+    utf8_file.write_bytes("line one\r\nhéllo".encode("utf-8"))
+    assert read_file_with_encoding(utf8_file) == ("line one\nhéllo", "utf-8")
+    
+    # The two-byte 'é' straddles the read limit
+    assert read_file_with_encoding(utf8_file, max_read_size=12) == ("line one\nh", "utf-8")
+    
+    latin1_file = tmp_path / "latin1.txt"
+    latin1_file.write_bytes("héllo".encode("latin-1"))
+    assert read_file_with_encoding(latin1_file) == ("héllo", "latin-1")
+    
+    binary_file = tmp_path / "image.png"
+    binary_file.write_bytes(b"\x89PNG\r\n\x1a\n rest")
+    assert read_file_with_encoding(binary_file) == (None, "binary")
+    
+    # Signatures only count at the start of the file
+    text_file = tmp_path / "notes.txt"
+    text_file.write_bytes(b"see %PDF and MZ\n")
+    assert read_file_with_encoding(text_file) == ("see %PDF and MZ\n", "utf-8")
+    
+    # Text beyond the binary sniff window is still read, and null bytes there still count
+    long_text = "x" * 1000 + "\n"
+    long_file = tmp_path / "long.txt"
+    long_file.write_text(long_text)
+    assert read_file_with_encoding(long_file) == (long_text, "utf-8")
+    
+    late_null_file = tmp_path / "late_null.txt"
+    late_null_file.write_bytes(b"x" * 1000 + b"\x00")
+    assert read_file_with_encoding(late_null_file) == (None, "binary")
+
+
+def test_detect_file_type_data_formats(tmp_path):
+    """Test content-based detection of data files without a known extension."""
+    xml_path = tmp_path / "layout"
+    xml_path.write_text("  <root><child/></root>\n")
+    assert detect_file_type(xml_path)[1:] == (FileCategory.DATA, "content_pattern")
+    
+    json_path = tmp_path / "values"
+    json_path.write_text("[1, 2, 3]\n")
+    assert detect_file_type(json_path) == ("JSON", FileCategory.DATA, "content_pattern")
+    
+    indented_json_path = tmp_path / "indented"
+    indented_json_path.write_text("\n\t  [1, 2, 3]\n")
+    assert detect_file_type(indented_json_path) == ("JSON", FileCategory.DATA, "content_pattern")
+    
+    # A JSON document cut off by the sniff size is still recognised
+    truncated_json_path = tmp_path / "truncated"
+    truncated_json_path.write_text("[" + ", ".join(["1"] * 5000) + "]\n")
+    assert detect_file_type(truncated_json_path) == ("JSON", FileCategory.DATA, "content_pattern")
+    
+    # A bracketed section header is not JSON
+    ini_path = tmp_path / "settings"
+    ini_path.write_text("[section]\nname=value\n")
+    assert detect_file_type(ini_path)[0] != "JSON"
@@ -2,13 +2,17 @@
 import tempfile
 from pathlib import Path
 
+import pytest
 
+from dependency_scanner_tool.file_type_detector import analyze_file_types
 from dependency_scanner_tool.file_utils import (
     get_file_language,
     get_file_type,
     analyze_directory_extensions,
     detect_languages,
     detect_dependency_files,
+    scan_and_classify,
+    _file_info_for_suffix,
 )
 
 
@@ -63,6 +67,19 @@ def test_get_file_type():
     assert get_file_type(Path("test.unknown")) == "unknown_file"
 
 
+def test_file_lookups_are_cached_by_suffix():
+    """Test that language and type lookups ignore case and are cached per suffix."""
+    _file_info_for_suffix.cache_clear()
+    
+    assert get_file_language(Path("a.py")) == "Python"
+    assert get_file_language(Path("B.PY")) == "Python"
+    assert get_file_language(Path("c.py")) == "Python"
+    assert _file_info_for_suffix.cache_info().hits == 1
+    
+    assert get_file_type(Path("LOGO.PNG")) == "image_file"
+    assert get_file_type(Path("pom.xml")) == "dependency_file"
+
+
 def test_analyze_directory_extensions():
     """Test analyzing directory extensions."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -160,3 +177,25 @@ def test_detect_dependency_files_with_ignore():
         # Verify results
         assert len(dep_files) == 2
         assert all('node_modules' not in str(f) for f in dep_files)
+
+
+def test_scan_and_classify_matches_separate_walks(tmp_path):
+    """Test that the fused walk matches the three separate detection functions."""
+    (tmp_path / 'app.py').write_text("import requests\n")
+    (tmp_path / 'index.js').write_text("const x = 1;\n")
+    (tmp_path / 'requirements.txt').write_text("requests\n")
+    (tmp_path / 'notes').write_text("key: value\n")
+    (tmp_path / 'node_modules').mkdir()
+    (tmp_path / 'node_modules' / 'package.json').write_text("{}\n")
+    
+    ignore_patterns = ['node_modules/']
+    file_paths = []
+    languages, dependency_files, file_types = scan_and_classify(tmp_path, ignore_patterns, file_paths)
+    
+    assert languages == detect_languages(tmp_path, ignore_patterns)
+    assert dependency_files == detect_dependency_files(tmp_path, ignore_patterns)
+    assert file_types == analyze_file_types(tmp_path, ignore_patterns)
+    assert dependency_files == [tmp_path / 'requirements.txt']
+    assert sorted(file_paths) == sorted(
+        tmp_path / name for name in ['app.py', 'index.js', 'requirements.txt', 'notes']
+    )
@@ -0,0 +1,54 @@
+"""Tests for the JSON helpers of the generate_report.py script."""
+
+import importlib.util
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+# generate_report.py is a script at the project root, not part of the package
+SCRIPT_PATH = Path(__file__).parent.parent / "generate_report.py"
+spec = importlib.util.spec_from_file_location("generate_report", SCRIPT_PATH)
+generate_report = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(generate_report)
+
+SCAN_RESULTS = {
+    "languages": {"Python": 87.5, "Java": 12.5},
+    "dependencies": [
+        {"name": "requests", "version": "2.31.0", "type": "allowed"},
+        {"name": "café-utils", "version": None, "type": "cannot_determine"},
+    ],
+    "categorized_dependencies": {},
+}
+
+
+@pytest.fixture(params=["optional", "fallback"])
+def backends(request, monkeypatch):
+    """Run a test with ijson and orjson, or with both missing."""
+    if request.param == "optional":
+        pytest.importorskip("ijson")
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(generate_report, "ijson", None)
+        monkeypatch.setattr(generate_report, "orjson", None)
+    return request.param
+
+
+def test_iter_scan_results(tmp_path, backends):
+    """Test that dependencies and sections are read the same way by every backend."""
+    json_path = tmp_path / "scan.json"
+    json_path.write_text(json.dumps(SCAN_RESULTS, ensure_ascii=False), encoding="utf-8")
+    
+    assert list(generate_report.iter_scan_dependencies(json_path)) == SCAN_RESULTS["dependencies"]
+    assert dict(generate_report.iter_scan_sections(json_path)) == SCAN_RESULTS
+
+
+def test_write_json_sections_matches_json_dump(backends):
+    """Test that writing sections gives the same text as json.dump with indent=2."""
+    out = io.StringIO()
+    generate_report.write_json_sections(out, SCAN_RESULTS.items())
+    
+    assert json.loads(out.getvalue()) == SCAN_RESULTS
+    if backends == "fallback":
+        assert out.getvalue() == json.dumps(SCAN_RESULTS, indent=2)
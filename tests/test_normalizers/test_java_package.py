@@ -1,6 +1,10 @@
 """Tests for the Java package name normalizer."""
 
-from dependency_scanner_tool.normalizers.java_package import JavaPackageNormalizer
+from dependency_scanner_tool.normalizers.java_package import (
+    JavaPackageNormalizer,
+    _is_java_standard_library,
+    _maven_coordinates_for_package,
+)
 
 
 class TestJavaPackageNormalizer:
@@ -23,6 +27,17 @@ class TestJavaPackageNormalizer:
         assert normalizer.get_maven_coordinates_from_package("") == ""
         assert normalizer.get_maven_coordinates_from_package("single") == "single:single"
     
+    def test_get_maven_coordinates_uses_longest_prefix(self):
+        """Test that the longest mapped prefix wins, even part-way through a segment."""
+        normalizer = JavaPackageNormalizer()
+        mapping = JavaPackageNormalizer.PACKAGE_TO_MAVEN_MAPPING
+        
+        for prefix, coordinates in mapping.items():
+            longer = [other for other in mapping if other != prefix and other.startswith(prefix)]
+            if not longer:
+                assert normalizer.get_maven_coordinates_from_package(prefix + ".sub") == coordinates
+                assert normalizer.get_maven_coordinates_from_package(prefix + "x") == coordinates
+    
     def test_get_package_from_maven_coordinates(self):
         """Test getting a Java package name from Maven coordinates."""
         normalizer = JavaPackageNormalizer()
@@ -40,6 +55,14 @@ class TestJavaPackageNormalizer:
         assert normalizer.get_package_from_maven_coordinates("") == ""
         assert normalizer.get_package_from_maven_coordinates("single") == "single"
     
+    def test_mappings_round_trip(self):
+        """Test that every mapped package and its coordinates map back to each other."""
+        normalizer = JavaPackageNormalizer()
+        
+        assert len(JavaPackageNormalizer.MAVEN_TO_PACKAGE_MAPPING) == len(JavaPackageNormalizer.PACKAGE_TO_MAVEN_MAPPING)
+        for package, coordinates in JavaPackageNormalizer.PACKAGE_TO_MAVEN_MAPPING.items():
+            assert normalizer.get_package_from_maven_coordinates(coordinates) == package
+    
     def test_is_java_standard_library(self):
         """Test checking if a package is part of the Java standard library."""
         normalizer = JavaPackageNormalizer()
@@ -58,4 +81,22 @@ class TestJavaPackageNormalizer:
         # Test edge cases
         assert not normalizer.is_java_standard_library("")
         assert not normalizer.is_java_standard_library("java")  # Just "java" is not a standard library package
+        assert not normalizer.is_java_standard_library("java.")
+        assert normalizer.is_java_standard_library("com.sun.net")
         assert not normalizer.is_java_standard_library("javax")  # Just "javax" is not a standard library package
+    
+    def test_lookups_are_cached_per_package(self):
+        """Test that repeated lookups of a package are served from the cache."""
+        _maven_coordinates_for_package.cache_clear()
+        _is_java_standard_library.cache_clear()
+        
+        first = JavaPackageNormalizer()
+        second = JavaPackageNormalizer()
+        
+        assert first.get_maven_coordinates_from_package("org.junit") == "junit:junit"
+        assert second.get_maven_coordinates_from_package("org.junit") == "junit:junit"
+        assert _maven_coordinates_for_package.cache_info().hits == 1
+        
+        assert first.is_java_standard_library("java.util")
+        assert second.is_java_standard_library("java.util")
+        assert _is_java_standard_library.cache_info().hits == 1
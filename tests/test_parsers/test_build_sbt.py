@@ -123,3 +123,28 @@ class TestBuildSbtParser(TestCase):
 
         dependencies = self.parser.parse(build_file)
         self.assertEqual(len(dependencies), 0)
+
+    def test_parse_non_ascii_dependency(self):
+        """Test that captured groups are decoded as UTF-8."""
+        content = 'libraryDependencies += "org.exämple" %% "lib" % "1.0.0"\n'
+
+        build_file = self.temp_path / "build.sbt"
+        build_file.write_text(content, encoding="utf-8")
+
+        dependencies = self.parser.parse(build_file)
+        
+        self.assertEqual([(dep.name, dep.version) for dep in dependencies],
+                         [("org.exämple:lib", "1.0.0")])
+
+    def test_parse_long_unmatched_quoted_spans(self):
+        """Test that long quoted strings around a dependency do not hide it."""
+        filler = '"' + 'a' * 10000 + '" x\n'
+        content = filler * 5 + 'libraryDependencies += "com.example" % "library" % "1.0.0"\n'
+
+        build_file = self.temp_path / "build.sbt"
+        build_file.write_text(content)
+
+        dependencies = self.parser.parse(build_file)
+        
+        self.assertEqual([(dep.name, dep.version) for dep in dependencies],
+                         [("com.example:library", "1.0.0")])
@@ -127,6 +127,22 @@ dependencies:
         finally:
             os.unlink(file_path)
     
+    def test_parse_whitespace_only_file(self, caplog):
+        """Test that a file with only whitespace and comments is treated as empty."""
+        with tempfile.NamedTemporaryFile(suffix=".yml", delete=False) as f:
+            f.write(b"\n   \n# nothing here yet\n")
+            file_path = Path(f.name)
+        
+        try:
+            parser = CondaEnvironmentParser()
+            dependencies = parser.parse(file_path)
+            
+            # Should return an empty list without warning about a missing section
+            assert dependencies == []
+            assert "No dependencies found" not in caplog.text
+        finally:
+            os.unlink(file_path)
+    
     def test_parse_invalid_yaml(self):
         """Test parsing an invalid YAML file."""
         with tempfile.NamedTemporaryFile(suffix=".yml", delete=False) as f:
@@ -167,3 +183,26 @@ channels:
             assert len(dependencies) == 0
         finally:
             os.unlink(file_path)
+    
+    def test_parse_dependency_spec(self):
+        """Test splitting dependency specs at the first version operator."""
+        parser = CondaEnvironmentParser()
+        
+        assert parser._parse_dependency_spec("numpy") == ("numpy", None)
+        assert parser._parse_dependency_spec(" pkg~1 ") == ("pkg~1", None)
+        assert parser._parse_dependency_spec("python=3.9") == ("python", "3.9")
+        assert parser._parse_dependency_spec("pandas >= 1.3.0") == ("pandas", ">=1.3.0")
+        assert parser._parse_dependency_spec("requests~=2.25") == ("requests", "~=2.25")
+        assert parser._parse_dependency_spec("conda-forge::numpy=1.2") == ("conda-forge::numpy", "1.2")
+        
+        # Multiple constraints stay together in the version
+        assert parser._parse_dependency_spec("scipy<2.0,>=1.7") == ("scipy", "<2.0,>=1.7")
+    
+    def test_parse_missing_file(self, tmp_path):
+        """Test that a file that cannot be read raises a chained ParsingError."""
+        parser = CondaEnvironmentParser()
+        
+        with pytest.raises(ParsingError) as excinfo:
+            parser.parse(tmp_path / "environment.yml")
+        
+        assert isinstance(excinfo.value.__cause__, FileNotFoundError)
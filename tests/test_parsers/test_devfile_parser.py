@@ -51,6 +51,12 @@ class TestDevfileParser:
         # through content analysis if it contains devfile-like keywords
         # This is acceptable behavior for the content-detection feature
     
+    def test_can_parse_requires_yaml_extension(self, parser):
+        """Test that devfile-like names without a YAML extension are rejected."""
+        assert not parser.can_parse(Path("devfile.json"))
+        assert not parser.can_parse(Path(".devcontainer/devpod.toml"))
+        assert parser.can_parse(Path("DEVFILE.YML"))
+    
     def test_is_valid_devfile_valid(self):
         """Test _is_valid_devfile with valid devfile data."""
         valid_devfile = {
@@ -1,6 +1,7 @@
 """Tests for the Gradle build file parser."""
 
 import os
+import re
 import tempfile
 from pathlib import Path
 
@@ -241,3 +242,83 @@ repositories {
             assert len(dependencies) == 0
         finally:
             os.unlink(file_path)
+    
+    def test_parse_mixed_notations_in_file_order(self, tmp_path):
+        """Test that all notations are found in one scan, in the order they appear."""
+        file_path = tmp_path / "build.gradle.kts"
+        file_path.write_text("""
+dependencies {
+    implementation(group = "com.google.guava", name = "guava", version = "30.1-jre")
+    testImplementation 'junit:junit:4.13.2'
+    api("com.fasterxml.jackson.core:jackson-databind")
+    compileOnly group: 'org.projectlombok', name: 'lombok', version: '1.18.20'
+}
+""")
+        
+        parser = GradleBuildParser()
+        dependencies = parser.parse(file_path)
+        
+        assert [(d.name, d.version) for d in dependencies] == [
+            ("com.google.guava:guava", "30.1-jre"),
+            ("junit:junit", "4.13.2"),
+            ("com.fasterxml.jackson.core:jackson-databind", None),
+            ("org.projectlombok:lombok", "1.18.20"),
+        ]
+    
+    def test_parse_non_ascii_coordinates(self, tmp_path):
+        """Test that UTF-8 coordinates and comments survive byte-level matching."""
+        file_path = tmp_path / "build.gradle"
+        file_path.write_text(
+            "// Abhängigkeiten für das Projekt\n"
+            "dependencies {\n"
+            "    implementation 'com.exämple:lïb:1.0'\n"
+            "}\n",
+            encoding="utf-8"
+        )
+        
+        parser = GradleBuildParser()
+        dependencies = parser.parse(file_path)
+        
+        assert [(d.name, d.version) for d in dependencies] == [("com.exämple:lïb", "1.0")]
+    
+    def test_parse_skips_repeated_coordinates(self, tmp_path):
+        """Test that the same coordinates declared twice yield one dependency."""
+        file_path = tmp_path / "build.gradle"
+        file_path.write_text("""
+dependencies {
+    implementation 'junit:junit:4.13.2'
+    testImplementation 'junit:junit:4.13.2'
+    implementation 'junit:junit:4.12'
+    implementation group: 'junit', name: 'junit', version: '4.13.2'
+}
+""")
+        
+        parser = GradleBuildParser()
+        dependencies = parser.parse(file_path)
+        
+        assert [(d.name, d.version) for d in dependencies] == [
+            ("junit:junit", "4.13.2"),
+            ("junit:junit", "4.12"),
+        ]
+    
+    def test_parse_file_without_configurations(self, tmp_path):
+        """Test that files naming no dependency configuration are skipped."""
+        file_path = tmp_path / "build.gradle"
+        file_path.write_text("""
+plugins {
+    id 'java'
+}
+
+tasks.register('hello') {
+    doLast { println 'org.example:not-a-dependency:1.0' }
+}
+""")
+        
+        parser = GradleBuildParser()
+        assert parser.parse(file_path) == []
+        
+        # Every configuration name must contain one of the short-circuit keywords
+        names = re.findall(rb'\w+', GradleBuildParser.CONFIGURATION_PATTERN.replace(b'?:', b''))
+        assert names
+        for name in names:
+            assert any(keyword in name for keyword in GradleBuildParser.CONFIGURATION_KEYWORDS), name
@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 from dependency_scanner_tool.exceptions import ParsingError
+from dependency_scanner_tool.parsers import maven_pom
 from dependency_scanner_tool.parsers.maven_pom import MavenPomParser
 from dependency_scanner_tool.scanner import DependencyType
 
@@ -236,3 +237,185 @@ class TestMavenPomParser:
             assert len(dependencies) == 0
         finally:
             os.unlink(file_path)
+    
+    def test_parse_properties_after_dependencies(self):
+        """Test that properties declared after the dependencies still resolve versions."""
+        with tempfile.NamedTemporaryFile(suffix=".xml", delete=False) as f:
+            f.write(b"""<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <modelVersion>4.0.0</modelVersion>
+  <dependencyManagement>
+    <dependencies>
+      <dependency>
+        <groupId>com.fasterxml.jackson.core</groupId>
+        <artifactId>jackson-databind</artifactId>
+        <version>${jackson.version}</version>
+      </dependency>
+    </dependencies>
+  </dependencyManagement>
+  <dependencies>
+    <dependency>
+      <groupId>junit</groupId>
+      <artifactId>junit</artifactId>
+      <version>${junit.version}</version>
+    </dependency>
+  </dependencies>
+  <properties>
+    <jackson.version>2.15.2</jackson.version>
+    <junit.version>4.13.2</junit.version>
+  </properties>
+</project>
+""")
+            file_path = Path(f.name)
+        
+        try:
+            parser = MavenPomParser()
+            dependencies = parser.parse(file_path)
+            
+            assert [(dep.name, dep.version) for dep in dependencies] == [
+                ("com.fasterxml.jackson.core:jackson-databind", "2.15.2"),
+                ("junit:junit", "4.13.2"),
+            ]
+        finally:
+            os.unlink(file_path)
+    
+    def test_parse_skips_repeated_coordinates(self):
+        """Test that dependencies repeated in a profile are reported once."""
+        with tempfile.NamedTemporaryFile(suffix=".xml", delete=False) as f:
+            f.write(b"""<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <modelVersion>4.0.0</modelVersion>
+  <dependencies>
+    <dependency>
+      <groupId>junit</groupId>
+      <artifactId>junit</artifactId>
+      <version>4.13.2</version>
+    </dependency>
+  </dependencies>
+  <profiles>
+    <profile>
+      <dependencies>
+        <dependency>
+          <groupId>junit</groupId>
+          <artifactId>junit</artifactId>
+          <version>4.13.2</version>
+        </dependency>
+      </dependencies>
+    </profile>
+  </profiles>
+</project>
+""")
+            file_path = Path(f.name)
+        
+        try:
+            parser = MavenPomParser()
+            dependencies = parser.parse(file_path)
+            
+            assert [(dep.name, dep.version) for dep in dependencies] == [("junit:junit", "4.13.2")]
+        finally:
+            os.unlink(file_path)
+    
+    def test_parse_other_pom_namespace(self):
+        """Test that POMs in another model namespace are parsed like 4.0.0 ones."""
+        with tempfile.NamedTemporaryFile(suffix=".xml", delete=False) as f:
+            f.write(b"""<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.1.0">
+  <modelVersion>4.1.0</modelVersion>
+  <parent>
+    <groupId>com.example</groupId>
+    <artifactId>parent</artifactId>
+    <version>2.0</version>
+  </parent>
+  <dependencies>
+    <dependency>
+      <!-- repeated child elements keep the first value -->
+      <groupId>junit</groupId>
+      <groupId>ignored</groupId>
+      <artifactId>junit</artifactId>
+      <version>4.13.2</version>
+    </dependency>
+  </dependencies>
+</project>
+""")
+            file_path = Path(f.name)
+        
+        try:
+            parser = MavenPomParser()
+            dependencies = parser.parse(file_path)
+            
+            assert [(dep.name, dep.version) for dep in dependencies] == [
+                ("com.example:parent", "2.0"),
+                ("junit:junit", "4.13.2"),
+            ]
+        finally:
+            os.unlink(file_path)
+    
+    def test_parse_does_not_expand_external_entities(self, tmp_path):
+        """Test that an external entity in a cloned POM is never read into a version."""
+        secret = tmp_path / "secret.txt"
+        secret.write_text("top-secret")
+        file_path = tmp_path / "pom.xml"
+        file_path.write_text(f"""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE project [<!ENTITY leak SYSTEM "{secret.as_uri()}">]>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <dependencies>
+    <dependency>
+      <groupId>junit</groupId>
+      <artifactId>junit</artifactId>
+      <version>&leak;</version>
+    </dependency>
+  </dependencies>
+</project>
+""")
+        
+        try:
+            dependencies = MavenPomParser().parse(file_path)
+        except ParsingError:
+            # Rejecting the undefined entity is as safe as leaving it empty
+            return
+        
+        assert all("top-secret" not in (dep.version or "") for dep in dependencies)
+    
+    def test_parse_lxml_matches_stdlib(self, tmp_path, monkeypatch):
+        """Test that the lxml and stdlib backends return the same dependencies."""
+        pytest.importorskip("lxml")
+        import xml.etree.ElementTree as StdET
+        
+        file_path = tmp_path / "pom.xml"
+        file_path.write_text("""<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <parent>
+    <groupId>com.example</groupId>
+    <artifactId>parent</artifactId>
+    <version>1.0</version>
+  </parent>
+  <dependencies>
+    <!-- test scope -->
+    <dependency>
+      <groupId>junit</groupId>
+      <artifactId>junit</artifactId>
+      <version>${junit.version}</version>
+    </dependency>
+    <dependency>
+      <groupId>org.slf4j</groupId>
+      <artifactId>slf4j-api</artifactId>
+    </dependency>
+  </dependencies>
+  <properties>
+    <junit.version>4.13.2</junit.version>
+  </properties>
+</project>
+""")
+        
+        with_lxml = MavenPomParser().parse(file_path)
+        
+        monkeypatch.setattr(maven_pom, "ET", StdET)
+        monkeypatch.setattr(maven_pom, "ITERPARSE_FILTER", {})
+        with_stdlib = MavenPomParser().parse(file_path)
+        
+        assert with_lxml == with_stdlib
+        assert [(dep.name, dep.version) for dep in with_lxml] == [
+            ("com.example:parent", "1.0"),
+            ("junit:junit", "4.13.2"),
+            ("org.slf4j:slf4j-api", None),
+        ]
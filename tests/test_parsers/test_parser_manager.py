@@ -8,6 +8,11 @@ from unittest import mock
 import pytest
 
 from dependency_scanner_tool.exceptions import ParsingError
+from dependency_scanner_tool.parsers import PARSER_TABLE, parser_manager
+from dependency_scanner_tool.parsers.base import DependencyParser, ParserRegistry
+from dependency_scanner_tool.parsers.conda_environment import CondaEnvironmentParser
+from dependency_scanner_tool.parsers.devfile_parser import DevfileParser
+from dependency_scanner_tool.parsers.gradle_build import GradleBuildParser
 from dependency_scanner_tool.parsers.parser_manager import ParserManager
 from dependency_scanner_tool.parsers.requirements_txt import RequirementsTxtParser
 from dependency_scanner_tool.parsers.pyproject_toml import PyprojectTomlParser
@@ -46,6 +51,36 @@ def test_get_parser_for_file():
     assert parser is None
 
 
+def test_get_parser_for_file_returns_managed_instance():
+    """Test that the returned parser is the instance held by the manager."""
+    manager = ParserManager()
+    
+    parser = manager.get_parser_for_file(Path("requirements.txt"))
+    assert parser is manager.parsers["requirements_txt"]
+
+
+def test_get_parser_for_file_late_registration():
+    """Test that parsers registered after construction are still found."""
+    manager = ParserManager()
+    
+    class CargoParser(DependencyParser):
+        supported_extensions = {".lock"}
+        supported_filenames = {"Cargo.lock"}
+        
+        def parse(self, file_path):
+            return []
+    
+    try:
+        ParserRegistry.register("cargo_test", CargoParser)
+        
+        parser = manager.get_parser_for_file(Path("Cargo.lock"))
+        assert isinstance(parser, CargoParser)
+        assert manager.get_parser_for_file(Path("other.lock")) is parser
+    finally:
+        ParserRegistry._parsers.pop("cargo_test", None)
+        ParserRegistry._build_dispatch_tables()
+
+
 def test_parse_file():
     """Test parsing a single file."""
     manager = ParserManager()
@@ -120,6 +155,50 @@ flask>=2.0.0
         os.unlink(unsupported_path)
 
 
+def test_parser_table_is_registered_in_order():
+    """Test that the built-in parser table is registered in its priority order."""
+    registered = list(ParserRegistry.get_all_parsers().items())
+    
+    assert registered[:len(PARSER_TABLE)] == list(PARSER_TABLE.items())
+    assert ParserRegistry.find_parser_for_file(Path("devfile.yaml")) is DevfileParser
+
+
+def test_find_parser_for_file_dispatch():
+    """Test that table dispatch keeps registration order and custom can_parse checks."""
+    assert ParserRegistry.find_parser_for_file(Path("environment.yml")) is CondaEnvironmentParser
+    assert ParserRegistry.find_parser_for_file(Path("build.gradle.kts")) is GradleBuildParser
+    assert ParserRegistry.find_parser_for_file(Path("REQUIREMENTS.TXT")) is RequirementsTxtParser
+    assert ParserRegistry.find_parser_for_file(Path("src/module.py")) is None
+    
+    # Parsers with their own can_parse compete with the tables in registration
+    # order, exactly like asking every parser in turn
+    for name in ["devfile.yaml", "my-devpod.yml", ".devcontainer/devfile.yml", "config.yaml"]:
+        file_path = Path(name)
+        expected = next(
+            (cls for cls in ParserRegistry.get_all_parsers().values() if cls.can_parse(file_path)),
+            None
+        )
+        assert ParserRegistry.find_parser_for_file(file_path) is expected
+    assert DevfileParser in [cls for _, cls in ParserRegistry._custom_parsers]
+    
+    class CargoParser(DependencyParser):
+        supported_extensions = {".lock"}
+        supported_filenames = {"Cargo.toml"}
+        
+        def parse(self, file_path):
+            return []
+    
+    try:
+        ParserRegistry.register("cargo_test", CargoParser)
+        
+        assert ParserRegistry.find_parser_for_file(Path("Cargo.lock")) is CargoParser
+        # A file name claimed by a later parser loses to an earlier extension match
+        assert ParserRegistry.find_parser_for_file(Path("Cargo.toml")) is PyprojectTomlParser
+    finally:
+        ParserRegistry._parsers.pop("cargo_test", None)
+        ParserRegistry._build_dispatch_tables()
+
+
 def test_get_supported_extensions_and_filenames():
     """Test getting supported extensions and filenames."""
     manager = ParserManager()
@@ -223,3 +302,40 @@ def test_extract_venv_dependencies_error():
     
     # Verify that the error message contains the original exception message
     assert "Test error" in str(excinfo.value)
+
+
+def test_parse_files_uses_thread_pool_from_threshold(tmp_path):
+    """Test that batches of PARALLEL_THRESHOLD or more files are parsed on a thread pool."""
+    manager = ParserManager()
+    
+    # One service per file type, plus a broken POM that maps to no dependencies
+    (tmp_path / "api").mkdir()
+    (tmp_path / "api" / "requirements.txt").write_text("flask==2.0.1\n")
+    (tmp_path / "worker").mkdir()
+    (tmp_path / "worker" / "build.gradle").write_text("dependencies {\n    implementation 'com.google.guava:guava:31.1-jre'\n}\n")
+    (tmp_path / "legacy").mkdir()
+    (tmp_path / "legacy" / "pom.xml").write_text("<project><dependencies>")
+    (tmp_path / "jobs").mkdir()
+    (tmp_path / "jobs" / "requirements.txt").write_text("celery>=5\n")
+    file_paths = [
+        tmp_path / "api" / "requirements.txt",
+        tmp_path / "worker" / "build.gradle",
+        tmp_path / "legacy" / "pom.xml",
+        tmp_path / "jobs" / "requirements.txt",
+    ]
+    assert len(file_paths) == parser_manager.PARALLEL_THRESHOLD
+    
+    with mock.patch.object(
+        parser_manager, "ThreadPoolExecutor", wraps=parser_manager.ThreadPoolExecutor
+    ) as pool:
+        threaded = manager.parse_files(file_paths)
+        pool.assert_called_once_with(max_workers=len(file_paths))
+        
+        # Smaller batches and parallel=False stay on the calling thread
+        assert manager.parse_files(file_paths[:-1]) == {path: threaded[path] for path in file_paths[:-1]}
+        assert manager.parse_files(file_paths, parallel=False) == threaded
+        pool.assert_called_once()
+    
+    assert list(threaded) == file_paths
+    assert [dep.name for dep in threaded[file_paths[1]]] == ["com.google.guava:guava"]
+    assert threaded[file_paths[2]] == []
@@ -2,7 +2,9 @@
 
 import json
 import subprocess
+import sys
 from pathlib import Path
+from importlib import metadata
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -11,6 +13,8 @@ from dependency_scanner_tool.parsers.pip_dependencies import PipDependencyParser
 from dependency_scanner_tool.scanner import DependencyType
 from dependency_scanner_tool.exceptions import ParsingError
 
+DISTRIBUTIONS = "dependency_scanner_tool.parsers.pip_dependencies.distributions"
+
 
 class TestPipDependencyParser:
     """Tests for the PipDependencyParser class."""
@@ -24,16 +28,33 @@ class TestPipDependencyParser:
         assert not parser.can_parse(Path("pyproject.toml"))
         assert not parser.can_parse(Path("setup.py"))
     
+    def test_parse_reads_installed_metadata(self):
+        """Test that installed packages are read in-process without running pip."""
+        parser = PipDependencyParser()
+        
+        with patch("subprocess.run") as mock_run:
+            dependencies = parser.parse(Path("."))
+        
+        mock_run.assert_not_called()
+        versions = {dep.name.lower(): dep.version for dep in dependencies}
+        assert versions["pytest"] == metadata.version("pytest")
+        assert all(dep.source_file == "pip_database" for dep in dependencies)
+        
+        # Sorted by normalized name, like pip list
+        keys = [dep.name.lower().replace("_", "-") for dep in dependencies]
+        assert keys == sorted(keys)
+    
+    @patch(DISTRIBUTIONS, side_effect=OSError("unreadable metadata"))
     @patch("subprocess.run")
-    def test_parse_basic(self, mock_run):
-        """Test parsing basic pip dependencies."""
+    def test_parse_basic(self, mock_run, mock_distributions):
+        """Test parsing basic pip dependencies through the pip list fallback."""
         # Mock the subprocess.run call to return a known JSON output
         mock_process = MagicMock()
         mock_process.stdout = json.dumps([
             {"name": "pytest", "version": "7.0.0"},
             {"name": "requests", "version": "2.28.1"},
             {"name": "black", "version": "22.6.0"}
-        ])
+        ]).encode("utf-8")
         mock_process.returncode = 0
         mock_run.return_value = mock_process
         
@@ -59,38 +80,33 @@ class TestPipDependencyParser:
         
         # Verify subprocess.run was called correctly
         mock_run.assert_called_once_with(
-            ["pip", "list", "--format=json"],
+            [sys.executable, "-m", "pip", "list", "--format=json"],
             capture_output=True,
-            text=True,
             check=True
         )
     
+    @patch(DISTRIBUTIONS, return_value=[])
     @patch("subprocess.run")
-    def test_parse_empty(self, mock_run):
+    def test_parse_empty(self, mock_run, mock_distributions):
         """Test parsing when no dependencies are found."""
-        # Mock the subprocess.run call to return an empty list
-        mock_process = MagicMock()
-        mock_process.stdout = json.dumps([])
-        mock_process.returncode = 0
-        mock_run.return_value = mock_process
-        
         parser = PipDependencyParser()
         dependencies = parser.parse(Path("."))
         
         # Verify no dependencies were extracted
         assert len(dependencies) == 0
         
-        # Verify subprocess.run was called correctly
-        mock_run.assert_called_once()
+        # An empty environment is a valid answer, so pip is not asked
+        mock_run.assert_not_called()
     
+    @patch(DISTRIBUTIONS, side_effect=OSError("unreadable metadata"))
     @patch("subprocess.run")
-    def test_parse_error(self, mock_run):
+    def test_parse_error(self, mock_run, mock_distributions):
         """Test handling of errors during parsing."""
         # Mock the subprocess.run call to raise an exception
         mock_run.side_effect = subprocess.CalledProcessError(
             returncode=1,
             cmd=["pip", "list", "--format=json"],
-            stderr="Error: pip command failed"
+            stderr=b"Error: pip command failed"
         )
         
         parser = PipDependencyParser()
@@ -146,3 +162,45 @@ class TestPipDependencyParser:
         # Verify that the parser raises a ParsingError when pip is not found
         with pytest.raises(ParsingError):
             parser.parse_venv(venv_path)
+    
+    @patch("subprocess.run")
+    def test_parse_venv_reads_site_packages(self, mock_run, tmp_path):
+        """Test that a venv's packages are read from its site-packages without pip."""
+        site_packages = tmp_path / "lib" / "python3.11" / "site-packages"
+        for name, version in [("Flask", "2.0.1"), ("django", "4.0.0"), ("zope.interface", "6.0")]:
+            dist_info = site_packages / f"{name}-{version}.dist-info"
+            dist_info.mkdir(parents=True)
+            (dist_info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n")
+        (tmp_path / "pyvenv.cfg").write_text("home = /usr/bin\ninclude-system-site-packages = false\n")
+        
+        parser = PipDependencyParser()
+        dependencies = parser.parse_venv(tmp_path)
+        
+        mock_run.assert_not_called()
+        assert [(dep.name, dep.version) for dep in dependencies] == [
+            ("django", "4.0.0"),
+            ("Flask", "2.0.1"),
+            ("zope.interface", "6.0"),
+        ]
+        assert dependencies[0].source_file == f"venv:{tmp_path}"
+    
+    @patch("subprocess.run")
+    def test_parse_venv_with_system_site_packages_uses_pip(self, mock_run, tmp_path):
+        """Test that venvs that also see the system packages are still listed by pip."""
+        (tmp_path / "lib" / "python3.11" / "site-packages").mkdir(parents=True)
+        (tmp_path / "bin").mkdir()
+        (tmp_path / "bin" / "pip").write_text("")
+        (tmp_path / "pyvenv.cfg").write_text("include-system-site-packages = true\n")
+        mock_process = MagicMock()
+        mock_process.stdout = json.dumps([{"name": "numpy", "version": "1.26.0"}]).encode("utf-8")
+        mock_run.return_value = mock_process
+        
+        parser = PipDependencyParser()
+        dependencies = parser.parse_venv(tmp_path)
+        
+        assert [(dep.name, dep.version) for dep in dependencies] == [("numpy", "1.26.0")]
+        mock_run.assert_called_once_with(
+            [str(tmp_path / "bin" / "pip"), "list", "--format=json"],
+            capture_output=True,
+            check=True
+        )
@@ -0,0 +1,191 @@
+"""Tests for the persistent per-file result cache."""
+
+import os
+from unittest import mock
+
+from dependency_scanner_tool.analyzers.analyzer_manager import AnalyzerManager
+from dependency_scanner_tool.analyzers.python_analyzer import PythonImportAnalyzer
+from dependency_scanner_tool.parsers.parser_manager import ParserManager
+from dependency_scanner_tool.result_cache import CACHE_ENV_VAR, DigestCache, ResultCache
+from dependency_scanner_tool.scanner import Dependency
+
+
+def test_from_environment_disabled_by_default(monkeypatch):
+    """Test that the cache is only enabled through the environment."""
+    monkeypatch.delenv(CACHE_ENV_VAR, raising=False)
+    assert ResultCache.from_environment("test.db") is None
+    
+    monkeypatch.setenv(CACHE_ENV_VAR, "1")
+    assert isinstance(ResultCache.from_environment("test.db"), ResultCache)
+
+
+def test_put_and_get_round_trip(tmp_path):
+    """Test storing and retrieving a result."""
+    source = tmp_path / "app.py"
+    source.write_text("import requests\n")
+    
+    cache = ResultCache(tmp_path / "cache" / "results.db")
+    key = cache.key_for(source)
+    assert cache.get(key) is None
+    
+    cache.put(key, [Dependency(name="requests", source_file=str(source))])
+    cache.close()
+    
+    # A fresh instance reads the persisted entry
+    reopened = ResultCache(tmp_path / "cache" / "results.db")
+    assert reopened.get(key) == [Dependency(name="requests", source_file=str(source))]
+    reopened.close()
+
+
+def test_key_changes_when_file_changes(tmp_path):
+    """Test that modifying a file produces a different key."""
+    source = tmp_path / "app.py"
+    source.write_text("import requests\n")
+    cache = ResultCache(tmp_path / "cache" / "results.db")
+    original_key = cache.key_for(source)
+    
+    source.write_text("import requests\nimport numpy\n")
+    os.utime(source, ns=(0, 0))
+    
+    assert cache.key_for(source) != original_key
+    assert cache.key_for(tmp_path / "missing.py") is None
+
+
+def test_entries_are_replaced_and_versioned(tmp_path):
+    """Test that an edit replaces the entry and another version misses it."""
+    source = tmp_path / "app.py"
+    source.write_text("import requests\n")
+    cache = ResultCache(tmp_path / "cache" / "results.db", "1")
+    old_key = cache.key_for(source)
+    cache.put(old_key, ["old"])
+    
+    source.write_text("import requests\nimport numpy\n")
+    os.utime(source, ns=(0, 0))
+    new_key = cache.key_for(source)
+    cache.put(new_key, ["new"])
+    
+    assert cache.get(old_key) is None
+    assert cache.get(new_key) == ["new"]
+    assert len(cache._open()) == 1
+    cache.close()
+    
+    # Results from other code versions are never served
+    upgraded = ResultCache(tmp_path / "cache" / "results.db", "2")
+    assert upgraded.get(upgraded.key_for(source)) is None
+    upgraded.close()
+
+
+def test_database_is_used_by_one_process_at_a_time(tmp_path):
+    """Test that a second cache on the same database runs without it."""
+    source = tmp_path / "app.py"
+    source.write_text("import requests\n")
+    owner = ResultCache(tmp_path / "cache" / "results.db")
+    owner.put(owner.key_for(source), ["requests"])
+    
+    other = ResultCache(tmp_path / "cache" / "results.db")
+    other.put(other.key_for(source), ["other"])
+    assert other.get(other.key_for(source)) is None
+    owner.close()
+    
+    reopened = ResultCache(tmp_path / "cache" / "results.db")
+    assert reopened.get(reopened.key_for(source)) == ["requests"]
+    reopened.close()
+
+
+def test_analyzer_manager_serves_unchanged_files_from_cache(tmp_path, monkeypatch):
+    """Test that a second analysis of an unchanged file skips the analyzer."""
+    monkeypatch.setenv(CACHE_ENV_VAR, "1")
+    source = tmp_path / "app.py"
+    source.write_text("import requests\n")
+    
+    with mock.patch(
+        "dependency_scanner_tool.result_cache.DEFAULT_CACHE_DIR", tmp_path / "cache"
+    ):
+        manager = AnalyzerManager()
+    
+    first = manager.analyze_files([source], parallel=False)
+    
+    analyzer = manager.get_analyzer_for_file(source)
+    with mock.patch.object(analyzer, "analyze", side_effect=AssertionError("not cached")):
+        second = manager.analyze_files([source], parallel=False)
+    
+    assert first == second
+    assert [dep.name for dep in second[source]] == ["requests"]
+    manager.cache.close()
+
+
+def test_parser_manager_serves_unchanged_files_from_cache(tmp_path, monkeypatch):
+    """Test that unchanged dependency files are not parsed again."""
+    monkeypatch.setenv(CACHE_ENV_VAR, "1")
+    file_paths = []
+    for i in range(5):
+        requirements = tmp_path / f"service_{i}" / "requirements.txt"
+        requirements.parent.mkdir()
+        requirements.write_text(f"requests==2.{i}.0\n")
+        file_paths.append(requirements)
+    
+    with mock.patch(
+        "dependency_scanner_tool.result_cache.DEFAULT_CACHE_DIR", tmp_path / "cache"
+    ):
+        manager = ParserManager()
+    
+    first = manager.parse_files(file_paths)
+    
+    parser = manager.get_parser_for_file(file_paths[0])
+    with mock.patch.object(parser, "parse", side_effect=AssertionError("not cached")):
+        second = manager.parse_files(file_paths)
+        assert manager.parse_file(file_paths[0]) == first[file_paths[0]]
+    
+    assert first == second
+    assert [dep.version for dep in second[file_paths[4]]] == ["==2.4.0"]
+    
+    # An edited file is parsed again
+    file_paths[0].write_text("requests==3.0.0\nflask\n")
+    assert [dep.name for dep in manager.parse_file(file_paths[0])] == ["requests", "flask"]
+    manager.cache.close()
+    
+    # Results cached by an older parser version are parsed again
+    with mock.patch(
+        "dependency_scanner_tool.result_cache.DEFAULT_CACHE_DIR", tmp_path / "cache"
+    ), mock.patch.object(ParserManager, "CACHE_VERSION", ParserManager.CACHE_VERSION + 1):
+        upgraded = ParserManager()
+    
+    parser = upgraded.get_parser_for_file(file_paths[1])
+    with mock.patch.object(parser, "parse", return_value=[]) as parse:
+        assert upgraded.parse_file(file_paths[1]) == []
+    parse.assert_called_once_with(file_paths[1])
+    upgraded.cache.close()
+
+
+def test_digest_cache_round_trip(tmp_path):
+    """Test storing and retrieving a result by digest."""
+    cache = DigestCache(tmp_path / "imports")
+    digest = "ab" + "0" * 62
+    
+    assert cache.get(digest) is None
+    cache.put(digest, {"requests", "numpy"})
+    
+    assert DigestCache(tmp_path / "imports").get(digest) == {"requests", "numpy"}
+    assert (tmp_path / "imports" / "ab" / ("0" * 62 + ".pkl")).is_file()
+
+
+def test_python_analyzer_reuses_cached_imports(tmp_path, monkeypatch):
+    """Test that identical source is not parsed again, even at a different path."""
+    monkeypatch.setenv(CACHE_ENV_VAR, "1")
+    first = tmp_path / "first.py"
+    second = tmp_path / "second.py"
+    first.write_text("import requests\n")
+    second.write_text("import requests\n")
+    
+    with mock.patch(
+        "dependency_scanner_tool.result_cache.DEFAULT_CACHE_DIR", tmp_path / "cache"
+    ):
+        analyzer = PythonImportAnalyzer()
+    
+    assert [dep.name for dep in analyzer.analyze(first)] == ["requests"]
+    
+    with mock.patch.object(analyzer, "_extract_imports_from_ast", side_effect=AssertionError("not cached")):
+        dependencies = analyzer.analyze(second)
+    
+    assert [dep.name for dep in dependencies] == ["requests"]
+    assert dependencies[0].source_file == str(second)
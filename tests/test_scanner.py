@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from dependency_scanner_tool.scanner import scan_directory, _should_ignore
+from dependency_scanner_tool.scanner import DependencyScanner, ScanEntry, scan_directory, _should_ignore
 
 
 def test_scan_directory_basic():
@@ -45,6 +45,23 @@ def test_scan_directory_with_ignore():
         assert not any('ignore.txt' in str(f) for f in files)
 
 
+def test_scan_directory_as_entries(tmp_path):
+    """Test that entry scanning yields the same files as Path scanning."""
+    (tmp_path / 'Module.PY').touch()
+    (tmp_path / '.bashrc').touch()
+    (tmp_path / 'archive.tar.gz').touch()
+    (tmp_path / 'skip.log').touch()
+    
+    paths = sorted(scan_directory(str(tmp_path), ignore_patterns=['*.log']))
+    entries = sorted(scan_directory(str(tmp_path), ignore_patterns=['*.log'], as_entries=True))
+    
+    assert [Path(entry.path) for entry in entries] == paths
+    assert [(entry.name, entry.suffix) for entry in entries] == [
+        ('.bashrc', ''), ('Module.PY', '.py'), ('archive.tar.gz', '.gz')
+    ]
+    assert all(isinstance(entry, ScanEntry) for entry in entries)
+
+
 def test_should_ignore():
     """Test the _should_ignore helper function."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -69,6 +86,29 @@ def test_should_ignore():
         assert _should_ignore(test_file, root, ['other.txt']) is False
 
 
+def test_should_ignore_multiple_patterns():
+    """Test _should_ignore with several patterns and nested parent directories."""
+    root = Path('/project')
+    patterns = ['*.pyc', 'node_modules', 'build/', '*_cache']
+    
+    # Any pattern may match the file name
+    assert _should_ignore(root / 'src' / 'module.pyc', root, patterns) is True
+    
+    # Any parent directory name may match
+    assert _should_ignore(root / 'web' / 'node_modules' / 'lib' / 'index.js', root, patterns) is True
+    assert _should_ignore(root / 'pkg' / '.mypy_cache' / 'meta.json', root, patterns) is True
+    
+    # Directory patterns match parent directories
+    assert _should_ignore(root / 'build' / 'out.txt', root, patterns) is True
+    
+    # No pattern matches
+    assert _should_ignore(root / 'src' / 'module.py', root, patterns) is False
+    
+    # Paths outside the root are rejected
+    with pytest.raises(ValueError):
+        _should_ignore(Path('/elsewhere/file.py'), root, patterns)
+
+
 def test_empty_directory():
     """Test scanning an empty directory."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -118,4 +158,86 @@ def test_permission_denied_file(tmp_path):
         assert len(files) == 0
     finally:
         # Clean up by restoring permissions
-        test_file.chmod(0o644)
\ No newline at end of file
+        test_file.chmod(0o644)
+
+
+def test_scan_project_parallel_import_analysis(tmp_path, monkeypatch):
+    """Test that pooled import analysis finds the same dependencies as sequential."""
+    from dependency_scanner_tool.analyzers import analyzer_manager
+    
+    # Send even a small project through the process pool
+    monkeypatch.setattr(analyzer_manager, "PARALLEL_THRESHOLD", 2)
+    pooled = []
+    real_iter_parallel = analyzer_manager.AnalyzerManager._iter_analyze_files_parallel
+    
+    def spy_iter_parallel(self, file_paths, errors):
+        pooled.extend(file_paths)
+        return real_iter_parallel(self, file_paths, errors)
+    
+    monkeypatch.setattr(analyzer_manager.AnalyzerManager, "_iter_analyze_files_parallel", spy_iter_parallel)
+    
+    for i in range(3):
+        (tmp_path / f"module_{i}.py").write_text(f"import requests\nimport package_{i}\n")
+    
+    sequential = DependencyScanner(parallel=False).scan_project(
+        str(tmp_path), analyze_api_calls=False
+    )
+    parallel = DependencyScanner(parallel=True).scan_project(
+        str(tmp_path), analyze_api_calls=False
+    )
+    
+    sequential_names = sorted(dep.name for dep in sequential.dependencies)
+    assert sorted(dep.name for dep in parallel.dependencies) == sequential_names
+    assert "package_2" in sequential_names
+    assert parallel.errors == sequential.errors
+    assert len(pooled) == 3
+
+
+def test_scan_project_uses_analyzers_that_override_can_analyze(tmp_path):
+    """Test that files matched by an analyzer's own can_analyze reach import analysis."""
+    from dependency_scanner_tool.analyzers.base import ImportAnalyzer, ImportAnalyzerRegistry, _find_analyzer_by_suffix
+    from dependency_scanner_tool.scanner import Dependency
+    
+    class BazelImportAnalyzer(ImportAnalyzer):
+        @classmethod
+        def can_analyze(cls, file_path):
+            return file_path.name == "BUILD"
+        
+        def analyze(self, file_path):
+            return [Dependency(name="rules_python", source_file=str(file_path))]
+    
+    (tmp_path / "BUILD").write_text("load('@rules_python//python:defs.bzl', 'py_library')\n")
+    (tmp_path / "notes.txt").write_text("not a source file\n")
+    
+    try:
+        ImportAnalyzerRegistry.register("bazel_test", BazelImportAnalyzer)
+        result = DependencyScanner().scan_project(str(tmp_path), analyze_api_calls=False)
+    finally:
+        ImportAnalyzerRegistry._analyzers.pop("bazel_test", None)
+        _find_analyzer_by_suffix.cache_clear()
+    
+    assert [dep.name for dep in result.dependencies] == ["rules_python"]
+    assert result.errors == []
+
+
+def test_scan_project_walks_project_once(tmp_path, monkeypatch):
+    """Test that one directory walk supplies languages, dependency files and source files."""
+    from dependency_scanner_tool import file_utils
+    
+    (tmp_path / "app.py").write_text("import requests\n")
+    (tmp_path / "requirements.txt").write_text("flask==2.0.0\n")
+    
+    walks = []
+    real_scan_directory = file_utils.scan_directory
+    
+    def counting_scan_directory(*args, **kwargs):
+        walks.append(args[0])
+        return real_scan_directory(*args, **kwargs)
+    
+    monkeypatch.setattr(file_utils, "scan_directory", counting_scan_directory)
+    result = DependencyScanner().scan_project(str(tmp_path), analyze_api_calls=False)
+    
+    assert walks == [str(tmp_path)]
+    assert result.languages == {"Python": 100.0}
+    assert result.dependency_files == [tmp_path / "requirements.txt"]
+    assert {dep.name for dep in result.dependencies} == {"flask", "requests"}